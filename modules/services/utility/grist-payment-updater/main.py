@@ -7,11 +7,20 @@ Advances dates to future if they're in the past.
 """
 
 import os
+import re
+import json
 import sys
+import time
+import random
+import calendar
 import logging
-from datetime import datetime, timedelta
+import importlib.util
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
 from dateutil.relativedelta import relativedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import httpx
 from dotenv import load_dotenv
 
@@ -23,9 +32,281 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Columns the updater reads; everything else in the table is never fetched
+FETCH_COLUMNS = ("Expense", "Next_Payment", "Recurrence")
+
+
+@dataclass(frozen=True)
+class Recurrence:
+    """A parsed recurrence: every `step` days or months."""
+    unit: str  # 'days' or 'months'
+    step: int
+    end_of_month: bool = False  # Always land on the last day of the month
+
+
+# Fixed recurrence names, matched case-insensitively
+RECURRENCE_NAMES = {
+    'daily': Recurrence('days', 1),
+    'weekly': Recurrence('days', 7),
+    'two weeks': Recurrence('days', 14),
+    'biweekly': Recurrence('days', 14),
+    'fortnightly': Recurrence('days', 14),
+    'monthly': Recurrence('months', 1),
+    'end of month': Recurrence('months', 1, end_of_month=True),
+    'end-of-month': Recurrence('months', 1, end_of_month=True),
+    'monthly (end of month)': Recurrence('months', 1, end_of_month=True),
+    'quarterly': Recurrence('months', 3),
+    'yearly': Recurrence('months', 12),
+    'annually': Recurrence('months', 12),
+}
+
+# "Every 10 days", "every 3 weeks", "every 2 months", "every 2 years"
+EVERY_N_PATTERN = re.compile(r'every\s+(\d+)\s+(day|week|month|year)s?')
+EVERY_N_UNITS = {'day': ('days', 1), 'week': ('days', 7), 'month': ('months', 1), 'year': ('months', 12)}
+
+
+@lru_cache(maxsize=None)
+def parse_recurrence(text: str) -> Optional[Recurrence]:
+    """Parse a Recurrence cell, or return None if it is not understood."""
+    text = ' '.join(text.lower().split())
+    if text in RECURRENCE_NAMES:
+        return RECURRENCE_NAMES[text]
+    match = EVERY_N_PATTERN.fullmatch(text)
+    if match and int(match.group(1)) > 0:
+        unit, multiplier = EVERY_N_UNITS[match.group(2)]
+        return Recurrence(unit, int(match.group(1)) * multiplier)
+    return None
+
+
+def _month_offset(anchor: date, months: int, end_of_month: bool) -> date:
+    """Shift a date by whole months, clamping or pinning to the month's end."""
+    if end_of_month:
+        year, month = divmod(anchor.month - 1 + months, 12)
+        year += anchor.year
+        return date(year, month + 1, calendar.monthrange(year, month + 1)[1])
+    return anchor + relativedelta(months=months)
+
+
+def next_occurrence(anchor: date, recurrence: Recurrence, today: date) -> date:
+    """First occurrence of `recurrence` counted from `anchor` that is after `today`.
+    
+    Computed directly instead of stepping one period at a time, so a date
+    that is years stale costs the same as one that is a day late. Anchors
+    already after `today` are returned unchanged. Monthly steps are counted
+    from the anchor and clamped to the length of the target month, so an
+    anchor on the 31st lands on the 30th in a 30-day month. Only the stored
+    date is known, so once a clamped date is written back later months
+    count from that day.
+    """
+    if anchor > today:
+        return anchor
+    
+    if recurrence.unit == 'days':
+        periods = (today - anchor).days // recurrence.step + 1
+        return anchor + timedelta(days=periods * recurrence.step)
+    
+    # Whole periods that fit before today's month; one more may be needed
+    # when the candidate lands earlier in today's month
+    months_elapsed = (today.year - anchor.year) * 12 + today.month - anchor.month
+    periods = months_elapsed // recurrence.step
+    candidate = _month_offset(anchor, periods * recurrence.step, recurrence.end_of_month)
+    if candidate <= today:
+        candidate = _month_offset(anchor, (periods + 1) * recurrence.step, recurrence.end_of_month)
+    return candidate
+
+
+def grist_date(timestamp: float) -> date:
+    """Calendar date of a Grist Date cell, stored as seconds at UTC midnight."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).date()
+
+
+def grist_timestamp(day: date) -> int:
+    """Grist Date cell value for a calendar date."""
+    return calendar.timegm(day.timetuple())
+
+
+@dataclass
+class RequestTiming:
+    """One logical Grist API call, including any retries."""
+    method: str
+    path: str
+    status: Optional[int]  # None if every attempt failed to get a response
+    elapsed: float  # Seconds, including backoff between attempts
+    attempts: int
+
+
+class GristClient:
+    """Synchronous Grist API client with keep-alive and retries.
+    
+    One pooled connection is kept alive for the whole run, over HTTP/2 when
+    the h2 package is installed, so the TLS handshake through the proxy is
+    paid once. Connection errors and transient statuses are retried with
+    exponential backoff and jitter, honouring Retry-After.
+    """
+    RETRY_STATUSES = {429, 502, 503, 504}
+    
+    def __init__(self, base_url: str, headers: Dict[str, str], timeout: float = 30.0,
+                 max_retries: int = 3, backoff: float = 0.5):
+        self.base_url = base_url
+        self.headers = headers
+        self.timeout = timeout
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self.timings: List[RequestTiming] = []
+        self._client: Optional[httpx.Client] = None
+    
+    def _client_options(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "headers": self.headers,
+            "timeout": self.timeout,
+            "http2": importlib.util.find_spec("h2") is not None,
+            "limits": httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=30.0),
+        }
+    
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait before the next attempt."""
+        retry_after = response.headers.get("retry-after", "") if response is not None else ""
+        if retry_after.isdigit():
+            return min(float(retry_after), 30.0)
+        return self.backoff * 2 ** attempt + random.uniform(0, self.backoff)
+    
+    def _should_retry(self, attempt: int, response: Optional[httpx.Response] = None,
+                      error: Optional[Exception] = None) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        reason = f"HTTP {response.status_code}" if response is not None else str(error)
+        logger.warning(f"Grist request failed ({reason}), retry {attempt + 1}/{self.max_retries}")
+        return True
+    
+    def _record(self, method: str, path: str, started: float, attempts: int,
+                response: Optional[httpx.Response] = None) -> None:
+        timing = RequestTiming(method, path, response.status_code if response is not None else None,
+                               time.perf_counter() - started, attempts)
+        self.timings.append(timing)
+        logger.debug(f"{method} {path} -> {timing.status} in {timing.elapsed * 1000:.0f}ms ({attempts} attempts)")
+    
+    def summary(self) -> str:
+        """One-line summary of all requests made so far."""
+        if not self.timings:
+            return "Grist API: no requests"
+        total = sum(t.elapsed for t in self.timings)
+        retries = sum(t.attempts - 1 for t in self.timings)
+        slowest = max(self.timings, key=lambda t: t.elapsed)
+        return (f"Grist API: {len(self.timings)} requests in {total * 1000:.0f}ms, "
+                f"{retries} retries, slowest {slowest.method} {slowest.path} {slowest.elapsed * 1000:.0f}ms")
+    
+    @property
+    def client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(**self._client_options())
+        return self._client
+    
+    def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send a request, retrying transient failures.
+        
+        The final response is returned whatever its status; callers decide
+        whether to raise_for_status. Transport errors are raised once the
+        retries are used up.
+        """
+        started = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.client.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                if not self._should_retry(attempt, error=e):
+                    self._record(method, path, started, attempt + 1)
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+            if response.status_code in self.RETRY_STATUSES and self._should_retry(attempt, response):
+                time.sleep(self._retry_delay(attempt, response))
+                continue
+            self._record(method, path, started, attempt + 1, response)
+            return response
+    
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+    
+    def __enter__(self) -> "GristClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def default_cache_dir() -> Path:
+    """Cache directory: systemd's CacheDirectory, else the XDG cache home."""
+    if os.getenv('CACHE_DIRECTORY'):
+        # systemd may list several directories separated by colons
+        return Path(os.environ['CACHE_DIRECTORY'].split(':')[0])
+    xdg_cache = os.getenv('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return Path(xdg_cache) / "grist-payment-updater"
+
+
+class MetadataCache:
+    """Table list and column schema of a Grist document, kept between runs.
+
+    Entries are trusted without asking Grist until they are older than
+    max_age seconds. A failed fetch invalidates the entry, so a renamed or
+    removed table or column is picked up by the next run at the latest.
+    """
+    
+    def __init__(self, path: Optional[Path], max_age: float = 7 * 86400):
+        self.path = path
+        self.max_age = max_age
+    
+    def load(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached metadata of a document, or None."""
+        if self.path is None:
+            return None
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('doc_id') != doc_id:
+            return None
+        return data
+    
+    def is_fresh(self, data: Dict[str, Any]) -> bool:
+        return time.time() - data.get('fetched_at', 0) < self.max_age
+    
+    def save(self, data: Dict[str, Any]) -> None:
+        """Write metadata, ignoring failures: the cache only saves requests."""
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Could not write metadata cache {self.path}: {e}")
+    
+    def invalidate(self) -> None:
+        """Drop the cached metadata so the next lookup asks Grist."""
+        if self.path is None:
+            return
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove metadata cache {self.path}: {e}")
+
 
 class GristPaymentUpdater:
-    def __init__(self, dry_run=True):
+    # Content rejections, worth narrowing down to the offending records
+    BISECT_STATUSES = {400, 422}
+    # Failures no other chunk would get past (retries already ran for 429)
+    ABORT_STATUSES = {401, 403, 404, 429}
+    
+    def __init__(self, dry_run=True, batch_size=100, fetch_mode="sql", max_retries=3,
+                 metadata_cache: Optional[MetadataCache] = None):
         # Read secrets directly from agenix file paths
         try:
             with open(os.getenv('GRIST_API_KEY_FILE'), 'r') as f:
@@ -39,6 +320,11 @@ class GristPaymentUpdater:
         self.doc_id = "iDEabeoAf4nC"
         self.table_name = "Data"
         self.dry_run = dry_run
+        self.batch_size = max(1, batch_size)
+        self.fetch_mode = fetch_mode
+        self.max_retries = max_retries
+        self._client: Optional[GristClient] = None
+        self.metadata_cache = metadata_cache or MetadataCache(None)
         
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -46,151 +332,340 @@ class GristPaymentUpdater:
             "Proxy-Authorization": self.proxy_auth
         }
     
-    def get_tables(self) -> List[str]:
-        """Get list of available tables."""
-        url = f"{self.base_url}/api/docs/{self.doc_id}/tables"
+    @property
+    def client(self) -> GristClient:
+        """Pooled API client shared by every request of the run."""
+        if self._client is None:
+            self._client = GristClient(self.base_url, self.headers, max_retries=self.max_retries)
+        return self._client
+    
+    def close(self) -> None:
+        """Log request timings and close the API client."""
+        if self._client is not None:
+            logger.info(self._client.summary())
+            self._client.close()
+            self._client = None
+    
+    def _get_if_changed(self, path: str, etag: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """GET a JSON resource, conditionally when an ETag is known.
         
-        with httpx.Client() as client:
-            response = client.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-        data = response.json()
-        return [table['id'] for table in data.get('tables', [])]
+        Returns the decoded body and its ETag, or None and the given ETag if
+        the resource is unchanged.
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self.client.request("GET", path, headers=headers)
+        if response.status_code == 304 and etag:
+            return None, etag
+        response.raise_for_status()
+        return response.json(), response.headers.get('etag')
+    
+    def get_tables(self, etag: Optional[str] = None) -> Tuple[Optional[List[str]], Optional[str]]:
+        """Get list of available tables and its ETag, None if unchanged."""
+        data, etag = self._get_if_changed(f"/api/docs/{self.doc_id}/tables", etag)
+        if data is None:
+            return None, etag
+        return [table['id'] for table in data.get('tables', [])], etag
+    
+    def get_columns(self, etag: Optional[str] = None) -> Tuple[Optional[List[str]], Optional[str]]:
+        """Get the column ids of the table and their ETag, None if unchanged."""
+        data, etag = self._get_if_changed(f"/api/docs/{self.doc_id}/tables/{self.table_name}/columns", etag)
+        if data is None:
+            return None, etag
+        return [column['id'] for column in data.get('columns', [])], etag
+    
+    def get_metadata(self) -> Dict[str, Any]:
+        """Table list and column schema, from the local cache when fresh.
+        
+        In the steady state this costs no request at all. Stale entries are
+        revalidated with conditional requests for both the table list and
+        the columns when Grist (or the proxy) sent ETags, and refetched
+        otherwise.
+        """
+        cached = self.metadata_cache.load(self.doc_id)
+        if cached is not None and self.metadata_cache.is_fresh(cached):
+            logger.info("Using cached table metadata")
+            return cached
+        return self.refresh_metadata(cached)
+    
+    def refresh_metadata(self, cached: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Fetch the table list and column schema and update the cache."""
+        cached_columns = cached.get('columns', {}).get(self.table_name) if cached else None
+        etags = cached.get('etags', {}) if cached else {}
+        
+        tables, tables_etag = self.get_tables(etags.get('tables') if cached else None)
+        if tables is None:
+            tables = cached['tables']
+        
+        columns, columns_etag = None, None
+        if self.table_name in tables:
+            columns, columns_etag = self.get_columns(etags.get('columns') if cached_columns is not None else None)
+            if columns is None:
+                columns = cached_columns
+        
+        metadata = {
+            'doc_id': self.doc_id,
+            'etags': {'tables': tables_etag, 'columns': columns_etag},
+            'fetched_at': time.time(),
+            'tables': tables,
+            'columns': {self.table_name: columns} if columns is not None else {},
+        }
+        if cached is not None:
+            if cached.get('tables') != metadata['tables'] or cached.get('columns') != metadata['columns']:
+                logger.warning("Table schema changed since it was cached")
+            else:
+                logger.info("Table metadata unchanged")
+        self.metadata_cache.save(metadata)
+        return metadata
     
     def get_records(self) -> List[Dict[str, Any]]:
         """Fetch all records from the Finances table."""
-        url = f"{self.base_url}/api/docs/{self.doc_id}/tables/{self.table_name}/records"
+        response = self.client.request("GET", f"/api/docs/{self.doc_id}/tables/{self.table_name}/records")
+        response.raise_for_status()
         
-        with httpx.Client() as client:
-            response = client.get(url, headers=self.headers)
-            response.raise_for_status()
-            
         data = response.json()
         return data.get('records', [])
     
-    def calculate_next_payment_date(self, current_date, recurrence: str):
+    def get_due_records(self) -> List[Dict[str, Any]]:
+        """Fetch only the rows that may need a new payment date.
+        
+        Grist's /records filter only supports equality, so this uses the SQL
+        endpoint to select the needed columns of rows whose Next_Payment is
+        today or earlier. Rows missing a date or recurrence, or holding a
+        date Grist could not parse (stored as text), are included too so
+        they are still reported.
+        """
+        # Same cutoff as calculate_next_payment_date: any date up to today
+        tomorrow = grist_timestamp(datetime.now().date() + timedelta(days=1))
+        columns = ", ".join(f'"{column}"' for column in FETCH_COLUMNS)
+        payload = {
+            "sql": (
+                f'SELECT id, {columns} FROM "{self.table_name}" '
+                'WHERE "Next_Payment" IS NULL OR "Recurrence" IS NULL OR "Recurrence" = \'\' '
+                'OR typeof("Next_Payment") = \'text\' OR "Next_Payment" < ?'
+            ),
+            "args": [tomorrow],
+        }
+        
+        response = self.client.request("POST", f"/api/docs/{self.doc_id}/sql", json=payload)
+        response.raise_for_status()
+        
+        # SQL rows carry the id among their fields; reshape like /records
+        records = []
+        for row in response.json().get('records', []):
+            fields = dict(row['fields'])
+            records.append({'id': fields.pop('id'), 'fields': fields})
+        return records
+    
+    def fetch_records(self) -> List[Dict[str, Any]]:
+        """Fetch candidate records using the configured fetch mode.
+        
+        Falls back to downloading the whole table if the SQL endpoint is
+        unavailable, e.g. on an older Grist or when the proxy rejects it.
+        """
+        if self.fetch_mode == "sql":
+            try:
+                records = self.get_due_records()
+                logger.info(f"Fetched {len(records)} due records via SQL")
+                return records
+            except httpx.HTTPError as e:
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 400:
+                    # Likely a renamed or removed column; recheck the schema next run
+                    self.metadata_cache.invalidate()
+                logger.warning(f"SQL fetch failed, falling back to full table fetch: {e}")
+        
+        records = self.get_records()
+        logger.info(f"Fetched all {len(records)} records")
+        return records
+    
+    def calculate_next_payment_date(self, current_date, recurrence: str, today: Optional[date] = None):
         """Calculate the next payment date based on recurrence."""
         try:
             # Parse current date - handle both string and timestamp formats
             if isinstance(current_date, (int, float)):
-                # Unix timestamp (seconds since epoch)
-                date = datetime.fromtimestamp(current_date)
+                # Unix timestamp at UTC midnight, whatever the host's timezone
+                anchor = grist_date(current_date)
             elif isinstance(current_date, str):
                 # String format
-                date = datetime.strptime(current_date, '%Y-%m-%d')
+                anchor = datetime.strptime(current_date, '%Y-%m-%d').date()
             else:
                 logger.warning(f"Unknown date format: {current_date}")
                 return current_date
-                
-            today = datetime.now().date()
-            
-            # Keep advancing until date is in the future
-            while date.date() <= today:
-                if recurrence.lower() == 'yearly':
-                    date += relativedelta(years=1)
-                elif recurrence.lower() == 'monthly':
-                    date += relativedelta(months=1)
-                elif recurrence.lower() in ['two weeks', 'biweekly']:
-                    date += timedelta(weeks=2)
-                else:
-                    logger.warning(f"Unknown recurrence type: {recurrence}")
-                    return current_date
+            
+            parsed = parse_recurrence(recurrence)
+            if parsed is None:
+                logger.warning(f"Unknown recurrence type: {recurrence}")
+                return current_date
+            
+            next_date = next_occurrence(anchor, parsed, today or datetime.now().date())
             
             # Return as timestamp if input was timestamp, string if input was string
             if isinstance(current_date, (int, float)):
-                return int(date.timestamp())
+                return grist_timestamp(next_date)
             else:
-                return date.strftime('%Y-%m-%d')
+                return next_date.strftime('%Y-%m-%d')
             
         except Exception as e:
             logger.error(f"Error calculating next payment date: {e}")
             return current_date
     
+    def plan_updates(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Compute new payment dates for a batch of records in one pass.
+        
+        Today's date is taken once for the whole batch and each distinct
+        recurrence text is parsed once, so unknown recurrences are also
+        reported once rather than per row.
+        """
+        today = datetime.now().date()
+        unknown = set()
+        potential_updates = []
+        
+        for record in records:
+            record_id = record['id']
+            fields = record['fields']
+            
+            # Get current values
+            current_payment_date = fields.get('Next_Payment')
+            recurrence = fields.get('Recurrence')
+            expense_name = fields.get('Expense', 'Unknown')
+            
+            if not current_payment_date or not recurrence:
+                logger.warning(f"Record {record_id} ({expense_name}) missing payment date or recurrence")
+                continue
+            
+            if parse_recurrence(recurrence) is None:
+                unknown.add(recurrence)
+                continue
+            
+            # Calculate new date
+            new_date = self.calculate_next_payment_date(current_payment_date, recurrence, today)
+            
+            # Check if date would change
+            if new_date != current_payment_date:
+                # Convert timestamp to readable format for logging
+                if isinstance(current_payment_date, (int, float)):
+                    current_readable = grist_date(current_payment_date).isoformat()
+                else:
+                    current_readable = current_payment_date
+                    
+                if isinstance(new_date, (int, float)):
+                    new_readable = grist_date(new_date).isoformat()
+                else:
+                    new_readable = new_date
+                
+                potential_updates.append({
+                    'id': record_id,
+                    'current': current_payment_date,
+                    'new': new_date,
+                    'current_readable': current_readable,
+                    'new_readable': new_readable,
+                    'recurrence': recurrence,
+                    'expense_name': expense_name
+                })
+        
+        for recurrence in sorted(unknown):
+            logger.warning(f"Unknown recurrence type: {recurrence}")
+        return potential_updates
+    
     def update_record(self, record_id: int, new_date) -> bool:
         """Update a single record with new payment date."""
+        failures = self.update_records([{'id': record_id, 'new': new_date}])
+        return record_id not in failures
+    
+    def update_records(self, updates: List[Dict[str, Any]]) -> Dict[int, str]:
+        """Update payment dates in chunked PATCH requests over one client.
+        
+        Grist applies each PATCH atomically, so a chunk whose contents are
+        rejected (400/422) is split in half and retried until the offending
+        records are isolated. Transport errors and other statuses fail the
+        whole chunk without splitting. Authentication, missing-table and
+        rate-limit responses would fail every later chunk the same way, so
+        they stop the run's updates altogether.
+        
+        Returns a mapping of failed record ids to their error message.
+        """
         if self.dry_run:
-            logger.info(f"DRY RUN: Would update record {record_id} with new date: {new_date}")
-            return True
-            
-        url = f"{self.base_url}/api/docs/{self.doc_id}/tables/{self.table_name}/records"
+            for update in updates:
+                logger.info(f"DRY RUN: Would update record {update['id']} with new date: {update['new']}")
+            return {}
         
-        payload = {
-            "records": [
-                {
-                    "id": record_id,
-                    "fields": {
-                        "Next_Payment": new_date
-                    }
-                }
-            ]
-        }
+        records = [
+            {"id": update['id'], "fields": {"Next_Payment": update['new']}}
+            for update in updates
+        ]
+        chunks = [
+            records[i:i + self.batch_size]
+            for i in range(0, len(records), self.batch_size)
+        ]
+        
+        failures = {}
+        for position, chunk in enumerate(chunks):
+            try:
+                failures.update(self._patch_chunk(chunk))
+            except httpx.HTTPStatusError as e:
+                error = f"HTTP {e.response.status_code}: {e.response.text[:200]}"
+                remaining = [record['id'] for pending in chunks[position:] for record in pending]
+                logger.error(f"Stopping updates, {len(remaining)} records not sent: {error}")
+                failures.update({record_id: error for record_id in remaining})
+                break
         
+        logger.info(f"Sent {len(records)} updates in {len(chunks)} chunks of up to {self.batch_size}")
+        return failures
+    
+    def _patch_chunk(self, chunk: List[Dict[str, Any]]) -> Dict[int, str]:
+        """PATCH one chunk, bisecting it when Grist rejects its contents.
+        
+        Raises httpx.HTTPStatusError for statuses in ABORT_STATUSES.
+        """
+        path = f"/api/docs/{self.doc_id}/tables/{self.table_name}/records"
         try:
-            with httpx.Client() as client:
-                response = client.patch(url, headers=self.headers, json=payload)
-                response.raise_for_status()
-            return True
-        except Exception as e:
-            logger.error(f"Error updating record {record_id}: {e}")
-            return False
+            response = self.client.request("PATCH", path, json={"records": chunk})
+            response.raise_for_status()
+            return {}
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in self.ABORT_STATUSES:
+                raise
+            error = f"HTTP {e.response.status_code}: {e.response.text[:200]}"
+            if e.response.status_code in self.BISECT_STATUSES and len(chunk) > 1:
+                middle = len(chunk) // 2
+                failures = self._patch_chunk(chunk[:middle])
+                failures.update(self._patch_chunk(chunk[middle:]))
+                return failures
+        except httpx.HTTPError as e:
+            error = str(e)
+        
+        for record in chunk:
+            logger.error(f"Error updating record {record['id']}: {error}")
+        return {record['id']: error for record in chunk}
     
     def process_records(self):
         """Main processing function."""
         try:
             logger.info(f"Running in {'DRY RUN' if self.dry_run else 'LIVE'} mode")
             
-            # First, list available tables
-            tables = self.get_tables()
+            # First, check the table and its columns exist
+            metadata = self.get_metadata()
+            tables = metadata['tables']
             logger.info(f"Available tables: {tables}")
             
             if self.table_name not in tables:
+                self.metadata_cache.invalidate()
                 logger.error(f"Table '{self.table_name}' not found. Available: {tables}")
                 return
+            
+            missing = [column for column in FETCH_COLUMNS if column not in metadata['columns'].get(self.table_name, [])]
+            if missing:
+                self.metadata_cache.invalidate()
+                logger.error(f"Table '{self.table_name}' is missing columns: {missing}")
+                return
                 
-            records = self.get_records()
-            logger.info(f"Found {len(records)} records")
+            try:
+                records = self.fetch_records()
+            except httpx.HTTPError:
+                self.metadata_cache.invalidate()
+                raise
             
             # First pass: analyze what we would change
-            potential_updates = []
-            
-            for record in records:
-                record_id = record['id']
-                fields = record['fields']
-                
-                # Get current values
-                current_payment_date = fields.get('Next_Payment')
-                recurrence = fields.get('Recurrence')
-                expense_name = fields.get('Expense', 'Unknown')
-                
-                if not current_payment_date or not recurrence:
-                    logger.warning(f"Record {record_id} ({expense_name}) missing payment date or recurrence")
-                    continue
-                
-                # Calculate new date
-                new_date = self.calculate_next_payment_date(current_payment_date, recurrence)
-                
-                # Check if date would change
-                if new_date != current_payment_date:
-                    # Convert timestamp to readable format for logging
-                    if isinstance(current_payment_date, (int, float)):
-                        current_readable = datetime.fromtimestamp(current_payment_date).strftime('%Y-%m-%d')
-                    else:
-                        current_readable = current_payment_date
-                        
-                    if isinstance(new_date, (int, float)):
-                        new_readable = datetime.fromtimestamp(new_date).strftime('%Y-%m-%d')
-                    else:
-                        new_readable = new_date
-                    
-                    potential_updates.append({
-                        'id': record_id,
-                        'current': current_payment_date,
-                        'new': new_date,
-                        'current_readable': current_readable,
-                        'new_readable': new_readable,
-                        'recurrence': recurrence,
-                        'expense_name': expense_name
-                    })
+            potential_updates = self.plan_updates(records)
             
             if potential_updates:
                 logger.info(f"Found {len(potential_updates)} records that need updating:")
@@ -200,16 +675,19 @@ class GristPaymentUpdater:
                 logger.info("No records need updating")
             
             # Actually perform updates
-            updated_count = 0
-            for update in potential_updates:
-                if self.update_record(update['id'], update['new']):
-                    updated_count += 1
+            failures = self.update_records(potential_updates) if potential_updates else {}
+            updated_count = len(potential_updates) - len(failures)
             
             logger.info(f"{'Would update' if self.dry_run else 'Updated'} {updated_count} records")
+            if failures:
+                logger.error(f"Failed to update {len(failures)} records: {sorted(failures)}")
+                sys.exit(1)
             
         except Exception as e:
             logger.error(f"Error processing records: {e}")
             sys.exit(1)
+        finally:
+            self.close()
 
 
 def main():
@@ -220,7 +698,13 @@ def main():
         
         # Default to dry run for safety
         dry_run = os.getenv('DRY_RUN', 'true').lower() != 'false'
-        updater = GristPaymentUpdater(dry_run=dry_run)
+        batch_size = int(os.getenv('BATCH_SIZE', '100'))
+        fetch_mode = os.getenv('FETCH_MODE', 'sql').lower()
+        max_retries = int(os.getenv('MAX_RETRIES', '3'))
+        metadata_max_age = float(os.getenv('METADATA_MAX_AGE_HOURS', '168')) * 3600
+        metadata_cache = MetadataCache(default_cache_dir() / "metadata.json", metadata_max_age)
+        updater = GristPaymentUpdater(dry_run=dry_run, batch_size=batch_size, fetch_mode=fetch_mode,
+                                      max_retries=max_retries, metadata_cache=metadata_cache)
         updater.process_records()
         logger.info("Payment date update completed successfully")
     except Exception as e:
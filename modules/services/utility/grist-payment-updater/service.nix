@@ -7,6 +7,7 @@
 }: let
   python = pkgs.python3.withPackages (ps:
     with ps; [
+      h2
       httpx
       python-dateutil
       python-dotenv
@@ -27,6 +28,9 @@ in {
       ExecStart = "${python}/bin/python3 /etc/grist-payment-updater/main.py";
       RuntimeDirectory = "grist-payment-updater";
       RuntimeDirectoryMode = "0700";
+      # Table metadata cache, exposed to the script as CACHE_DIRECTORY
+      CacheDirectory = "grist-payment-updater";
+      CacheDirectoryMode = "0700";
     };
     environment = {
       DRY_RUN = "false";
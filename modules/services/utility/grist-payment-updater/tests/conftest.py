@@ -0,0 +1,29 @@
+"""Make main.py importable from the tests and build updaters on a mock API."""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+@pytest.fixture
+def make_updater(tmp_path, monkeypatch):
+    (tmp_path / "key").write_text("key")
+    (tmp_path / "auth").write_text("Basic x")
+    monkeypatch.setenv('GRIST_API_KEY_FILE', str(tmp_path / "key"))
+    monkeypatch.setenv('GRIST_PROXY_AUTH_FILE', str(tmp_path / "auth"))
+
+    def make(handler, batch_size=4, metadata_cache=None):
+        updater = main.GristPaymentUpdater(dry_run=False, batch_size=batch_size, max_retries=0,
+                                           metadata_cache=metadata_cache)
+        client = main.GristClient(updater.base_url, updater.headers, max_retries=0)
+        client._client = httpx.Client(base_url=updater.base_url, transport=httpx.MockTransport(handler))
+        updater._client = client
+        return updater
+
+    return make
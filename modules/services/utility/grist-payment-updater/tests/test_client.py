@@ -0,0 +1,81 @@
+"""Retries and backoff of GristClient."""
+
+import httpx
+import pytest
+
+import main
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(main.time, "sleep", delays.append)
+    monkeypatch.setattr(main.random, "uniform", lambda a, b: 0.0)
+    return delays
+
+
+def make_client(statuses, max_retries=3, headers=None):
+    """Client whose mock API answers with ``statuses`` in turn."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        return httpx.Response(status, headers=headers or {}, json={})
+
+    client = main.GristClient("https://grist.test/api/docs/doc", {}, max_retries=max_retries, backoff=0.5)
+    client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client, calls
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_transient_status_retried_with_exponential_backoff(sleeps, status):
+    client, calls = make_client([status, status, 200])
+    response = client.request("GET", "/tables")
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert sleeps == [0.5, 1.0]
+    assert client.timings[-1].attempts == 3
+    assert "2 retries" in client.summary()
+
+
+def test_retries_exhausted_returns_last_response(sleeps):
+    client, calls = make_client([503])
+    response = client.request("GET", "/tables")
+    assert response.status_code == 503
+    assert len(calls) == 4
+    assert sleeps == [0.5, 1.0, 2.0]
+
+
+def test_retry_after_is_honoured_and_capped(sleeps):
+    client, _ = make_client([429, 200], headers={"Retry-After": "7"})
+    client.request("GET", "/tables")
+    assert sleeps == [7.0]
+
+    client, _ = make_client([429, 200], headers={"Retry-After": "120"})
+    client.request("GET", "/tables")
+    assert sleeps[-1] == 30.0
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404, 422, 500])
+def test_other_errors_not_retried(sleeps, status):
+    client, calls = make_client([status, 200])
+    assert client.request("PATCH", "/tables/T/records").status_code == status
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_transport_errors_retried_then_raised(sleeps):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("refused", request=request)
+
+    client = main.GristClient("https://grist.test/api/docs/doc", {}, max_retries=2, backoff=0.5)
+    client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    with pytest.raises(httpx.ConnectError):
+        client.request("GET", "/tables")
+    assert len(calls) == 3
+    assert sleeps == [0.5, 1.0]
+    assert client.timings[-1].status is None
@@ -0,0 +1,64 @@
+"""Table and column metadata cache and its revalidation."""
+
+import httpx
+
+import main
+
+
+class _Grist:
+    """Serve /tables and /columns with ETags, answering 304 when unchanged."""
+
+    def __init__(self, columns):
+        self.tables = ['Data', 'Other']
+        self.columns = columns
+        self.requests = []
+
+    def handler(self, request):
+        self.requests.append(request.url.path.rsplit('/', 1)[-1])
+        if request.url.path.endswith('/tables'):
+            body = {'tables': [{'id': table} for table in self.tables]}
+        else:
+            body = {'columns': [{'id': column} for column in self.columns]}
+        etag = f'"{hash(str(body))}"'
+        if request.headers.get('if-none-match') == etag:
+            return httpx.Response(304, headers={'ETag': etag})
+        return httpx.Response(200, json=body, headers={'ETag': etag})
+
+
+def _cache(tmp_path, max_age):
+    return main.MetadataCache(tmp_path / "metadata.json", max_age)
+
+
+def test_fresh_cache_needs_no_request(tmp_path, make_updater):
+    grist = _Grist(main.FETCH_COLUMNS)
+    make_updater(grist.handler, metadata_cache=_cache(tmp_path, 3600)).get_metadata()
+    grist.requests.clear()
+    metadata = make_updater(grist.handler, metadata_cache=_cache(tmp_path, 3600)).get_metadata()
+    assert grist.requests == []
+    assert metadata['columns']['Data'] == list(main.FETCH_COLUMNS)
+
+
+def test_unchanged_metadata_is_revalidated_with_etags(tmp_path, make_updater, caplog):
+    grist = _Grist(main.FETCH_COLUMNS)
+    make_updater(grist.handler, metadata_cache=_cache(tmp_path, 0)).get_metadata()
+    metadata = make_updater(grist.handler, metadata_cache=_cache(tmp_path, 0)).get_metadata()
+    assert metadata['tables'] == ['Data', 'Other']
+    assert metadata['columns']['Data'] == list(main.FETCH_COLUMNS)
+    assert "Table metadata unchanged" in caplog.text
+
+
+def test_renamed_column_is_detected_when_table_list_is_unchanged(tmp_path, make_updater, caplog):
+    grist = _Grist(main.FETCH_COLUMNS)
+    make_updater(grist.handler, metadata_cache=_cache(tmp_path, 0)).get_metadata()
+    grist.columns = ('Expense', 'Next_Pay', 'Recurrence')
+    metadata = make_updater(grist.handler, metadata_cache=_cache(tmp_path, 0)).get_metadata()
+    assert metadata['columns']['Data'] == ['Expense', 'Next_Pay', 'Recurrence']
+    assert "schema changed" in caplog.text
+
+
+def test_missing_column_stops_the_run_and_clears_the_cache(tmp_path, make_updater):
+    grist = _Grist(('Expense', 'Recurrence'))
+    updater = make_updater(grist.handler, metadata_cache=_cache(tmp_path, 3600))
+    updater.process_records()
+    assert 'records' not in grist.requests
+    assert not (tmp_path / "metadata.json").exists()
@@ -0,0 +1,79 @@
+"""Next payment dates, including month ends and the host's timezone."""
+
+import os
+import time
+from datetime import date
+
+import pytest
+
+import main
+from main import grist_date, grist_timestamp, next_occurrence, parse_recurrence
+
+
+@pytest.fixture
+def toronto():
+    """Run with the deployed host's timezone, west of UTC."""
+    previous = os.environ.get('TZ')
+    os.environ['TZ'] = 'America/Toronto'
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ['TZ']
+    else:
+        os.environ['TZ'] = previous
+    time.tzset()
+
+
+@pytest.fixture
+def updater():
+    # calculate_next_payment_date needs no secrets or network
+    return main.GristPaymentUpdater.__new__(main.GristPaymentUpdater)
+
+
+def test_grist_dates_round_trip_at_utc_midnight(toronto):
+    timestamp = grist_timestamp(date(2026, 1, 31))
+    assert timestamp % 86400 == 0
+    assert grist_date(timestamp) == date(2026, 1, 31)
+
+
+def test_end_of_month_lands_on_last_day(toronto, updater):
+    jan_31 = grist_timestamp(date(2026, 1, 31))
+    new = updater.calculate_next_payment_date(jan_31, 'End of month', today=date(2026, 2, 1))
+    assert grist_date(new) == date(2026, 2, 28)
+
+
+def test_end_of_month_from_mid_month_anchor():
+    recurrence = parse_recurrence('End of month')
+    assert next_occurrence(date(2024, 1, 15), recurrence, date(2024, 1, 31)) == date(2024, 2, 29)
+
+
+def test_monthly_clamps_to_short_months():
+    monthly = parse_recurrence('Monthly')
+    assert next_occurrence(date(2026, 1, 31), monthly, date(2026, 2, 1)) == date(2026, 2, 28)
+    assert next_occurrence(date(2026, 3, 31), monthly, date(2026, 4, 1)) == date(2026, 4, 30)
+    # Several months stale: counted from the anchor, not the clamped month
+    assert next_occurrence(date(2026, 1, 31), monthly, date(2026, 3, 5)) == date(2026, 3, 31)
+
+
+def test_monthly_daily_runs_keep_the_calendar_date(toronto, updater):
+    # Simulate the service rewriting Next_Payment once a day
+    value = grist_timestamp(date(2026, 1, 15))
+    written = []
+    day = date(2026, 1, 15)
+    while day < date(2026, 5, 1):
+        new = updater.calculate_next_payment_date(value, 'Monthly', today=day)
+        if new != value:
+            written.append(grist_date(new))
+            value = new
+        day = date.fromordinal(day.toordinal() + 1)
+    assert written == [date(2026, 2, 15), date(2026, 3, 15), date(2026, 4, 15), date(2026, 5, 15)]
+
+
+def test_day_steps_and_future_anchors():
+    weekly = parse_recurrence('Weekly')
+    assert next_occurrence(date(2026, 1, 1), weekly, date(2026, 1, 20)) == date(2026, 1, 22)
+    assert next_occurrence(date(2026, 2, 1), weekly, date(2026, 1, 20)) == date(2026, 2, 1)
+
+
+def test_string_dates_stay_strings(updater):
+    assert updater.calculate_next_payment_date('2025-04-17', 'Monthly', today=date(2025, 6, 9)) == '2025-06-17'
@@ -0,0 +1,63 @@
+"""Chunked PATCH updates against a mocked Grist API."""
+
+import json
+
+import httpx
+import pytest
+
+import main
+
+
+def _updates(*ids):
+    return [{'id': record_id, 'new': 1767225600} for record_id in ids]
+
+
+def _patch_ids(request):
+    return [record['id'] for record in json.loads(request.content)['records']]
+
+
+def test_rejected_record_is_isolated_by_bisection(make_updater):
+    sent = []
+
+    def handler(request):
+        ids = _patch_ids(request)
+        sent.append(ids)
+        return httpx.Response(400 if 3 in ids else 200, text="bad value")
+
+    updater = make_updater(handler)
+    failures = updater.update_records(_updates(1, 2, 3, 4, 5))
+    assert list(failures) == [3]
+    assert sent[0] == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("status", [401, 403, 404, 429])
+def test_auth_and_rate_limit_failures_stop_without_bisecting(make_updater, status):
+    sent = []
+
+    def handler(request):
+        sent.append(_patch_ids(request))
+        return httpx.Response(status, text="denied")
+
+    updater = make_updater(handler)
+    failures = updater.update_records(_updates(*range(1, 11)))
+    assert sent == [[1, 2, 3, 4]]
+    assert sorted(failures) == list(range(1, 11))
+
+
+def test_server_error_fails_only_its_chunk(make_updater):
+    def handler(request):
+        return httpx.Response(500 if 1 in _patch_ids(request) else 200)
+
+    updater = make_updater(handler)
+    assert sorted(updater.update_records(_updates(*range(1, 7)))) == [1, 2, 3, 4]
+
+
+def test_failed_updates_exit_non_zero(make_updater, monkeypatch):
+    updater = make_updater(lambda request: httpx.Response(400))
+    monkeypatch.setattr(updater, 'get_metadata', lambda: {
+        'tables': ['Data'], 'columns': {'Data': list(main.FETCH_COLUMNS)}})
+    monkeypatch.setattr(updater, 'fetch_records', lambda: [
+        {'id': 1, 'fields': {'Expense': 'Rent', 'Next_Payment': 1704067200, 'Recurrence': 'Monthly'}}])
+    with pytest.raises(SystemExit) as exit_info:
+        updater.process_records()
+    assert exit_info.value.code == 1
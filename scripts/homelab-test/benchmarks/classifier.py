@@ -0,0 +1,90 @@
+"""Benchmark ErrorClassifier against the original cascade of substring checks.
+
+Run from the homelab-test directory:
+
+    nix develop -c python benchmarks/classifier.py
+"""
+
+import re
+import timeit
+
+from homelab_test.classifier import ErrorClassifier
+
+
+def legacy_analyze(response_text: str) -> str:
+    """The pre-classifier ServiceTester._analyze_response, operating on text."""
+    if "plain HTTP request was sent to HTTPS port" in response_text:
+        return "(HTTPS/HTTP protocol mismatch - Traefik config issue)"
+    elif any(pattern in response_text.lower() for pattern in ["bad gateway", "502"]):
+        return "(Bad Gateway - backend service unavailable)"
+    elif any(pattern in response_text.lower() for pattern in ["404", "not found"]):
+        return "(Not Found - service not configured or offline)"
+    elif any(pattern in response_text.lower() for pattern in ["400", "bad request"]):
+        return "(Bad Request - invalid configuration)"
+    elif any(
+        pattern in response_text.lower() for pattern in ["503", "service unavailable"]
+    ):
+        return "(Service Unavailable - backend down)"
+    elif "connection refused" in response_text.lower():
+        return "(Connection refused - backend not responding)"
+    elif "timeout" in response_text.lower():
+        return "(Timeout - backend too slow)"
+    elif len(response_text) < 50 and re.match(r"^\d+$", response_text.strip()):
+        return "(Raw status code - minimal response)"
+    elif len(response_text) > 0:
+        error_snippet = response_text.replace("\n", " ")[:100]
+        return f"(Error: {error_snippet}...)"
+    else:
+        return "(No response body)"
+
+
+def make_page(size: int, marker: str = "", position: str = "end") -> str:
+    """Build an HTML-like page of about ``size`` characters."""
+    filler = "<div class='row'><span>Lorem ipsum dolor sit amet</span></div>\n"
+    body = filler * (size // len(filler))
+    if position == "start":
+        return marker + body
+    return body + marker
+
+
+CASES = {
+    "empty": "",
+    "raw status": "502",
+    "small 404 page": "<html><body><h1>404 Not Found</h1></body></html>",
+    "Traefik 502": "Bad Gateway",
+    "1 MB, no match": make_page(1024 * 1024),
+    "1 MB, match at start": make_page(1024 * 1024, "Service Unavailable", "start"),
+    "1 MB, match at end": make_page(1024 * 1024, "connection refused"),
+    "5 MB, no match": make_page(5 * 1024 * 1024),
+}
+
+
+def main() -> None:
+    bounded = ErrorClassifier()  # Scans the first 16 KB, as probes do
+    unbounded = ErrorClassifier(max_chars=0)
+    prefix = bounded.max_chars
+
+    # Compare like with like: both implementations on the whole body, and
+    # both on the 16 KB prefix probes actually read
+    print(
+        f"{'case':<24}{'legacy':>12}{'classifier':>12}"
+        f"{'legacy 16K':>12}{'class. 16K':>12}  agrees"
+    )
+    for name, text in CASES.items():
+        number = 200 if len(text) < 1024 else 5
+        legacy = timeit.timeit(lambda: legacy_analyze(text), number=number) / number
+        full = timeit.timeit(lambda: unbounded.classify(text), number=number) / number
+        legacy_capped = (
+            timeit.timeit(lambda: legacy_analyze(text[:prefix]), number=number) / number
+        )
+        capped = timeit.timeit(lambda: bounded.classify(text), number=number) / number
+        agrees = unbounded.classify(text).detail == legacy_analyze(text)
+        print(
+            f"{name:<24}{legacy * 1e6:>10.1f}us{full * 1e6:>10.1f}us"
+            f"{legacy_capped * 1e6:>10.1f}us{capped * 1e6:>10.1f}us"
+            f"  {'yes' if agrees else 'NO'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
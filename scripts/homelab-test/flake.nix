@@ -16,9 +16,11 @@
       python = pkgs.python3.withPackages (ps:
         with ps; [
           httpx
+          h2
           rich
           python-dateutil
           tomli
+          pytest
         ]);
     in {
       devShells.default = pkgs.mkShell {
@@ -37,6 +39,7 @@
           echo "  just core                            # Core infrastructure only"
           echo "  just json                            # JSON output"
           echo "  just lint / just fix / just fmt      # Code quality"
+          echo "  just test                            # Unit tests"
           echo ""
           echo "Direct commands:"
           echo "  python -m homelab_test.cli --help    # CLI help"
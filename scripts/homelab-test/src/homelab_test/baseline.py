@@ -0,0 +1,330 @@
+"""Per-service latency baselines that persist across runs.
+
+Each service keeps two views of its latency:
+
+* a fast EWMA of recent response times, which smooths out one-off spikes, and
+* a slowly decaying quantile sketch of its long-term distribution.
+
+A regression is flagged when the recent EWMA rises well above the long-term
+median and past the long-term p95. While a service is flagged its sketch
+stops absorbing samples, so the reference it is judged against stays where
+the service used to be: a service that creeps from 80ms to 2s stays flagged
+for the whole drift instead of dragging its own baseline along. A lasting,
+intended change is relearned by deleting the service from baselines.json.
+"""
+
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Latencies below this are counted in the lowest bucket
+_MIN_VALUE = 1e-6
+
+# Decayed bucket weights below this are dropped
+_MIN_WEIGHT = 1e-3
+
+
+class QuantileSketch:
+    """Log-bucketed quantile sketch with exponential forgetting.
+
+    Values are counted in buckets whose bounds grow geometrically, so any
+    quantile is accurate to ``relative_accuracy`` of the true value while
+    only a few dozen buckets are needed for a typical service.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.02, max_buckets: int = 256):
+        """Initialize sketch.
+
+        Args:
+            relative_accuracy: Relative error bound of returned quantiles
+            max_buckets: Lowest buckets are merged beyond this many
+        """
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.counts: Dict[int, float] = {}
+        self.total = 0.0
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        """Count a value."""
+        key = math.ceil(math.log(max(value, _MIN_VALUE)) / self._log_gamma)
+        self.counts[key] = self.counts.get(key, 0.0) + weight
+        self.total += weight
+        if len(self.counts) > self.max_buckets:
+            self._collapse()
+
+    def decay(self, factor: float) -> None:
+        """Scale down every count so older values weigh less."""
+        self.total = 0.0
+        for key in list(self.counts):
+            weight = self.counts[key] * factor
+            if weight < _MIN_WEIGHT:
+                del self.counts[key]
+            else:
+                self.counts[key] = weight
+                self.total += weight
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            The estimated value, or None if nothing was counted
+        """
+        if self.total <= 0:
+            return None
+        rank = q * self.total
+        seen = 0.0
+        keys = sorted(self.counts)
+        for key in keys:
+            seen += self.counts[key]
+            if seen >= rank:
+                break
+        # Midpoint of the bucket (gamma^(k-1), gamma^k]
+        return 2 * self.gamma**key / (self.gamma + 1)
+
+    def _collapse(self) -> None:
+        lowest, second = sorted(self.counts)[:2]
+        self.counts[second] += self.counts.pop(lowest)
+
+    def to_dict(self) -> dict:
+        """Serialize for the baseline file."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "counts": {str(key): round(weight, 4) for key, weight in self.counts.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, max_buckets: int = 256) -> "QuantileSketch":
+        """Restore a serialized sketch."""
+        sketch = cls(data.get("relative_accuracy", 0.02), max_buckets)
+        sketch.counts = {int(key): weight for key, weight in data["counts"].items()}
+        sketch.total = sum(sketch.counts.values())
+        return sketch
+
+
+@dataclass
+class LatencyBaseline:
+    """Rolling latency statistics of one service."""
+
+    samples: int = 0
+    ewma: float = 0.0  # Seconds
+    ewm_variance: float = 0.0
+    updated_at: float = 0.0  # Unix time
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def update_recent(self, value: float, alpha: float) -> None:
+        """Fold one response time into the recent EWMA.
+
+        Args:
+            value: Response time in seconds
+            alpha: EWMA smoothing factor
+        """
+        if self.samples == 0:
+            self.ewma = value
+        else:
+            # Incremental exponentially weighted mean and variance
+            diff = value - self.ewma
+            increment = alpha * diff
+            self.ewma += increment
+            self.ewm_variance = (1 - alpha) * (self.ewm_variance + diff * increment)
+        self.samples += 1
+        self.updated_at = time.time()
+
+    def absorb(self, value: float, decay: float) -> None:
+        """Count one response time in the long-term sketch.
+
+        Args:
+            value: Response time in seconds
+            decay: Factor applied to the sketch before counting the value
+        """
+        self.sketch.decay(decay)
+        self.sketch.add(value)
+
+    def to_dict(self) -> dict:
+        """Serialize for the baseline file."""
+        return {
+            "samples": self.samples,
+            "ewma": self.ewma,
+            "ewm_variance": self.ewm_variance,
+            "updated_at": self.updated_at,
+            "sketch": self.sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyBaseline":
+        """Restore a serialized baseline."""
+        return cls(
+            samples=data["samples"],
+            ewma=data["ewma"],
+            ewm_variance=data["ewm_variance"],
+            updated_at=data.get("updated_at", 0.0),
+            sketch=QuantileSketch.from_dict(data["sketch"]),
+        )
+
+
+@dataclass
+class LatencyRegression:
+    """A service whose recent latency rose well above its baseline."""
+
+    service_name: str
+    kind: str  # traefik or direct
+    current: float  # Latest response time, seconds
+    recent: float  # EWMA of recent response times
+    baseline_p50: float  # Long-term median
+    baseline_p95: float
+    severity: str  # warning or critical
+
+    @property
+    def ratio(self) -> float:
+        """How many times slower than the long-term median."""
+        return self.recent / self.baseline_p50 if self.baseline_p50 > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """Serialize for JSON output."""
+        return {
+            "name": self.service_name,
+            "kind": self.kind,
+            "current": self.current,
+            "recent": self.recent,
+            "baseline_p50": self.baseline_p50,
+            "baseline_p95": self.baseline_p95,
+            "ratio": round(self.ratio, 2),
+            "severity": self.severity,
+        }
+
+
+class BaselineEngine:
+    """Track latency baselines per service and flag regressions."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        alpha: float = 0.3,
+        half_life: float = 500,
+        min_samples: int = 20,
+        ratio: float = 2.0,
+        min_increase: float = 0.1,
+    ):
+        """Initialize baseline engine.
+
+        Args:
+            path: JSON file the baselines persist in, kept in memory if None
+            alpha: Smoothing factor of the recent-latency EWMA
+            half_life: Samples after which an observation counts half in the
+                long-term sketch
+            min_samples: Samples needed before a service can be flagged
+            ratio: Flag when recent latency exceeds the long-term median by
+                this factor
+            min_increase: Flag only when recent latency is at least this many
+                seconds above the long-term median
+        """
+        self.path = path
+        self.alpha = alpha
+        self.decay = 0.5 ** (1 / half_life) if half_life > 0 else 1.0
+        self.min_samples = min_samples
+        self.ratio = ratio
+        self.min_increase = min_increase
+        self._baselines: Optional[Dict[str, LatencyBaseline]] = None
+
+    @property
+    def baselines(self) -> Dict[str, LatencyBaseline]:
+        """Baselines keyed by kind and service name, loaded on first use."""
+        if self._baselines is None:
+            self._baselines = self._load()
+        return self._baselines
+
+    def _load(self) -> Dict[str, LatencyBaseline]:
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            return {
+                key: LatencyBaseline.from_dict(value)
+                for key, value in data["services"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            # A missing or corrupt file only means baselines are relearned
+            return {}
+
+    def save(self) -> None:
+        """Write the baselines back to disk."""
+        if self.path is None or self._baselines is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "services": {
+                            key: baseline.to_dict()
+                            for key, baseline in self._baselines.items()
+                        }
+                    },
+                    f,
+                )
+            tmp_path.replace(self.path)
+        except OSError:
+            # Baselines are best-effort; a failed write loses one run of history
+            pass
+
+    def observe(self, results: Iterable[Tuple[str, object]]) -> List[LatencyRegression]:
+        """Fold in a run's results and return services that regressed.
+
+        Only successful probes count: failures and timeouts are reported on
+        their own and would skew the latency distribution.
+
+        Args:
+            results: (kind, ServiceTestResult) pairs, kind being traefik or
+                direct
+
+        Returns:
+            Regressions, slowest relative to baseline first
+        """
+        regressions = []
+        for kind, result in results:
+            if not result.success or result.status_code is None:
+                continue
+            key = f"{kind}:{result.service_name}"
+            baseline = self.baselines.get(key)
+            if baseline is None:
+                baseline = self.baselines[key] = LatencyBaseline()
+
+            # Judge against the long-term distribution before this run, but
+            # with the recent EWMA including it
+            p50 = baseline.sketch.quantile(0.50)
+            p95 = baseline.sketch.quantile(0.95)
+            enough = baseline.samples >= self.min_samples
+            baseline.update_recent(result.response_time, self.alpha)
+
+            recent = baseline.ewma
+            if not enough or p50 is None:
+                baseline.absorb(result.response_time, self.decay)
+                continue
+            threshold = max(p50 * self.ratio, p95, p50 + self.min_increase)
+            if recent <= threshold:
+                baseline.absorb(result.response_time, self.decay)
+                continue
+            # Flagged: leave the long-term sketch as it was before the regression
+            regressions.append(
+                LatencyRegression(
+                    service_name=result.service_name,
+                    kind=kind,
+                    current=result.response_time,
+                    recent=recent,
+                    baseline_p50=p50,
+                    baseline_p95=p95,
+                    severity="critical" if recent > 2 * threshold else "warning",
+                )
+            )
+
+        regressions.sort(key=lambda regression: regression.ratio, reverse=True)
+        return regressions
@@ -0,0 +1,290 @@
+"""Latency benchmarks of services over a warm connection."""
+
+import asyncio
+import importlib.util
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+
+from .history import percentile
+from .scheduler import ProbeScheduler
+from .services import ServiceTester, ServiceTestResult
+
+
+class _PhaseTrace:
+    """Time one request's phases from httpcore trace events, in nanoseconds."""
+
+    def __init__(self):
+        self.connect = 0
+        self.tls = 0
+        self.request_sent: Optional[int] = None
+        self.headers_received: Optional[int] = None
+        self.http_version = ""
+        self._started: Dict[str, int] = {}
+
+    async def __call__(self, event_name: str, info: Dict) -> None:
+        now = time.perf_counter_ns()
+        phase, _, state = event_name.rpartition(".")
+        # http11.send_request_headers, http2.receive_response_headers, ...
+        protocol, _, step = phase.partition(".")
+
+        if state == "started":
+            self._started[phase] = now
+            if step == "send_request_headers":
+                self.request_sent = now
+                self.http_version = "HTTP/2" if protocol == "http2" else "HTTP/1.1"
+        elif state == "complete":
+            started = self._started.pop(phase, None)
+            if phase == "connection.connect_tcp" and started is not None:
+                self.connect += now - started
+            elif phase == "connection.start_tls" and started is not None:
+                self.tls += now - started
+            elif step == "receive_response_headers":
+                self.headers_received = now
+
+
+@dataclass
+class _Sample:
+    """Timings of one benchmark request, in nanoseconds."""
+
+    total: int
+    connect: int
+    tls: int
+    ttfb: int  # Request sent until response headers received
+    transfer: int  # Response headers until the body is read
+    status_code: int
+    http_version: str
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency distribution and phase breakdown of one service."""
+
+    service_name: str
+    url: str
+    method: str = "GET"
+    requests: int = 0  # Warm requests measured, excluding the connecting one
+    failures: int = 0  # Warm requests answered with an error status
+    reconnects: int = 0  # Warm requests that had to open a new connection
+    http_version: str = ""
+    # Latency of warm requests, in seconds
+    min: Optional[float] = None
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+    max: Optional[float] = None
+    # Phases in seconds: DNS, connect and TLS of the first connection, TTFB
+    # and transfer as the median over warm requests
+    dns_time: Optional[float] = None
+    connect_time: Optional[float] = None
+    tls_time: Optional[float] = None
+    ttfb: Optional[float] = None
+    transfer_time: Optional[float] = None
+    error_message: str = ""
+    samples: List[float] = field(default_factory=list, repr=False)
+
+    def to_dict(self) -> dict:
+        """Serialize for JSON output."""
+        return {
+            "name": self.service_name,
+            "url": self.url,
+            "method": self.method,
+            "requests": self.requests,
+            "failures": self.failures,
+            "reconnects": self.reconnects,
+            "http_version": self.http_version,
+            "min": self.min,
+            "p50": self.p50,
+            "p95": self.p95,
+            "p99": self.p99,
+            "max": self.max,
+            "dns": self.dns_time,
+            "connect": self.connect_time,
+            "tls": self.tls_time,
+            "ttfb": self.ttfb,
+            "transfer": self.transfer_time,
+            "error_message": self.error_message,
+        }
+
+
+def _seconds(nanoseconds: Optional[int]) -> Optional[float]:
+    return nanoseconds / 1e9 if nanoseconds is not None else None
+
+
+class ServiceBenchmark:
+    """Send repeated requests to services and break down where time goes.
+
+    Each service gets its own single-connection client. The host name is
+    resolved up front so DNS is timed on its own; requests then go to the
+    resolved address with the original Host header and TLS server name.
+    The first request opens the connection and provides the connect and TLS
+    phases. Only the requests after it, reusing that connection, make up
+    the latency distribution. Redirects are not followed, so every sample
+    measures the same endpoint.
+    """
+
+    def __init__(
+        self,
+        service_tester: ServiceTester,
+        requests: int = 20,
+        concurrency: int = 4,
+    ):
+        """Initialize benchmark.
+
+        Args:
+            service_tester: Tester whose timeout, TLS, HTTP/2 and probe
+                strategy settings are reused
+            requests: Warm requests per service
+            concurrency: Services benchmarked at the same time
+        """
+        self.service_tester = service_tester
+        self.requests = requests
+        self.scheduler = ProbeScheduler(max_concurrent=concurrency)
+
+    async def run(self, results: List[ServiceTestResult]) -> List[BenchmarkResult]:
+        """Benchmark every service that passed its health check.
+
+        Args:
+            results: Health check results; failed services are skipped
+
+        Returns:
+            BenchmarkResult objects in the order of ``results``
+        """
+        working = [r for r in results if r.success]
+        benchmarks = await asyncio.gather(
+            *(
+                self.scheduler.submit(
+                    "benchmark",
+                    lambda r=r: self.benchmark_url(r.service_name, r.url),
+                )
+                for r in working
+            )
+        )
+        return list(benchmarks)
+
+    async def benchmark_url(self, service_name: str, url: str) -> BenchmarkResult:
+        """Benchmark one URL.
+
+        Args:
+            service_name: Name reported in the result, also selects the
+                service's probe strategy
+            url: URL to request
+
+        Returns:
+            BenchmarkResult, with error_message set if the benchmark stopped
+        """
+        tester = self.service_tester
+        strategy = tester.strategy_for(service_name)
+        method = "HEAD" if strategy == "head" else "GET"
+        headers = {}
+        if strategy == "range" and tester.http_config.inspect_bytes > 0:
+            headers["Range"] = f"bytes=0-{tester.http_config.inspect_bytes - 1}"
+        result = BenchmarkResult(
+            service_name=service_name,
+            url=url,
+            method=f"{method} range" if headers else method,
+        )
+
+        target = httpx.URL(url)
+        headers["Host"] = target.netloc.decode("ascii")
+        try:
+            started = time.perf_counter_ns()
+            addresses = await asyncio.get_running_loop().getaddrinfo(
+                target.host, target.port, type=socket.SOCK_STREAM
+            )
+            result.dns_time = _seconds(time.perf_counter_ns() - started)
+        except OSError as e:
+            result.error_message = f"DNS resolution failed: {e}"
+            return result
+        address_url = target.copy_with(host=addresses[0][4][0])
+        extensions = {"sni_hostname": target.host}
+
+        samples: List[_Sample] = []
+        async with self._client() as client:
+            try:
+                for _ in range(self.requests + 1):
+                    samples.append(
+                        await self._request(
+                            client, method, address_url, headers, extensions
+                        )
+                    )
+            except httpx.TimeoutException:
+                result.error_message = "Connection timeout"
+            except httpx.ConnectError:
+                result.error_message = "Connection refused"
+            except httpx.HTTPError as e:
+                result.error_message = f"{type(e).__name__}: {e}"
+
+        if samples:
+            cold, warm = samples[0], samples[1:]
+            result.connect_time = _seconds(cold.connect)
+            result.tls_time = _seconds(cold.tls)
+            result.http_version = cold.http_version
+            if not warm:
+                # Only the connecting request completed
+                warm = [cold]
+            self._summarize(result, warm)
+        return result
+
+    def _client(self) -> httpx.AsyncClient:
+        tester = self.service_tester
+        return httpx.AsyncClient(
+            timeout=tester.timeout,
+            follow_redirects=False,
+            verify=tester.verify_ssl,
+            http2=tester.http_config.http2
+            and importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+        )
+
+    async def _request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: httpx.URL,
+        headers: Dict[str, str],
+        extensions: Dict,
+    ) -> _Sample:
+        """Send one request and read its whole body."""
+        trace = _PhaseTrace()
+        started = time.perf_counter_ns()
+        async with client.stream(
+            method, url, headers=headers, extensions={**extensions, "trace": trace}
+        ) as response:
+            headers_received = time.perf_counter_ns()
+            async for _ in response.aiter_raw():
+                pass
+        finished = time.perf_counter_ns()
+
+        request_sent = trace.request_sent or started + trace.connect + trace.tls
+        return _Sample(
+            total=finished - started,
+            connect=trace.connect,
+            tls=trace.tls,
+            ttfb=(trace.headers_received or headers_received) - request_sent,
+            transfer=finished - headers_received,
+            status_code=response.status_code,
+            http_version=trace.http_version or response.http_version,
+        )
+
+    @staticmethod
+    def _summarize(result: BenchmarkResult, samples: List[_Sample]) -> None:
+        totals = sorted(sample.total for sample in samples)
+        result.requests = len(samples)
+        result.failures = sum(
+            1 for sample in samples if not 200 <= sample.status_code < 400
+        )
+        result.reconnects = sum(1 for sample in samples if sample.connect > 0)
+        result.samples = [_seconds(total) for total in totals]
+        result.min = _seconds(totals[0])
+        result.p50 = _seconds(percentile(totals, 0.50))
+        result.p95 = _seconds(percentile(totals, 0.95))
+        result.p99 = _seconds(percentile(totals, 0.99))
+        result.max = _seconds(totals[-1])
+        result.ttfb = _seconds(percentile(sorted(s.ttfb for s in samples), 0.50))
+        result.transfer_time = _seconds(
+            percentile(sorted(s.transfer for s in samples), 0.50)
+        )
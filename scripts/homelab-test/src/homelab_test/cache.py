@@ -0,0 +1,123 @@
+"""On-disk caches keyed by the dotfiles flake revision."""
+
+import asyncio
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+
+def default_cache_dir() -> Path:
+    """Get the cache directory, honoring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "homelab-test"
+
+
+async def _run_git(repo_path: Path, *args: str) -> Optional[bytes]:
+    """Run a git command in the repository, returning stdout or None."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=repo_path,
+        )
+        stdout, _ = await process.communicate()
+        return stdout if process.returncode == 0 else None
+    except Exception:
+        return None
+
+
+async def get_flake_revision(repo_path: Path) -> Optional[str]:
+    """Fingerprint everything a flake evaluation of the repository depends on.
+
+    Combines the flake.lock contents, the git tree hash of HEAD and any
+    uncommitted changes to tracked files (which flake evaluation also sees).
+
+    Args:
+        repo_path: Root of the dotfiles repository
+
+    Returns:
+        Hex digest identifying the revision, or None if it cannot be determined
+    """
+    tree, diff = await asyncio.gather(
+        _run_git(repo_path, "rev-parse", "HEAD^{tree}"),
+        _run_git(repo_path, "diff", "--no-ext-diff", "--binary", "HEAD"),
+    )
+    if tree is None or diff is None:
+        return None
+
+    try:
+        lock = (repo_path / "flake.lock").read_bytes()
+    except OSError:
+        lock = b""
+
+    digest = hashlib.sha256()
+    for part in (lock, tree.strip(), diff):
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+class RevisionCache:
+    """JSON file holding a single value valid for one flake revision."""
+
+    def __init__(self, path: Path):
+        """Initialize cache.
+
+        Args:
+            path: Cache file location
+        """
+        self.path = path
+
+    def get(self, revision: Optional[str]) -> Optional[Any]:
+        """Get the cached value if it was stored for this revision.
+
+        Args:
+            revision: Current flake revision
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        if revision is None:
+            return None
+        try:
+            with open(self.path) as f:
+                entry = json.load(f)
+            if entry.get("revision") != revision:
+                return None
+            return entry.get("value")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def get_latest(self) -> Optional[Any]:
+        """Get the cached value whatever revision it was stored for.
+
+        Returns:
+            Last stored value, or None if nothing is cached
+        """
+        try:
+            with open(self.path) as f:
+                return json.load(f).get("value")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def set(self, revision: Optional[str], value: Any) -> None:
+        """Store a value for a revision, replacing any previous entry.
+
+        Args:
+            revision: Flake revision the value was computed for
+            value: JSON-serializable value
+        """
+        if revision is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"revision": revision, "value": value}, f)
+            tmp_path.replace(self.path)
+        except OSError:
+            # Caching is best-effort; a failed write only costs a re-evaluation
+            pass
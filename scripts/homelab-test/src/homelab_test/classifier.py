@@ -0,0 +1,93 @@
+"""Priority-ordered classification of error response bodies."""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from .config import ErrorPatternConfig, default_error_patterns
+
+# Bodies this short consisting only of digits are bare status codes
+_RAW_STATUS = re.compile(r"\s*\d+\s*")
+
+
+@dataclass
+class ErrorClassification:
+    """Category assigned to a response body."""
+
+    category: str
+    description: str
+    snippet: str = ""  # Start of the body, for unrecognized errors
+
+    @property
+    def detail(self) -> str:
+        """Human-readable detail as shown in reports."""
+        if self.snippet:
+            return f"(Error: {self.snippet}...)"
+        return f"({self.description})"
+
+
+class ErrorClassifier:
+    """Classify response bodies against prioritized error patterns.
+
+    The body is lowercased once and the categories are checked in priority
+    order with plain substring searches, so the first category with a match
+    wins, exactly as in the original cascade. Case-sensitive patterns are
+    searched in the original text instead.
+    """
+
+    def __init__(
+        self,
+        patterns: Optional[List[ErrorPatternConfig]] = None,
+        max_chars: int = 16384,
+    ):
+        """Initialize classifier.
+
+        Args:
+            patterns: Error patterns in priority order, the defaults if None
+            max_chars: Only this many leading characters are scanned, 0 for all
+        """
+        self.patterns = patterns if patterns is not None else default_error_patterns()
+        self.max_chars = max_chars
+        # Literals per category, lowercased unless matched case-sensitively
+        self._literals: List[Tuple[bool, Tuple[str, ...]]] = [
+            (
+                pattern.case_sensitive,
+                tuple(
+                    literal if pattern.case_sensitive else literal.lower()
+                    for literal in pattern.patterns
+                ),
+            )
+            for pattern in self.patterns
+        ]
+
+    def classify(self, text: str) -> ErrorClassification:
+        """Classify a response body.
+
+        Args:
+            text: Decoded response body, or its leading part
+
+        Returns:
+            ErrorClassification for the highest-priority matching category
+        """
+        if self.max_chars > 0:
+            text = text[: self.max_chars]
+
+        best = None
+        lowered = text.lower()
+        for index, (case_sensitive, literals) in enumerate(self._literals):
+            haystack = text if case_sensitive else lowered
+            if any(literal in haystack for literal in literals):
+                best = index
+                break
+
+        if best is not None:
+            pattern = self.patterns[best]
+            return ErrorClassification(pattern.category, pattern.description)
+        if len(text) < 50 and _RAW_STATUS.fullmatch(text):
+            return ErrorClassification("raw_status", "Raw status code - minimal response")
+        if text:
+            # Show first 100 chars of error response for debugging
+            return ErrorClassification(
+                "unrecognized", "Unrecognized error", text.replace("\n", " ")[:100]
+            )
+        return ErrorClassification("empty", "No response body")
@@ -2,72 +2,313 @@
 
 import argparse
 import asyncio
+import contextlib
 import json
+import signal
+import sqlite3
 import sys
+import time
+from pathlib import Path
+from typing import Optional
 
 from rich.console import Console
 
 from .config import get_config, ConfigError
+from .exporter import MetricsExporter
 from .traefik import TraefikClient
-from .services import ServiceTester
+from .cache import RevisionCache, default_cache_dir
+from .baseline import BaselineEngine
+from .benchmark import ServiceBenchmark
+from .classifier import ErrorClassifier
+from .history import HistoryStore, parse_window
+from .services import ServiceTester, ServiceTestReporter
+from .scheduler import ProbeScheduler
 from .infrastructure import InfrastructureTester
+from .reachability import ReachabilityEngine
 from .reporting import RichReporter
-from .system_info import run_system_info
+from .system_info import SystemInfoGatherer, run_system_info
+from .timing import StageTimer
+from .watch import Watcher, WatchSnapshot
 
 
-async def run_full_test(output_format: str = "rich", verbose: bool = False) -> int:
-    """Run complete homelab health check.
+def create_service_tester(config) -> ServiceTester:
+    """Create a service tester with the configured pool and concurrency limits.
 
     Args:
-        output_format: Output format (rich, json, plain)
-        verbose: Enable verbose output
+        config: HomelabTestConfig instance
 
     Returns:
-        Exit code (0 for success, 1 for failures)
+        Configured ServiceTester
     """
-    console = Console()
+    return ServiceTester(
+        timeout=config.timeouts.http,
+        follow_redirects=config.follow_redirects,
+        http_config=config.http,
+        verify_ssl=config.verify_ssl,
+        scheduler=ProbeScheduler(
+            max_concurrent=config.concurrency.max_concurrent,
+            group_limits=config.concurrency.routing_type_limits,
+        ),
+        classifier=ErrorClassifier(
+            config.error_patterns, max_chars=config.http.inspect_bytes
+        ),
+        probe_strategies=config.probe_strategies,
+        default_strategy=config.probe_strategy,
+    )
+
+
+def create_infrastructure_tester(
+    config, service_tester: Optional[ServiceTester] = None
+) -> InfrastructureTester:
+    """Create an infrastructure tester with the configured ping sampling.
+
+    Args:
+        config: HomelabTestConfig instance
+        service_tester: Shared ServiceTester for direct service probes
+
+    Returns:
+        Configured InfrastructureTester
+    """
+    return InfrastructureTester(
+        timeout=config.timeouts.infrastructure,
+        dns_timeout=config.timeouts.dns,
+        service_tester=service_tester,
+        reachability=ReachabilityEngine(
+            count=config.ping.count,
+            interval=config.ping.interval,
+            timeout=config.timeouts.ping,
+            tcp_refused_is_up=config.ping.tcp_refused_is_up,
+        ),
+    )
+
+
+def create_traefik_client(config, refresh: bool = False) -> TraefikClient:
+    """Create a Traefik client with the configured discovery cache.
+
+    Args:
+        config: HomelabTestConfig instance
+        refresh: Ignore cached discovery results
+
+    Returns:
+        Configured TraefikClient
+    """
+    cache = None
+    if config.discovery.cache_enabled:
+        cache_dir = (
+            Path(config.discovery.cache_dir)
+            if config.discovery.cache_dir
+            else default_cache_dir()
+        )
+        cache = RevisionCache(cache_dir / "discovery.json")
+
+    return TraefikClient(
+        api_url=config.traefik.api_url,
+        repo_path=config.discovery.repo_path,
+        cache=cache,
+        refresh=refresh,
+    )
 
+
+def create_history_store(config) -> Optional[HistoryStore]:
+    """Create the results history store, if enabled.
+
+    Args:
+        config: HomelabTestConfig instance
+
+    Returns:
+        HistoryStore, or None if [history] is disabled
+    """
+    if not config.history.enabled:
+        return None
+    path = (
+        Path(config.history.path).expanduser()
+        if config.history.path
+        else default_cache_dir() / "history.sqlite"
+    )
+    return HistoryStore(path, retention_days=config.history.retention_days)
+
+
+def _record_history(config, console: Console, mode: str, **results) -> None:
+    """Append a run to the history store, warning instead of failing.
+
+    Args:
+        config: HomelabTestConfig instance
+        console: Console for warnings
+        mode: What produced the run, e.g. "full" or "core"
+        **results: Keyword arguments for HistoryStore.record_run
+    """
+    store = create_history_store(config)
+    if store is None:
+        return
     try:
-        # Load configuration
-        config = get_config()
+        store.record_run(mode, **results)
+    except (sqlite3.Error, OSError) as e:
+        console.print(f"[yellow]⚠️  Could not record history: {e}[/yellow]")
+    finally:
+        store.close()
+
+
+def create_baseline_engine(config) -> Optional[BaselineEngine]:
+    """Create the latency baseline engine, if enabled.
+
+    Args:
+        config: HomelabTestConfig instance
+
+    Returns:
+        BaselineEngine, or None if [baseline] is disabled
+    """
+    if not config.baseline.enabled:
+        return None
+    return BaselineEngine(
+        default_cache_dir() / "baselines.json",
+        alpha=config.baseline.alpha,
+        half_life=config.baseline.half_life,
+        min_samples=config.baseline.min_samples,
+        ratio=config.baseline.ratio,
+        min_increase=config.baseline.min_increase,
+    )
 
-        # Create reporter
-        reporter = RichReporter(console if output_format == "rich" else None)
 
+async def _run_pipelined(
+    config,
+    reporter: RichReporter,
+    output_format: str,
+    traefik_client: TraefikClient,
+    service_tester: ServiceTester,
+    infrastructure_tester: InfrastructureTester,
+    timer: StageTimer,
+):
+    """Run infrastructure checks, discovery and probing as overlapping stages.
+
+    Infrastructure checks run alongside discovery, and each discovered service
+    is probed as soon as discovery yields it. Infrastructure results are shown
+    as soon as they are complete, above the service progress bar.
+
+    Returns:
+        Tuple of (infrastructure result, discovered services, service results)
+    """
+
+    async def infrastructure_stage():
+        with timer.stage("infrastructure"):
+            result = await infrastructure_tester.test_all_infrastructure(config)
         if output_format == "rich":
-            reporter.show_header()
+            reporter.show_infrastructure_results(result)
+        return result
 
-        # Initialize clients
-        traefik_client = TraefikClient(api_url=config.traefik.api_url)
-        service_tester = ServiceTester(
-            timeout=config.timeouts.http, follow_redirects=config.follow_redirects
+    if output_format == "rich":
+        reporter.console.print(
+            "[blue]🔧 Testing infrastructure while discovering Traefik services...[/blue]"
         )
-        infrastructure_tester = InfrastructureTester(
-            timeout=config.timeouts.infrastructure
+
+    infra_task = asyncio.create_task(infrastructure_stage())
+    traefik_services = []
+    service_results = []
+    try:
+        progress_context = (
+            reporter.create_progress_context(0)
+            if output_format == "rich"
+            else contextlib.nullcontext()
         )
+        with progress_context as progress:
+            task = (
+                progress.add_task("Testing services...", total=None)
+                if progress
+                else None
+            )
 
-        # Test infrastructure first
-        if output_format == "rich":
-            console.print("[blue]🔧 Testing infrastructure...[/blue]")
+            async def discovered_services():
+                with timer.stage("discovery"):
+                    async for service in traefik_client.iter_services(
+                        config.traefik_paths
+                    ):
+                        timer.start("probing", depends_on="discovery")
+                        traefik_services.append(service)
+                        if progress:
+                            progress.update(task, total=len(traefik_services))
+                        yield service
+                if output_format == "rich":
+                    reporter.show_service_discovery(len(traefik_services))
+
+            try:
+                tested = []
+                async for service, result in service_tester.iter_services(
+                    discovered_services()
+                ):
+                    tested.append((service, result))
+                    if progress:
+                        progress.advance(task)
+
+                # Drop early services the finished nix evaluation superseded,
+                # and report in name order rather than completion order
+                stale = traefik_client.stale_services
+                traefik_services = sorted(
+                    (s for s in traefik_services if not any(s is x for x in stale)),
+                    key=lambda s: s.name,
+                )
+                service_results = sorted(
+                    (r for s, r in tested if not any(s is x for x in stale)),
+                    key=lambda r: r.service_name,
+                )
+            except Exception as e:
+                reporter.console.print(
+                    f"[red]❌ Failed to discover or test Traefik services: {e}[/red]"
+                )
+                service_results = []
+                traefik_services = []
+            finally:
+                timer.stop("probing")
+
+            infra_result = await infra_task
+    finally:
+        if not infra_task.done():
+            infra_task.cancel()
+
+    return infra_result, traefik_services, service_results
+
+
+async def _run_sequential(
+    config,
+    reporter: RichReporter,
+    output_format: str,
+    traefik_client: TraefikClient,
+    service_tester: ServiceTester,
+    infrastructure_tester: InfrastructureTester,
+    timer: StageTimer,
+):
+    """Run infrastructure checks, discovery and probing one after another.
+
+    Returns:
+        Tuple of (infrastructure result, discovered services, service results)
+    """
+    console = reporter.console
+
+    # Test infrastructure first
+    if output_format == "rich":
+        console.print("[blue]🔧 Testing infrastructure...[/blue]")
 
+    with timer.stage("infrastructure"):
         infra_result = await infrastructure_tester.test_all_infrastructure(config)
 
-        if output_format == "rich":
-            reporter.show_infrastructure_results(infra_result)
+    if output_format == "rich":
+        reporter.show_infrastructure_results(infra_result)
 
-        # Discover and test Traefik services
-        if output_format == "rich":
-            console.print("[blue]📡 Discovering Traefik services...[/blue]")
+    # Discover and test Traefik services
+    if output_format == "rich":
+        console.print("[blue]📡 Discovering Traefik services...[/blue]")
 
-        try:
-            traefik_services = await traefik_client.get_services(config.traefik_paths)
+    try:
+        with timer.stage("discovery", depends_on="infrastructure"):
+            traefik_services = await traefik_client.get_services(
+                config.traefik_paths
+            )
 
-            if output_format == "rich":
-                reporter.show_service_discovery(len(traefik_services))
-                console.print("[blue]🌐 Testing services...[/blue]")
-                console.print()
+        if output_format == "rich":
+            reporter.show_service_discovery(len(traefik_services))
+            console.print("[blue]🌐 Testing services...[/blue]")
+            console.print()
 
-            # Test services with progress tracking
+        service_results = []
+        with timer.stage("probing", depends_on="discovery"):
             if output_format == "rich" and len(traefik_services) > 0:
                 with reporter.create_progress_context(
                     len(traefik_services)
@@ -76,48 +317,129 @@ async def run_full_test(output_format: str = "rich", verbose: bool = False) -> i
                         "Testing services...", total=len(traefik_services)
                     )
 
-                    service_results = []
-                    if config.parallel_execution:
-                        # Test all services concurrently
-                        service_results = await service_tester.test_services(
-                            traefik_services
-                        )
-                        progress.update(task, completed=len(traefik_services))
-                    else:
-                        # Test services sequentially with progress updates
-                        for i, service in enumerate(traefik_services):
-                            result = await service_tester.test_service(service)
-                            service_results.append(result)
-                            progress.update(task, completed=i + 1)
-            else:
-                # Non-rich output or no services
-                if config.parallel_execution:
-                    service_results = await service_tester.test_services(
-                        traefik_services
-                    )
-                else:
-                    service_results = []
-                    for service in traefik_services:
+                    # Test services sequentially with progress updates
+                    for i, service in enumerate(traefik_services):
                         result = await service_tester.test_service(service)
                         service_results.append(result)
+                        progress.update(task, completed=i + 1)
+            else:
+                for service in traefik_services:
+                    result = await service_tester.test_service(service)
+                    service_results.append(result)
 
-        except Exception as e:
-            console.print(
-                f"[red]❌ Failed to discover or test Traefik services: {e}[/red]"
+    except Exception as e:
+        console.print(
+            f"[red]❌ Failed to discover or test Traefik services: {e}[/red]"
+        )
+        service_results = []
+        traefik_services = []
+
+    return infra_result, traefik_services, service_results
+
+
+async def run_full_test(
+    output_format: str = "rich",
+    verbose: bool = False,
+    refresh_discovery: bool = False,
+    benchmark: Optional[int] = None,
+) -> int:
+    """Run complete homelab health check.
+
+    Args:
+        output_format: Output format (rich, json, plain)
+        verbose: Enable verbose output
+        refresh_discovery: Re-run nix evaluation even if the cache is valid
+        benchmark: Also benchmark working services with this many warm
+            requests each, 0 for [benchmark] requests, None to skip
+
+    Returns:
+        Exit code (0 for success, 1 for failures)
+    """
+    console = Console()
+
+    try:
+        # Load configuration
+        config = get_config()
+
+        # Create reporter
+        reporter = RichReporter(console if output_format == "rich" else None)
+
+        if output_format == "rich":
+            reporter.show_header()
+
+        # Initialize clients
+        traefik_client = create_traefik_client(config, refresh=refresh_discovery)
+        service_tester = create_service_tester(config)
+        infrastructure_tester = create_infrastructure_tester(config, service_tester)
+        timer = StageTimer()
+        started_at = time.time()
+
+        # Pipelined mode overlaps infrastructure checks, discovery and probing
+        run_stages = _run_pipelined if config.parallel_execution else _run_sequential
+        try:
+            infra_result, traefik_services, service_results = await run_stages(
+                config,
+                reporter,
+                output_format,
+                traefik_client,
+                service_tester,
+                infrastructure_tester,
+                timer,
+            )
+        finally:
+            await service_tester.aclose()
+
+        _record_history(
+            config,
+            console,
+            "full",
+            service_results=service_results,
+            infra_result=infra_result,
+            health_score=ServiceTestReporter().calculate_health_score(service_results),
+            duration=timer.wall_time,
+            timestamp=started_at,
+        )
+
+        regressions = []
+        baselines = create_baseline_engine(config)
+        if baselines is not None:
+            regressions = baselines.observe(
+                [("traefik", r) for r in service_results]
+                + [("direct", r) for r in infra_result.direct_service_results]
+            )
+            baselines.save()
+
+        benchmarks = []
+        if benchmark is not None:
+            service_benchmark = ServiceBenchmark(
+                service_tester,
+                requests=benchmark or config.benchmark.requests,
+                concurrency=config.benchmark.concurrency,
             )
-            service_results = []
-            traefik_services = []
+            if output_format == "rich":
+                working = sum(1 for r in service_results if r.success)
+                console.print(
+                    f"[blue]⏱️  Benchmarking {working} working services "
+                    f"({service_benchmark.requests} requests each)...[/blue]"
+                )
+            benchmarks = await service_benchmark.run(service_results)
 
         # Display results
         if output_format == "rich":
-            reporter.show_service_results(service_results)
-            reporter.show_analysis(service_results, infra_result)
+            reporter.show_service_results(service_results, benchmarks)
+            reporter.show_analysis(service_results, infra_result, regressions)
+            reporter.show_stage_timings(timer)
         elif output_format == "json":
             # JSON output
             from .services import ServiceTestReporter
 
             service_reporter = ServiceTestReporter()
             summary = service_reporter.generate_summary(service_results)
+            # Categories hold result objects; list service names instead
+            summary["categories"] = {
+                category: [r.service_name for r in results]
+                for category, results in summary["categories"].items()
+            }
 
             json_output = {
                 "summary": summary,
@@ -127,8 +449,13 @@ async def run_full_test(output_format: str = "rich", verbose: bool = False) -> i
                         "url": r.url,
                         "routing_type": r.routing_type,
                         "status_code": r.status_code,
+                        "response_time": r.response_time,
+                        "handshake_time": r.handshake_time,
+                        "transfer_time": r.transfer_time,
                         "success": r.success,
                         "error_message": r.error_message,
+                        "error_category": r.error_category,
+                        "probe_method": r.probe_method,
                     }
                     for r in service_results
                 ],
@@ -138,6 +465,12 @@ async def run_full_test(output_format: str = "rich", verbose: bool = False) -> i
                             "name": r.name,
                             "target": r.target,
                             "success": r.success,
+                            "method": r.method,
+                            "rtt_avg": r.response_time,
+                            "rtt_min": r.rtt_min,
+                            "rtt_max": r.rtt_max,
+                            "jitter": r.jitter,
+                            "packet_loss": r.packet_loss,
                             "error_message": r.error_message,
                         }
                         for r in infra_result.ping_results
@@ -146,12 +479,18 @@ async def run_full_test(output_format: str = "rich", verbose: bool = False) -> i
                         {
                             "name": r.name,
                             "query": r.query,
+                            "record_type": r.record_type,
                             "success": r.success,
                             "resolved_ips": r.resolved_ips,
+                            "answers": r.answers,
+                            "response_time": r.response_time,
                         }
                         for r in infra_result.dns_results
                     ],
                 },
+                "regressions": [r.to_dict() for r in regressions],
+                "benchmarks": [b.to_dict() for b in benchmarks],
+                "timings": timer.to_dict(),
             }
 
             print(json.dumps(json_output, indent=2))
@@ -211,17 +550,27 @@ async def run_core_only(output_format: str = "rich", verbose: bool = False) -> i
 
     try:
         config = get_config()
-        infrastructure_tester = InfrastructureTester(
-            timeout=config.timeouts.infrastructure
-        )
         reporter = RichReporter(console if output_format == "rich" else None)
 
         if output_format == "rich":
             reporter.show_header()
             console.print("[blue]🔧 Testing core infrastructure only...[/blue]")
 
-        infra_result = await infrastructure_tester.test_all_infrastructure(config)
-        
+        async with create_service_tester(config) as service_tester:
+            infrastructure_tester = create_infrastructure_tester(config, service_tester)
+            started_at = time.time()
+            infra_result = await infrastructure_tester.test_all_infrastructure(config)
+
+        _record_history(
+            config,
+            console,
+            "core",
+            service_results=[],
+            infra_result=infra_result,
+            duration=time.time() - started_at,
+            timestamp=started_at,
+        )
+
         if output_format == "rich":
             reporter.show_infrastructure_results(infra_result)
         elif output_format == "json":
@@ -233,6 +582,12 @@ async def run_core_only(output_format: str = "rich", verbose: bool = False) -> i
                             "name": r.name,
                             "target": r.target,
                             "success": r.success,
+                            "method": r.method,
+                            "rtt_avg": r.response_time,
+                            "rtt_min": r.rtt_min,
+                            "rtt_max": r.rtt_max,
+                            "jitter": r.jitter,
+                            "packet_loss": r.packet_loss,
                             "error_message": r.error_message,
                         }
                         for r in infra_result.ping_results
@@ -241,8 +596,11 @@ async def run_core_only(output_format: str = "rich", verbose: bool = False) -> i
                         {
                             "name": r.name,
                             "query": r.query,
+                            "record_type": r.record_type,
                             "success": r.success,
                             "resolved_ips": r.resolved_ips,
+                            "answers": r.answers,
+                            "response_time": r.response_time,
                         }
                         for r in infra_result.dns_results
                     ],
@@ -277,6 +635,280 @@ async def run_core_only(output_format: str = "rich", verbose: bool = False) -> i
         return 1
 
 
+async def run_watch(
+    output_format: str = "rich",
+    verbose: bool = False,
+    interval: Optional[float] = None,
+    jitter: Optional[float] = None,
+    hosts: Optional[bool] = None,
+    cycles: int = 0,
+    refresh_discovery: bool = False,
+    metrics_port: Optional[int] = None,
+) -> int:
+    """Re-run health checks on an interval until interrupted.
+
+    Args:
+        output_format: rich for one status line per cycle, json for one JSON
+            document per line
+        verbose: Enable verbose output
+        interval: Seconds between cycles, [watch] interval if None
+        jitter: Random extra seconds per wait, [watch] jitter if None
+        hosts: Gather host stats over SSH, [watch] hosts if None
+        cycles: Stop after this many cycles, 0 to run until interrupted
+        refresh_discovery: Ignore the discovery cache on the first discovery
+        metrics_port: Port for the Prometheus exporter, [watch] metrics_port
+            if None, disabled if 0
+
+    Returns:
+        Exit code of the last cycle
+    """
+    console = Console()
+
+    try:
+        config = get_config()
+        interval = interval if interval is not None else config.watch.interval
+        jitter = jitter if jitter is not None else config.watch.jitter
+        hosts = hosts if hosts is not None else config.watch.hosts
+        metrics_port = (
+            metrics_port if metrics_port is not None else config.watch.metrics_port
+        )
+
+        service_tester = create_service_tester(config)
+        gatherer = None
+        if hosts:
+            gatherer = SystemInfoGatherer(
+                repo_path=Path(config.discovery.repo_path),
+                cache=RevisionCache(default_cache_dir() / "hosts.json"),
+                # Keep SSH masters alive across the wait between cycles
+                control_persist=max(120, int(interval * 3)),
+            )
+        watcher = Watcher(
+            config,
+            create_traefik_client(config, refresh=refresh_discovery),
+            service_tester,
+            create_infrastructure_tester(config, service_tester),
+            gatherer=gatherer,
+            interval=interval,
+            jitter=jitter,
+            baselines=create_baseline_engine(config),
+        )
+
+        reporter = RichReporter(console)
+        if output_format == "json":
+            watcher.add_listener(
+                lambda snapshot: print(
+                    json.dumps(watch_snapshot_to_dict(snapshot)), flush=True
+                )
+            )
+        else:
+            reporter.show_header()
+            console.print(
+                f"[blue]👀 Watching every {interval:.0f}s "
+                f"(+ up to {jitter:.0f}s jitter), Ctrl+C to stop[/blue]"
+            )
+            watcher.add_listener(reporter.show_watch_cycle)
+
+        exporter = None
+        if metrics_port:
+            exporter = MetricsExporter(config.watch.metrics_address, metrics_port)
+            await exporter.start()
+            watcher.add_listener(exporter.update)
+            if output_format != "json":
+                console.print(
+                    f"[blue]📈 Serving metrics on "
+                    f"http://{config.watch.metrics_address}:{metrics_port}/metrics[/blue]"
+                )
+
+        history = create_history_store(config)
+        if history is not None:
+
+            def record_cycle(snapshot: WatchSnapshot) -> None:
+                try:
+                    history.record_run(
+                        "watch",
+                        snapshot.service_results,
+                        snapshot.infra_result,
+                        health_score=snapshot.health_score,
+                        duration=snapshot.duration,
+                        timestamp=snapshot.started_at.timestamp(),
+                    )
+                except (sqlite3.Error, OSError) as e:
+                    console.print(f"[yellow]⚠️  Could not record history: {e}[/yellow]")
+
+            watcher.add_listener(record_cycle)
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, watcher.stop)
+
+        try:
+            await watcher.run(cycles)
+        finally:
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                loop.remove_signal_handler(sig)
+            if exporter is not None:
+                await exporter.close()
+            if history is not None:
+                history.close()
+            await watcher.close()
+
+        latest = watcher.latest
+        if latest is None:
+            return 1
+        infra = latest.infra_result
+        total_failures = (
+            sum(1 for r in latest.service_results if not r.success)
+            + sum(1 for r in infra.ping_results if not r.success and not r.skipped)
+            + sum(1 for r in infra.dns_results if not r.success)
+            + sum(1 for r in infra.direct_service_results if not r.success)
+        )
+        return 0 if total_failures == 0 else 1
+
+    except ConfigError as e:
+        console.print(f"[red]❌ Configuration error: {e}[/red]")
+        return 1
+    except Exception as e:
+        console.print(f"[red]❌ Unexpected error: {e}[/red]")
+        if verbose:
+            import traceback
+
+            console.print(traceback.format_exc())
+        return 1
+
+
+def run_history(
+    output_format: str = "rich",
+    window: str = "24h",
+    service: Optional[str] = None,
+) -> int:
+    """Show availability and latency percentiles from recorded runs.
+
+    Args:
+        output_format: Output format (rich, json, plain)
+        window: How far back to look, e.g. "30m", "24h" or "7d"
+        service: Only show this service, ping target or DNS test
+
+    Returns:
+        Exit code
+    """
+    console = Console()
+
+    try:
+        config = get_config()
+        seconds = parse_window(window)
+        store = create_history_store(config)
+        if store is None:
+            console.print("[red]❌ History is disabled in [history][/red]")
+            return 1
+
+        try:
+            since = time.time() - seconds
+            summaries = [
+                summary
+                for kind in ("service", "ping", "dns")
+                for summary in store.summarize(since, kind, service)
+            ]
+            run_count = store.run_count(since)
+        finally:
+            store.close()
+
+        if output_format == "json":
+            print(
+                json.dumps(
+                    {
+                        "window": window,
+                        "since": since,
+                        "runs": run_count,
+                        "results": [
+                            {
+                                "kind": s.kind,
+                                "name": s.name,
+                                "source": s.source,
+                                "samples": s.samples,
+                                "availability": s.availability,
+                                "p50": s.p50,
+                                "p95": s.p95,
+                                "max": s.max,
+                                "last_failure": s.last_failure,
+                            }
+                            for s in summaries
+                        ],
+                    },
+                    indent=2,
+                )
+            )
+        elif output_format == "plain":
+            for s in summaries:
+                p50 = f"{s.p50 * 1000:.0f}ms" if s.p50 is not None else "-"
+                p95 = f"{s.p95 * 1000:.0f}ms" if s.p95 is not None else "-"
+                via = f" ({s.source})" if s.source else ""
+                print(
+                    f"{s.kind} {s.name}{via}: {s.availability:.1f}% "
+                    f"p50={p50} p95={p95} samples={s.samples}"
+                )
+        else:
+            RichReporter(console).show_history(summaries, window, run_count)
+
+        return 0
+
+    except ConfigError as e:
+        console.print(f"[red]❌ Configuration error: {e}[/red]")
+        return 1
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return 1
+    except sqlite3.Error as e:
+        console.print(f"[red]❌ Could not read history: {e}[/red]")
+        return 1
+
+
+def watch_snapshot_to_dict(snapshot: WatchSnapshot) -> dict:
+    """Summarize a watch cycle for JSON output.
+
+    Args:
+        snapshot: Completed watch cycle
+
+    Returns:
+        JSON-serializable dictionary
+    """
+    infra = snapshot.infra_result
+    return {
+        "cycle": snapshot.cycle,
+        "started_at": snapshot.started_at.isoformat(),
+        "duration": snapshot.duration,
+        "health_score": snapshot.health_score,
+        "rediscovered": snapshot.rediscovered,
+        "discovery_error": snapshot.discovery_error or None,
+        "regressions": [r.to_dict() for r in snapshot.regressions],
+        "services": {
+            r.service_name: {
+                "success": r.success,
+                "status_code": r.status_code,
+                "response_time": r.response_time,
+                "error_message": r.error_message,
+            }
+            for r in snapshot.service_results
+        },
+        "ping": {
+            r.name: {"success": r.success, "rtt_avg": r.response_time}
+            for r in infra.ping_results
+            if not r.skipped
+        },
+        "dns": {
+            r.name: {"success": r.success, "response_time": r.response_time}
+            for r in infra.dns_results
+        },
+        "direct_services": {
+            r.service_name: {"success": r.success, "status_code": r.status_code}
+            for r in infra.direct_service_results
+        },
+        "hosts": {
+            name: {"online": info.online, "ping_ms": info.ping_ms}
+            for name, info in snapshot.hosts.items()
+        },
+    }
+
+
 def main() -> int:
     """Main entry point for CLI."""
     parser = argparse.ArgumentParser(
@@ -287,14 +919,20 @@ Examples:
   %(prog)s                          # Full health check
   %(prog)s --core                   # Core infrastructure only
   %(prog)s --output json            # JSON output
+  %(prog)s --refresh-discovery      # Re-evaluate services, ignoring the cache
+  %(prog)s --benchmark 50           # Latency percentiles over 50 warm requests
   %(prog)s info                     # System information
   %(prog)s info --full              # Detailed system information
+  %(prog)s watch --interval 30      # Re-check every 30s with warm clients
+  %(prog)s history --window 7d      # Latency and availability over a week
         """,
     )
 
     parser.add_argument("--output", "-o", choices=["rich", "json", "plain"], default="rich", help="Output format")
     parser.add_argument("--core", action="store_true", help="Test core infrastructure only")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--refresh-discovery", action="store_true", help="Ignore the discovery cache and re-evaluate the flake")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=0, metavar="N", help="Benchmark working services with N warm requests each (default: [benchmark] requests)")
     
     # Add subcommands
     subparsers = parser.add_subparsers(dest="command", help="Commands")
@@ -303,6 +941,22 @@ Examples:
     info_parser = subparsers.add_parser("info", help="Show system information")
     info_parser.add_argument("--full", action="store_true", help="Show detailed information")
     info_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    info_parser.add_argument("--sequential", action="store_true", help="Gather hosts one at a time")
+    info_parser.add_argument("--max-workers", type=int, default=4, help="Hosts gathered concurrently")
+    info_parser.add_argument("--host-deadline", type=float, default=60.0, help="Seconds allowed per host for stats")
+
+    # Watch subcommand
+    watch_parser = subparsers.add_parser("watch", help="Re-run health checks on an interval")
+    watch_parser.add_argument("--interval", type=float, help="Seconds between cycles (default: [watch] interval)")
+    watch_parser.add_argument("--jitter", type=float, help="Random extra seconds per wait (default: [watch] jitter)")
+    watch_parser.add_argument("--hosts", action=argparse.BooleanOptionalAction, default=None, help="Also gather host stats over SSH")
+    watch_parser.add_argument("--cycles", type=int, default=0, help="Stop after this many cycles (default: run until interrupted)")
+    watch_parser.add_argument("--metrics-port", type=int, help="Serve Prometheus metrics on this port, 0 to disable (default: [watch] metrics_port)")
+
+    # History subcommand
+    history_parser = subparsers.add_parser("history", help="Show latency and availability over time")
+    history_parser.add_argument("--window", default="24h", help="How far back to look, e.g. 30m, 24h, 7d (default: 24h)")
+    history_parser.add_argument("--service", help="Only show this service, ping target or DNS test")
 
     args = parser.parse_args()
 
@@ -310,11 +964,41 @@ Examples:
     try:
         if args.command == "info":
             # Run system info command
-            return asyncio.run(run_system_info(args.full, args.json))
+            return asyncio.run(
+                run_system_info(
+                    args.full,
+                    args.json,
+                    parallel=not args.sequential,
+                    max_workers=args.max_workers,
+                    host_deadline=args.host_deadline,
+                )
+            )
+        elif args.command == "watch":
+            return asyncio.run(
+                run_watch(
+                    args.output,
+                    args.verbose,
+                    interval=args.interval,
+                    jitter=args.jitter,
+                    hosts=args.hosts,
+                    cycles=args.cycles,
+                    refresh_discovery=args.refresh_discovery,
+                    metrics_port=args.metrics_port,
+                )
+            )
+        elif args.command == "history":
+            return run_history(args.output, args.window, args.service)
         elif args.core:
             return asyncio.run(run_core_only(args.output, args.verbose))
         else:
-            return asyncio.run(run_full_test(args.output, args.verbose))
+            return asyncio.run(
+                run_full_test(
+                    args.output,
+                    args.verbose,
+                    args.refresh_discovery,
+                    benchmark=args.benchmark,
+                )
+            )
     except KeyboardInterrupt:
         print("\n⚠️  Interrupted by user")
         return 1
@@ -0,0 +1,152 @@
+"""Single-round-trip host stats collector.
+
+The collector is a POSIX shell script piped to ``sh -s`` on the target host
+(over SSH, or locally). It reads kernel interfaces such as ``/proc/loadavg``,
+``/proc/meminfo`` and ``statvfs`` (via ``stat -f``) directly and prints one JSON
+document, so gathering a host's stats costs one remote invocation instead of a
+command per metric. It deliberately needs nothing beyond coreutils, since hosts
+are not guaranteed to have Python or jq installed.
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+# Pass "full" as the first argument to also count store paths and measure the
+# system closure, which is noticeably slower.
+COLLECTOR_SCRIPT = r"""
+full="${1:-}"
+
+esc() { printf '%s' "$1" | tr -d '\000-\037' | sed 's/\\/\\\\/g; s/"/\\"/g'; }
+str() { if [ -n "$1" ]; then printf '"%s"' "$(esc "$1")"; else printf null; fi; }
+num() { case "$1" in ''|*[!0-9.]*) printf null ;; *) printf '%s' "$1" ;; esac; }
+
+# Connectivity checks run in the background while the local reads happen
+ping -c 1 -W 2 1.1.1.1 >/dev/null 2>&1 &
+ping_pid=$!
+getent hosts google.com >/dev/null 2>&1 &
+dns_pid=$!
+
+read -r uptime_s _ < /proc/uptime
+read -r load1 load5 load15 _ < /proc/loadavg
+mem_total=$(awk '/^MemTotal:/ {print $2}' /proc/meminfo)
+mem_avail=$(awk '/^MemAvailable:/ {print $2}' /proc/meminfo)
+# Same rounding as df's Use%: used / (used + available), rounded up
+disk=$(stat -f -c '%b %f %a' / 2>/dev/null | awk '{
+  used = $1 - $2; total = used + $3
+  if (total > 0) { p = used * 100 / total; printf "%d", (p == int(p)) ? p : int(p) + 1 }
+}')
+kernel=$(cat /proc/sys/kernel/osrelease 2>/dev/null)
+nixos=$(nixos-version 2>/dev/null)
+generation=$(stat -c %Y /run/current-system 2>/dev/null)
+
+if command -v tailscale >/dev/null 2>&1; then
+  ts_state=$(tailscale status --json 2>/dev/null \
+    | sed -n 's/^ *"BackendState": *"\([^"]*\)".*/\1/p' | head -1)
+  ts_ip=""
+  if [ "$ts_state" = "Running" ]; then
+    ts_ip=$(tailscale ip -4 2>/dev/null | head -1)
+  fi
+else
+  ts_state="not installed"
+  ts_ip=""
+fi
+
+packages=""
+size_kb=""
+if [ "$full" = "full" ]; then
+  packages=$(nix-store -q --requisites /run/current-system 2>/dev/null | wc -l)
+  size_kb=$(du -sk /run/current-system 2>/dev/null | awk '{print $1}')
+fi
+
+if wait "$ping_pid"; then internet=true; else internet=false; fi
+if wait "$dns_pid"; then dns=true; else dns=false; fi
+
+printf '{"uptime_seconds":%s,"load":[%s,%s,%s],"mem_total_kb":%s,"mem_available_kb":%s,' \
+  "$(num "$uptime_s")" "$(num "$load1")" "$(num "$load5")" "$(num "$load15")" \
+  "$(num "$mem_total")" "$(num "$mem_avail")"
+printf '"disk_used_percent":%s,"kernel":%s,"nixos_version":%s,"generation_time":%s,' \
+  "$(num "$disk")" "$(str "$kernel")" "$(str "$nixos")" "$(num "$generation")"
+printf '"dns_ok":%s,"internet_ok":%s,"tailscale_state":%s,"tailscale_ip":%s,' \
+  "$dns" "$internet" "$(str "$ts_state")" "$(str "$ts_ip")"
+printf '"package_count":%s,"system_size_kb":%s}\n' "$(num "$packages")" "$(num "$size_kb")"
+"""
+
+
+def format_uptime(seconds: float) -> str:
+    """Format uptime the way ``uptime`` prints its "up" field.
+
+    Args:
+        seconds: Seconds since boot
+
+    Returns:
+        "N days" after a day, "H:MM" after an hour, "N min" before that
+    """
+    minutes = int(seconds // 60)
+    if minutes >= 24 * 60:
+        days = minutes // (24 * 60)
+        return f"{days} day" if days == 1 else f"{days} days"
+    if minutes >= 60:
+        return f"{minutes // 60}:{minutes % 60:02d}"
+    return f"{minutes} min"
+
+
+def parse_collector_output(output: str) -> Optional[Dict[str, Any]]:
+    """Convert collector JSON into HostInfo field values.
+
+    Args:
+        output: Raw stdout of the collector script
+
+    Returns:
+        Dictionary of HostInfo attribute names to values, or None if the
+        output is not a collector document
+    """
+    try:
+        data = json.loads(output)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    fields: Dict[str, Any] = {}
+
+    if data.get("uptime_seconds") is not None:
+        fields["uptime"] = format_uptime(data["uptime_seconds"])
+
+    load = data.get("load") or []
+    if len(load) >= 3 and all(value is not None for value in load[:3]):
+        fields["load_average"] = (float(load[0]), float(load[1]), float(load[2]))
+
+    mem_total = data.get("mem_total_kb")
+    mem_available = data.get("mem_available_kb")
+    if mem_total and mem_available is not None:
+        fields["memory_used_percent"] = float(
+            int((mem_total - mem_available) / mem_total * 100)
+        )
+
+    if data.get("disk_used_percent") is not None:
+        fields["disk_used_percent"] = float(data["disk_used_percent"])
+
+    if data.get("kernel"):
+        fields["kernel_version"] = data["kernel"]
+    if data.get("nixos_version"):
+        fields["nixos_version"] = data["nixos_version"]
+    if data.get("generation_time") is not None:
+        fields["system_generation_time"] = datetime.fromtimestamp(
+            int(data["generation_time"]), tz=timezone.utc
+        )
+
+    fields["dns_working"] = bool(data.get("dns_ok"))
+    fields["internet_working"] = bool(data.get("internet_ok"))
+
+    if data.get("tailscale_state"):
+        fields["tailscale_status"] = data["tailscale_state"]
+    if data.get("tailscale_ip"):
+        fields["tailscale_ip"] = data["tailscale_ip"]
+
+    if data.get("package_count") is not None:
+        fields["package_count"] = int(data["package_count"])
+    if data.get("system_size_kb") is not None:
+        fields["system_size_mb"] = data["system_size_kb"] / 1024
+
+    return fields
@@ -34,6 +34,44 @@ class TraefikConfig:
     timeout: float = 30.0
 
 
+@dataclass
+class DiscoveryConfig:
+    """Service discovery configuration."""
+
+    repo_path: str = "/home/jeremy/dotfiles"
+    cache_enabled: bool = True
+    cache_dir: str = ""  # Empty uses $XDG_CACHE_HOME/homelab-test
+
+
+@dataclass
+class HttpConfig:
+    """Shared HTTP client configuration for service probes."""
+
+    http2: bool = False
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    max_connections_per_host: int = 10
+    keepalive_expiry: float = 30.0
+    inspect_bytes: int = 16384  # Body prefix kept for error analysis, 0 for all
+
+
+@dataclass
+class ConcurrencyConfig:
+    """Concurrency limits for service probes."""
+
+    max_concurrent: int = 16
+    routing_type_limits: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class PingConfig:
+    """Reachability probe configuration."""
+
+    count: int = 3  # Samples per target
+    interval: float = 0.2  # Seconds between samples
+    tcp_refused_is_up: bool = False  # Count a refused TCP fallback as up
+
+
 @dataclass
 class HostConfig:
     """Host configuration for testing."""
@@ -43,6 +81,52 @@ class HostConfig:
     tailscale_hostname: str = ""
     skip_ping: bool = False
     skip_reason: str = ""
+    tcp_port: Optional[int] = None  # TCP fallback for hosts that drop ICMP
+
+
+@dataclass
+class WatchConfig:
+    """Scheduling for the long-running watch mode."""
+
+    interval: float = 30.0  # Seconds between cycle starts
+    jitter: float = 3.0  # Up to this many seconds are added to each wait
+    hosts: bool = False  # Also gather host stats over SSH every cycle
+    metrics_port: int = 0  # Serve Prometheus /metrics on this port, 0 to disable
+    metrics_address: str = "127.0.0.1"
+
+
+@dataclass
+class HistoryConfig:
+    """Local store of results across runs."""
+
+    enabled: bool = True
+    path: str = ""  # SQLite file, history.sqlite in the cache directory if empty
+    retention_days: float = 90.0  # Older rows are deleted, 0 keeps everything
+
+
+@dataclass
+class BaselineConfig:
+    """Latency baselines used to flag performance regressions."""
+
+    enabled: bool = True
+    alpha: float = 0.3  # Smoothing of the recent-latency EWMA
+    half_life: float = 500  # Samples until an observation counts half
+    min_samples: int = 20  # Samples before a service can be flagged
+    ratio: float = 2.0  # Flag when recent latency exceeds the median this much
+    min_increase: float = 0.1  # ...and by at least this many seconds
+
+
+@dataclass
+class BenchmarkConfig:
+    """Repeated-request latency benchmark (--benchmark)."""
+
+    requests: int = 20  # Warm requests per service
+    concurrency: int = 4  # Services benchmarked at the same time
+
+
+# How a service is probed: HEAD (falling back to GET), a GET for only the
+# inspected body prefix, or a plain GET
+PROBE_STRATEGIES = ("head", "range", "get")
 
 
 @dataclass
@@ -53,6 +137,7 @@ class DirectServiceConfig:
     url: str
     routing_type: Optional[str] = None
     timeout: Optional[float] = None
+    probe_strategy: Optional[str] = None  # head, range or get
 
 
 @dataclass
@@ -62,6 +147,56 @@ class DNSTestConfig:
     name: str
     query: str
     nameserver: str = ""
+    record_type: str = "A"
+    expected: List[str] = field(default_factory=list)  # Values that must be answered
+
+
+@dataclass
+class ErrorPatternConfig:
+    """Response body patterns identifying one error category."""
+
+    category: str
+    patterns: List[str]
+    description: str
+    case_sensitive: bool = False
+
+
+def default_error_patterns() -> List[ErrorPatternConfig]:
+    """Error patterns matching the original bash script's analysis, by priority."""
+    return [
+        ErrorPatternConfig(
+            "protocol_mismatch",
+            ["plain HTTP request was sent to HTTPS port"],
+            "HTTPS/HTTP protocol mismatch - Traefik config issue",
+            case_sensitive=True,
+        ),
+        ErrorPatternConfig(
+            "bad_gateway",
+            ["bad gateway", "502"],
+            "Bad Gateway - backend service unavailable",
+        ),
+        ErrorPatternConfig(
+            "not_found",
+            ["404", "not found"],
+            "Not Found - service not configured or offline",
+        ),
+        ErrorPatternConfig(
+            "bad_request",
+            ["400", "bad request"],
+            "Bad Request - invalid configuration",
+        ),
+        ErrorPatternConfig(
+            "service_unavailable",
+            ["503", "service unavailable"],
+            "Service Unavailable - backend down",
+        ),
+        ErrorPatternConfig(
+            "connection_refused",
+            ["connection refused"],
+            "Connection refused - backend not responding",
+        ),
+        ErrorPatternConfig("timeout", ["timeout"], "Timeout - backend too slow"),
+    ]
 
 
 @dataclass
@@ -70,15 +205,28 @@ class HomelabTestConfig:
 
     timeouts: TimeoutConfig = field(default_factory=TimeoutConfig)
     traefik: TraefikConfig = field(default_factory=TraefikConfig)
+    discovery: DiscoveryConfig = field(default_factory=DiscoveryConfig)
+    http: HttpConfig = field(default_factory=HttpConfig)
+    concurrency: ConcurrencyConfig = field(default_factory=ConcurrencyConfig)
+    ping: PingConfig = field(default_factory=PingConfig)
+    watch: WatchConfig = field(default_factory=WatchConfig)
+    history: HistoryConfig = field(default_factory=HistoryConfig)
+    baseline: BaselineConfig = field(default_factory=BaselineConfig)
+    benchmark: BenchmarkConfig = field(default_factory=BenchmarkConfig)
     hosts: List[HostConfig] = field(default_factory=list)
     direct_services: List[DirectServiceConfig] = field(default_factory=list)
     dns_tests: List[DNSTestConfig] = field(default_factory=list)
     traefik_paths: Dict[str, str] = field(default_factory=dict)
+    probe_strategies: Dict[str, str] = field(default_factory=dict)
+    error_patterns: List[ErrorPatternConfig] = field(
+        default_factory=default_error_patterns
+    )
     domain_suffix: str = "home.jeremyk.net"
     output_format: str = "rich"  # rich, json, plain
     parallel_execution: bool = True
     follow_redirects: bool = True
     verify_ssl: bool = False
+    probe_strategy: str = "get"  # Default for services without an override
 
 
 class ConfigManager:
@@ -187,6 +335,111 @@ class ConfigManager:
                 timeout=traefik_data.get("timeout", config.traefik.timeout),
             )
 
+        # Parse discovery section
+        if "discovery" in data:
+            discovery_data = data["discovery"]
+            config.discovery = DiscoveryConfig(
+                repo_path=discovery_data.get("repo_path", config.discovery.repo_path),
+                cache_enabled=discovery_data.get(
+                    "cache_enabled", config.discovery.cache_enabled
+                ),
+                cache_dir=discovery_data.get("cache_dir", config.discovery.cache_dir),
+            )
+
+        # Parse http section
+        if "http" in data:
+            http_data = data["http"]
+            config.http = HttpConfig(
+                http2=http_data.get("http2", config.http.http2),
+                max_connections=http_data.get(
+                    "max_connections", config.http.max_connections
+                ),
+                max_keepalive_connections=http_data.get(
+                    "max_keepalive_connections", config.http.max_keepalive_connections
+                ),
+                max_connections_per_host=http_data.get(
+                    "max_connections_per_host", config.http.max_connections_per_host
+                ),
+                keepalive_expiry=http_data.get(
+                    "keepalive_expiry", config.http.keepalive_expiry
+                ),
+                inspect_bytes=int(
+                    http_data.get("inspect_kb", config.http.inspect_bytes / 1024)
+                    * 1024
+                ),
+            )
+
+        # Parse concurrency section
+        if "concurrency" in data:
+            concurrency_data = data["concurrency"]
+            config.concurrency = ConcurrencyConfig(
+                max_concurrent=concurrency_data.get(
+                    "max_concurrent", config.concurrency.max_concurrent
+                ),
+                routing_type_limits=concurrency_data.get("routing_types", {}),
+            )
+
+        # Parse ping section
+        if "ping" in data:
+            ping_data = data["ping"]
+            config.ping = PingConfig(
+                count=ping_data.get("count", config.ping.count),
+                interval=ping_data.get("interval", config.ping.interval),
+                tcp_refused_is_up=ping_data.get(
+                    "tcp_refused_is_up", config.ping.tcp_refused_is_up
+                ),
+            )
+
+        # Parse watch section
+        if "watch" in data:
+            watch_data = data["watch"]
+            config.watch = WatchConfig(
+                interval=watch_data.get("interval", config.watch.interval),
+                jitter=watch_data.get("jitter", config.watch.jitter),
+                hosts=watch_data.get("hosts", config.watch.hosts),
+                metrics_port=watch_data.get("metrics_port", config.watch.metrics_port),
+                metrics_address=watch_data.get(
+                    "metrics_address", config.watch.metrics_address
+                ),
+            )
+
+        # Parse history section
+        if "history" in data:
+            history_data = data["history"]
+            config.history = HistoryConfig(
+                enabled=history_data.get("enabled", config.history.enabled),
+                path=history_data.get("path", config.history.path),
+                retention_days=history_data.get(
+                    "retention_days", config.history.retention_days
+                ),
+            )
+
+        # Parse baseline section
+        if "baseline" in data:
+            baseline_data = data["baseline"]
+            config.baseline = BaselineConfig(
+                enabled=baseline_data.get("enabled", config.baseline.enabled),
+                alpha=baseline_data.get("alpha", config.baseline.alpha),
+                half_life=baseline_data.get("half_life", config.baseline.half_life),
+                min_samples=baseline_data.get(
+                    "min_samples", config.baseline.min_samples
+                ),
+                ratio=baseline_data.get("ratio", config.baseline.ratio),
+                min_increase=baseline_data.get(
+                    "min_increase", config.baseline.min_increase
+                ),
+            )
+
+        # Parse benchmark section
+        if "benchmark" in data:
+            benchmark_data = data["benchmark"]
+            config.benchmark = BenchmarkConfig(
+                requests=benchmark_data.get("requests", config.benchmark.requests),
+                concurrency=benchmark_data.get(
+                    "concurrency", config.benchmark.concurrency
+                ),
+            )
+
         # Parse hosts section
         if "hosts" in data:
             config.hosts = []
@@ -198,6 +451,7 @@ class ConfigManager:
                         tailscale_hostname=host_data.get("tailscale_hostname", ""),
                         skip_ping=host_data.get("skip_ping", False),
                         skip_reason=host_data.get("skip_reason", ""),
+                        tcp_port=host_data.get("tcp_port"),
                     )
                 )
 
@@ -218,6 +472,9 @@ class ConfigManager:
                         url=service_data["url"],
                         routing_type=routing_type,
                         timeout=service_data.get("timeout"),
+                        probe_strategy=self._parse_probe_strategy(
+                            service_data.get("probe_strategy")
+                        ),
                     )
                 )
 
@@ -230,6 +487,23 @@ class ConfigManager:
                         name=dns_data["name"],
                         query=dns_data["query"],
                         nameserver=dns_data.get("nameserver", ""),
+                        record_type=dns_data.get("record_type", "A").upper(),
+                        expected=dns_data.get("expected", []),
+                    )
+                )
+
+        # Parse error_patterns section (replaces the defaults when present)
+        if "error_patterns" in data:
+            config.error_patterns = []
+            for pattern_data in data["error_patterns"]:
+                config.error_patterns.append(
+                    ErrorPatternConfig(
+                        category=pattern_data["category"],
+                        patterns=pattern_data["patterns"],
+                        description=pattern_data.get(
+                            "description", pattern_data["category"]
+                        ),
+                        case_sensitive=pattern_data.get("case_sensitive", False),
                     )
                 )
 
@@ -237,6 +511,13 @@ class ConfigManager:
         if "traefik_paths" in data:
             config.traefik_paths = data["traefik_paths"]
 
+        # Parse probe_strategies section
+        if "probe_strategies" in data:
+            config.probe_strategies = {
+                name: self._parse_probe_strategy(strategy)
+                for name, strategy in data["probe_strategies"].items()
+            }
+
         # Parse general settings
         config.domain_suffix = data.get("domain_suffix", config.domain_suffix)
         config.output_format = data.get("output_format", config.output_format)
@@ -245,9 +526,34 @@ class ConfigManager:
         )
         config.follow_redirects = data.get("follow_redirects", config.follow_redirects)
         config.verify_ssl = data.get("verify_ssl", config.verify_ssl)
+        config.probe_strategy = self._parse_probe_strategy(
+            data.get("probe_strategy", config.probe_strategy)
+        )
 
         return config
 
+    def _parse_probe_strategy(self, strategy: Optional[str]) -> Optional[str]:
+        """Validate a probe strategy name.
+
+        Args:
+            strategy: Strategy from the configuration file, or None
+
+        Returns:
+            Lowercased strategy name, or None if not set
+
+        Raises:
+            ConfigError: If the strategy is not one of PROBE_STRATEGIES
+        """
+        if strategy is None:
+            return None
+        strategy = strategy.lower()
+        if strategy not in PROBE_STRATEGIES:
+            raise ConfigError(
+                f"Invalid probe strategy '{strategy}', "
+                f"expected one of: {', '.join(PROBE_STRATEGIES)}"
+            )
+        return strategy
+
     def _infer_routing_type_from_url(self, url: str) -> str:
         """Infer routing type from URL using same logic as Traefik client.
 
@@ -0,0 +1,267 @@
+"""Prometheus exposition of watch results.
+
+The exporter is a listener on :class:`~homelab_test.watch.Watcher`: every
+completed cycle is rendered once into the text exposition format and cached, so
+a scrape only writes out the cached bytes and never triggers a probe. Only the
+standard library is used, to avoid a dependency on prometheus_client.
+"""
+
+import asyncio
+import bisect
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .watch import WatchSnapshot
+
+# Probe latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Histogram:
+    """Cumulative histogram for one label set."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.total += 1
+        self.sum += value
+
+
+class _Family:
+    """One metric family being rendered."""
+
+    def __init__(self, name: str, metric_type: str, help_text: str):
+        self.lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+        self.name = name
+
+    def add(self, value: Optional[float], suffix: str = "", **labels: str) -> None:
+        if value is None:
+            return
+        self.lines.append(f"{self.name}{suffix}{_labels(labels)} {_number(value)}")
+
+
+class MetricsExporter:
+    """Serve the latest watch results on ``/metrics``."""
+
+    def __init__(self, address: str = "127.0.0.1", port: int = 9469):
+        """Initialize exporter.
+
+        Args:
+            address: Address to listen on
+            port: TCP port to listen on
+        """
+        self.address = address
+        self.port = port
+        self._histograms: Dict[Tuple[str, str, str], _Histogram] = {}
+        self._cycles = 0
+        self._payload = self._render_families([])
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """Start listening for scrapes."""
+        self._server = await asyncio.start_server(
+            self._handle, self.address, self.port
+        )
+
+    async def close(self) -> None:
+        """Stop listening."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def update(self, snapshot: WatchSnapshot) -> None:
+        """Record a completed watch cycle and re-render the cached payload.
+
+        Args:
+            snapshot: Completed watch cycle
+        """
+        self._cycles += 1
+        probes = [("traefik", r) for r in snapshot.service_results] + [
+            ("direct", r) for r in snapshot.infra_result.direct_service_results
+        ]
+        current = set()
+        for kind, result in probes:
+            key = (kind, result.service_name, result.routing_type or "")
+            current.add(key)
+            if result.status_code is None:
+                # No response: the probe latency is not meaningful
+                continue
+            if key not in self._histograms:
+                self._histograms[key] = _Histogram(LATENCY_BUCKETS)
+            self._histograms[key].observe(result.response_time)
+
+        # Services no longer discovered stop being exported; a service that
+        # only failed to answer keeps its series
+        for key in self._histograms.keys() - current:
+            del self._histograms[key]
+
+        self._payload = self._render(snapshot, probes)
+
+    def _render(self, snapshot: WatchSnapshot, probes: List) -> bytes:
+        infra = snapshot.infra_result
+
+        health = _Family(
+            "homelab_health_score", "gauge", "Service health score in percent"
+        )
+        health.add(snapshot.health_score)
+
+        cycle_duration = _Family(
+            "homelab_watch_cycle_duration_seconds",
+            "gauge",
+            "Wall time of the last watch cycle",
+        )
+        cycle_duration.add(snapshot.duration)
+
+        last_cycle = _Family(
+            "homelab_watch_last_cycle_timestamp_seconds",
+            "gauge",
+            "Unix time the last watch cycle started",
+        )
+        last_cycle.add(snapshot.started_at.timestamp())
+
+        cycles = _Family(
+            "homelab_watch_cycles_total", "counter", "Watch cycles completed"
+        )
+        cycles.add(self._cycles)
+
+        up = _Family("homelab_probe_up", "gauge", "Whether the last probe succeeded")
+        status = _Family(
+            "homelab_probe_status_code", "gauge", "HTTP status of the last probe"
+        )
+        for kind, result in probes:
+            labels = {
+                "kind": kind,
+                "service": result.service_name,
+                "routing_type": result.routing_type or "",
+            }
+            up.add(1 if result.success else 0, **labels)
+            status.add(result.status_code, **labels)
+
+        latency = _Family(
+            "homelab_probe_duration_seconds", "histogram", "Probe response time"
+        )
+        for (kind, service, routing_type), histogram in sorted(
+            self._histograms.items()
+        ):
+            labels = {"kind": kind, "service": service, "routing_type": routing_type}
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                latency.add(cumulative, "_bucket", **labels, le=_number(bound))
+            latency.add(histogram.total, "_bucket", **labels, le="+Inf")
+            latency.add(histogram.sum, "_sum", **labels)
+            latency.add(histogram.total, "_count", **labels)
+
+        ping_up = _Family("homelab_ping_up", "gauge", "Whether the host answered")
+        ping_rtt = _Family(
+            "homelab_ping_rtt_seconds", "gauge", "Mean round-trip time of the last check"
+        )
+        ping_loss = _Family(
+            "homelab_ping_packet_loss_ratio", "gauge", "Share of unanswered samples"
+        )
+        for result in infra.ping_results:
+            if result.skipped:
+                continue
+            labels = {"name": result.name, "target": result.target}
+            ping_up.add(1 if result.success else 0, **labels)
+            if result.response_time is not None:
+                ping_rtt.add(result.response_time / 1000, **labels)
+            if result.packet_loss is not None:
+                ping_loss.add(result.packet_loss / 100, **labels)
+
+        dns_up = _Family("homelab_dns_up", "gauge", "Whether the DNS test passed")
+        dns_latency = _Family(
+            "homelab_dns_latency_seconds", "gauge", "Latency of the last DNS query"
+        )
+        for result in infra.dns_results:
+            labels = {
+                "name": result.name,
+                "query": result.query,
+                "record_type": result.record_type,
+            }
+            dns_up.add(1 if result.success else 0, **labels)
+            if result.response_time is not None:
+                dns_latency.add(result.response_time / 1000, **labels)
+
+        host_up = _Family("homelab_host_up", "gauge", "Whether the host is online")
+        for name, info in snapshot.hosts.items():
+            host_up.add(1 if info.online else 0, host=name)
+
+        return self._render_families(
+            [
+                health,
+                cycle_duration,
+                last_cycle,
+                cycles,
+                up,
+                status,
+                latency,
+                ping_up,
+                ping_rtt,
+                ping_loss,
+                dns_up,
+                dns_latency,
+                host_up,
+            ]
+        )
+
+    @staticmethod
+    def _render_families(families: List[_Family]) -> bytes:
+        lines = [line for family in families for line in family.lines]
+        return ("\n".join(lines) + "\n").encode() if lines else b""
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer one HTTP request from the cached payload."""
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 5.0)
+            method, path = request.split(b" ", 2)[:2]
+            if method != b"GET":
+                status, body, content_type = "405 Method Not Allowed", b"", "text/plain"
+            elif path.split(b"?", 1)[0] == b"/metrics":
+                status, body, content_type = "200 OK", self._payload, CONTENT_TYPE
+            else:
+                status, body, content_type = "404 Not Found", b"", "text/plain"
+            writer.write(
+                (
+                    f"HTTP/1.1 {status}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Date: {time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime())}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode()
+                + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, OSError):
+            pass
+        finally:
+            writer.close()
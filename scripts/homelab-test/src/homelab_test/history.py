@@ -0,0 +1,315 @@
+"""Append-only SQLite store of probe results across runs."""
+
+import math
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .infrastructure import InfrastructureTestResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    duration REAL,
+    mode TEXT NOT NULL,
+    health_score INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_ts ON runs (ts);
+
+CREATE TABLE IF NOT EXISTS service_results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    ts REAL NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    routing_type TEXT,
+    status_code INTEGER,
+    success INTEGER NOT NULL,
+    response_time REAL,
+    error_message TEXT
+);
+CREATE INDEX IF NOT EXISTS service_results_name_ts ON service_results (name, ts);
+CREATE INDEX IF NOT EXISTS service_results_ts ON service_results (ts);
+
+CREATE TABLE IF NOT EXISTS ping_results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    ts REAL NOT NULL,
+    name TEXT NOT NULL,
+    target TEXT NOT NULL,
+    method TEXT,
+    success INTEGER NOT NULL,
+    rtt REAL,
+    packet_loss REAL
+);
+CREATE INDEX IF NOT EXISTS ping_results_name_ts ON ping_results (name, ts);
+CREATE INDEX IF NOT EXISTS ping_results_ts ON ping_results (ts);
+
+CREATE TABLE IF NOT EXISTS dns_results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    ts REAL NOT NULL,
+    name TEXT NOT NULL,
+    query TEXT NOT NULL,
+    record_type TEXT,
+    success INTEGER NOT NULL,
+    latency REAL
+);
+CREATE INDEX IF NOT EXISTS dns_results_name_ts ON dns_results (name, ts);
+CREATE INDEX IF NOT EXISTS dns_results_ts ON dns_results (ts);
+"""
+
+_WINDOW_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+# Latency columns, all stored in seconds
+_LATENCY_TABLES = {
+    "service": ("service_results", "response_time"),
+    "ping": ("ping_results", "rtt"),
+    "dns": ("dns_results", "latency"),
+}
+
+
+@dataclass
+class LatencySummary:
+    """Availability and latency of one check over a time window."""
+
+    kind: str  # service, ping or dns
+    name: str
+    samples: int
+    availability: float  # Percent of successful checks
+    p50: Optional[float] = None  # Seconds, over successful checks
+    p95: Optional[float] = None
+    max: Optional[float] = None
+    last_failure: Optional[float] = None  # Unix time
+    source: str = ""  # traefik or direct for services, empty otherwise
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of pre-sorted values.
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction, e.g. 0.95
+
+    Returns:
+        The percentile, or None for no values
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(len(sorted_values) * fraction))
+    return sorted_values[rank - 1]
+
+
+def parse_window(window: str) -> float:
+    """Parse a window such as "90m", "24h" or "7d" into seconds.
+
+    Args:
+        window: Number followed by s, m, h, d or w
+
+    Returns:
+        Window length in seconds
+
+    Raises:
+        ValueError: If the window is malformed
+    """
+    window = window.strip().lower()
+    unit = _WINDOW_UNITS.get(window[-1:])
+    if unit is None:
+        raise ValueError(f"Invalid window '{window}', expected e.g. 30m, 24h or 7d")
+    try:
+        value = float(window[:-1])
+    except ValueError:
+        raise ValueError(f"Invalid window '{window}', expected e.g. 30m, 24h or 7d")
+    if not math.isfinite(value):
+        # float() accepts "nan" and "inf"
+        raise ValueError(f"Invalid window '{window}', expected e.g. 30m, 24h or 7d")
+    if value <= 0:
+        raise ValueError(f"Window must be positive: '{window}'")
+    return value * unit
+
+
+class HistoryStore:
+    """Record every run's results and summarize them over time windows.
+
+    Rows are only ever appended (apart from the optional retention cutoff),
+    and each result table is indexed by timestamp and by name so window
+    queries read only the rows they need.
+    """
+
+    def __init__(self, path: Path, retention_days: float = 0):
+        """Initialize history store.
+
+        Args:
+            path: SQLite database file, created if missing
+            retention_days: Delete rows older than this on each write, 0 to
+                keep everything
+        """
+        self.path = path
+        self.retention_days = retention_days
+        self._db: Optional[sqlite3.Connection] = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def record_run(
+        self,
+        mode: str,
+        service_results: Iterable,
+        infra_result: Optional[InfrastructureTestResult] = None,
+        health_score: Optional[int] = None,
+        duration: Optional[float] = None,
+        timestamp: Optional[float] = None,
+    ) -> int:
+        """Append one run's results.
+
+        Args:
+            mode: What produced the run, e.g. "full", "core" or "watch"
+            service_results: ServiceTestResult objects for Traefik services
+            infra_result: Ping, DNS and direct service results
+            health_score: Service health score of the run
+            duration: Run wall time in seconds
+            timestamp: Unix time of the run, now if None
+
+        Returns:
+            The new run id
+        """
+        ts = timestamp if timestamp is not None else time.time()
+        with self.db:
+            run_id = self.db.execute(
+                "INSERT INTO runs (ts, duration, mode, health_score) VALUES (?, ?, ?, ?)",
+                (ts, duration, mode, health_score),
+            ).lastrowid
+
+            services = [("traefik", r) for r in service_results]
+            if infra_result is not None:
+                services += [("direct", r) for r in infra_result.direct_service_results]
+            self.db.executemany(
+                "INSERT INTO service_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        ts,
+                        r.service_name,
+                        kind,
+                        r.routing_type,
+                        r.status_code,
+                        int(r.success),
+                        r.response_time if r.status_code is not None else None,
+                        r.error_message,
+                    )
+                    for kind, r in services
+                ],
+            )
+
+            if infra_result is not None:
+                self.db.executemany(
+                    "INSERT INTO ping_results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            run_id,
+                            ts,
+                            r.name,
+                            r.target,
+                            r.method,
+                            int(r.success),
+                            r.response_time / 1000 if r.response_time is not None else None,
+                            r.packet_loss,
+                        )
+                        for r in infra_result.ping_results
+                        if not r.skipped
+                    ],
+                )
+                self.db.executemany(
+                    "INSERT INTO dns_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            run_id,
+                            ts,
+                            r.name,
+                            r.query,
+                            r.record_type,
+                            int(r.success),
+                            r.response_time / 1000 if r.response_time is not None else None,
+                        )
+                        for r in infra_result.dns_results
+                    ],
+                )
+
+            if self.retention_days > 0:
+                self._prune(ts - self.retention_days * 86400)
+
+        return run_id
+
+    def _prune(self, cutoff: float) -> None:
+        for table, _ in _LATENCY_TABLES.values():
+            self.db.execute(f"DELETE FROM {table} WHERE ts < ?", (cutoff,))
+        self.db.execute("DELETE FROM runs WHERE ts < ?", (cutoff,))
+
+    def summarize(
+        self, since: float, kind: str = "service", name: Optional[str] = None
+    ) -> List[LatencySummary]:
+        """Summarize availability and latency per check since a point in time.
+
+        Args:
+            since: Unix time where the window starts
+            kind: service, ping or dns
+            name: Only summarize this check
+
+        Returns:
+            One LatencySummary per check, sorted by name. Traefik and direct
+            services sharing a name are summarized separately.
+        """
+        table, column = _LATENCY_TABLES[kind]
+        # Only services come from two sources that may share names
+        source = "kind" if kind == "service" else "''"
+        query = f"SELECT {source}, name, success, {column}, ts FROM {table} WHERE ts >= ?"
+        params: Tuple = (since,)
+        if name is not None:
+            query += " AND name = ?"
+            params += (name,)
+
+        rows: Dict[Tuple[str, str], List[Tuple[int, Optional[float], float]]] = {}
+        for row_source, row_name, success, latency, ts in self.db.execute(query, params):
+            rows.setdefault((row_name, row_source), []).append((success, latency, ts))
+
+        summaries = []
+        for row_name, row_source in sorted(rows):
+            checks = rows[(row_name, row_source)]
+            latencies = sorted(
+                latency for success, latency, _ in checks if success and latency is not None
+            )
+            failures = [ts for success, _, ts in checks if not success]
+            summaries.append(
+                LatencySummary(
+                    kind=kind,
+                    name=row_name,
+                    samples=len(checks),
+                    availability=100 * (len(checks) - len(failures)) / len(checks),
+                    p50=percentile(latencies, 0.50),
+                    p95=percentile(latencies, 0.95),
+                    max=latencies[-1] if latencies else None,
+                    last_failure=max(failures) if failures else None,
+                    source=row_source,
+                )
+            )
+        return summaries
+
+    def run_count(self, since: float) -> int:
+        """Count runs recorded since a point in time."""
+        return self.db.execute(
+            "SELECT COUNT(*) FROM runs WHERE ts >= ?", (since,)
+        ).fetchone()[0]
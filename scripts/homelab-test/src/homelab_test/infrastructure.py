@@ -1,10 +1,11 @@
 """Infrastructure testing for network connectivity, DNS, and core services."""
 
 import asyncio
-import re
 from dataclasses import dataclass
 from typing import Dict, List, Optional
-import httpx
+
+from .reachability import ReachabilityEngine
+from .resolver import DNSError, DNSResolver
 
 
 @dataclass
@@ -14,10 +15,16 @@ class PingTestResult:
     name: str
     target: str
     success: bool = False
-    response_time: Optional[float] = None
+    response_time: Optional[float] = None  # Mean RTT in milliseconds
     error_message: str = ""
     skipped: bool = False
     skip_reason: str = ""
+    tcp_port: Optional[int] = None
+    method: str = "icmp"  # icmp or tcp
+    rtt_min: Optional[float] = None
+    rtt_max: Optional[float] = None
+    jitter: Optional[float] = None
+    packet_loss: Optional[float] = None  # Percent
 
 
 @dataclass
@@ -29,12 +36,20 @@ class DNSTestResult:
     nameserver: Optional[str] = None
     success: bool = False
     resolved_ips: List[str] = None
-    response_time: Optional[float] = None
+    response_time: Optional[float] = None  # Milliseconds
     error_message: str = ""
+    record_type: str = "A"
+    expected: List[str] = None
+    answers: List[str] = None  # Values of record_type answers
+    transport: str = "udp"
 
     def __post_init__(self):
         if self.resolved_ips is None:
             self.resolved_ips = []
+        if self.expected is None:
+            self.expected = []
+        if self.answers is None:
+            self.answers = []
 
 
 @dataclass
@@ -57,13 +72,26 @@ class InfrastructureTestResult:
 class InfrastructureTester:
     """Test core infrastructure components."""
 
-    def __init__(self, timeout: float = 5.0):
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        reachability: Optional[ReachabilityEngine] = None,
+        service_tester=None,
+        dns_timeout: Optional[float] = None,
+    ):
         """Initialize infrastructure tester.
 
         Args:
             timeout: Default timeout for tests in seconds
+            reachability: Engine for ping tests, single ICMP sample if None
+            service_tester: ServiceTester whose pooled client probes direct
+                services; a temporary one is used if None
+            dns_timeout: Timeout of each DNS query, ``timeout`` if None
         """
         self.timeout = timeout
+        self.dns_timeout = dns_timeout if dns_timeout is not None else timeout
+        self.reachability = reachability or ReachabilityEngine(timeout=3.0)
+        self.service_tester = service_tester
 
     async def test_all_infrastructure(self, config) -> InfrastructureTestResult:
         """Run comprehensive infrastructure tests.
@@ -108,18 +136,23 @@ class InfrastructureTester:
                     host.ip_address,
                     skipped=host.skip_ping,
                     skip_reason=host.skip_reason,
+                    tcp_port=host.tcp_port,
                 )
             )
 
             # Add Tailscale test if hostname provided
             if host.tailscale_hostname:
                 ping_tests.append(
-                    PingTestResult(f"{host.name} TS", host.tailscale_hostname)
+                    PingTestResult(
+                        f"{host.name} TS",
+                        host.tailscale_hostname,
+                        tcp_port=host.tcp_port,
+                    )
                 )
 
-        # Run ping tests concurrently
+        # Run ping tests concurrently from this event loop
         tasks = [self._ping_test(test) for test in ping_tests if not test.skipped]
-        results = await asyncio.gather(*tasks)
+        results = list(await asyncio.gather(*tasks))
 
         # Add skipped tests back to results
         skipped_tests = [test for test in ping_tests if test.skipped]
@@ -135,35 +168,20 @@ class InfrastructureTester:
             Updated PingTestResult with test results
         """
         try:
-            process = await asyncio.create_subprocess_exec(
-                "ping",
-                "-c",
-                "1",
-                "-W",
-                "3",
-                test.target,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=self.timeout
-            )
+            probe = await self.reachability.probe(test.target, tcp_port=test.tcp_port)
 
-            if process.returncode == 0:
+            test.method = probe.method
+            test.packet_loss = probe.packet_loss
+            if probe.reachable:
                 test.success = True
-                # Extract ping time from output if available
-                output = stdout.decode()
-                time_match = re.search(r"time=(\d+\.?\d*)", output)
-                if time_match:
-                    test.response_time = float(time_match.group(1))
+                test.response_time = probe.rtt_avg
+                test.rtt_min = probe.rtt_min
+                test.rtt_max = probe.rtt_max
+                test.jitter = probe.jitter
             else:
                 test.success = False
-                test.error_message = "Unreachable"
+                test.error_message = probe.error_message or "Unreachable"
 
-        except asyncio.TimeoutError:
-            test.success = False
-            test.error_message = "Timeout"
         except Exception as e:
             test.success = False
             test.error_message = f"Error: {str(e)}"
@@ -188,62 +206,59 @@ class InfrastructureTester:
                     nameserver=(
                         test_config.nameserver if test_config.nameserver else None
                     ),
+                    record_type=test_config.record_type,
+                    expected=list(test_config.expected),
                 )
             )
 
-        # Run DNS tests concurrently
-        tasks = [self._dns_test(test) for test in test_objects]
-        return await asyncio.gather(*tasks)
+        # Run DNS tests concurrently, sharing one resolver socket
+        async with DNSResolver(timeout=self.dns_timeout) as resolver:
+            tasks = [self._dns_test(test, resolver) for test in test_objects]
+            return await asyncio.gather(*tasks)
 
-    async def _dns_test(self, test: DNSTestResult) -> DNSTestResult:
+    async def _dns_test(
+        self, test: DNSTestResult, resolver: DNSResolver
+    ) -> DNSTestResult:
         """Execute a single DNS resolution test.
 
         Args:
             test: DNSTestResult object with query information
+            resolver: Resolver used for the query
 
         Returns:
             Updated DNSTestResult with test results
         """
         try:
-            # Build dig command
-            cmd = ["dig", test.query, "+short", "+timeout=3"]
-            if test.nameserver:
-                cmd.extend([f"@{test.nameserver}"])
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-            )
-
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=self.timeout
+            response = await resolver.query(
+                test.query, test.record_type, nameserver=test.nameserver
             )
+            test.response_time = response.latency
+            test.transport = response.transport
+            test.answers = response.answers(test.record_type)
+            test.resolved_ips = response.answers("A") + response.answers("AAAA")
 
-            if process.returncode == 0:
-                output = stdout.decode().strip()
-                if output:
-                    # Parse resolved IPs
-                    lines = output.split("\n")
-                    ip_pattern = re.compile(r"^\d+\.\d+\.\d+\.\d+$")
-                    ips = [
-                        line.strip() for line in lines if ip_pattern.match(line.strip())
-                    ]
-
-                    if ips:
-                        test.success = True
-                        test.resolved_ips = ips
-                    else:
-                        test.success = False
-                        test.error_message = "No IP addresses resolved"
-                else:
-                    test.success = False
-                    test.error_message = "Empty response"
-            else:
+            if response.rcode != "NOERROR":
                 test.success = False
-                test.error_message = "DNS query failed"
+                test.error_message = response.rcode
+            elif not test.answers:
+                test.success = False
+                test.error_message = f"No {test.record_type} records"
+            else:
+                answered = {_normalize_answer(value) for value in test.answers}
+                missing = [
+                    value
+                    for value in test.expected
+                    if _normalize_answer(value) not in answered
+                ]
+                if missing:
+                    test.success = False
+                    test.error_message = f"Missing expected: {', '.join(missing)}"
+                else:
+                    test.success = True
 
-        except asyncio.TimeoutError:
+        except DNSError as e:
             test.success = False
-            test.error_message = "Timeout"
+            test.error_message = str(e)
         except Exception as e:
             test.success = False
             test.error_message = f"Error: {str(e)}"
@@ -260,61 +275,49 @@ class InfrastructureTester:
             List of ServiceTestResult objects from direct service tests
         """
         # Import here to avoid circular imports
-        from .services import ServiceTestResult
+        from .services import ServiceTester
 
-        services = [
-            (service.name, service.url, service.routing_type)
-            for service in direct_services
-        ]
+        if self.service_tester is not None:
+            return await self._probe_direct_services(
+                self.service_tester, direct_services
+            )
 
-        results = []
-        for service_name, url, routing_type in services:
-            try:
-                start_time = asyncio.get_event_loop().time()
-
-                async with httpx.AsyncClient(
-                    timeout=self.timeout, follow_redirects=True, verify=False
-                ) as client:
-                    response = await client.get(url)
-
-                    response_time = asyncio.get_event_loop().time() - start_time
-
-                    result = ServiceTestResult(
-                        service_name=service_name,
-                        url=url,
-                        routing_type=routing_type,
-                        status_code=response.status_code,
-                        response_size=len(response.content),
-                        response_time=response_time,
-                        redirect_count=len(response.history),
-                        success=200 <= response.status_code < 400,
-                    )
+        async with ServiceTester(timeout=self.timeout) as service_tester:
+            return await self._probe_direct_services(service_tester, direct_services)
 
-                    if not result.success:
-                        result.error_message = f"HTTP {response.status_code}"
+    async def _probe_direct_services(self, service_tester, direct_services: List) -> List:
+        """Probe all direct services concurrently through one client.
 
-                    results.append(result)
+        Args:
+            service_tester: ServiceTester providing the pooled client
+            direct_services: List of DirectServiceConfig objects
+
+        Returns:
+            List of ServiceTestResult objects, in configuration order
+        """
+        tasks = [
+            service_tester.scheduler.submit(
+                service.routing_type or "direct",
+                lambda service=service: service_tester.test_url(
+                    service.name,
+                    service.url,
+                    service.routing_type,
+                    timeout=(
+                        service.timeout
+                        if service.timeout is not None
+                        else self.timeout
+                    ),
+                    strategy=service.probe_strategy,
+                ),
+            )
+            for service in direct_services
+        ]
+        return list(await asyncio.gather(*tasks))
 
-            except httpx.TimeoutException:
-                results.append(
-                    ServiceTestResult(
-                        service_name=service_name,
-                        url=url,
-                        routing_type=routing_type,
-                        error_message="Connection timeout",
-                    )
-                )
-            except Exception as e:
-                results.append(
-                    ServiceTestResult(
-                        service_name=service_name,
-                        url=url,
-                        routing_type=routing_type,
-                        error_message=f"Error: {str(e)}",
-                    )
-                )
 
-        return results
+def _normalize_answer(value: str) -> str:
+    """Compare names case-insensitively and without the trailing dot."""
+    return value.strip().rstrip(".").lower()
 
 
 class NetworkAnalyzer:
@@ -0,0 +1,277 @@
+"""In-process host reachability checks over ICMP with a TCP fallback.
+
+Echo requests are sent from unprivileged ICMP datagram sockets
+(``SOCK_DGRAM``/``IPPROTO_ICMP``), which Linux allows for groups listed in
+``net.ipv4.ping_group_range`` (NixOS allows all groups by default). Every target
+is probed from the same event loop instead of forking a ``ping`` process each.
+
+Hosts that drop ICMP can be checked with a TCP connect instead. A completed
+handshake proves the host is up. A refused connection only counts when
+``tcp_refused_is_up`` is set: the reset may come from a firewall or
+middlebox answering for a host that is down, and userspace cannot tell the
+two apart.
+"""
+
+import asyncio
+import itertools
+import socket
+import statistics
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+
+# Ports tried concurrently when no TCP port is configured for a target
+DEFAULT_TCP_PORTS = (443, 80, 22, 53)
+
+_sequence = itertools.count(1)
+
+
+@dataclass
+class ReachabilityResult:
+    """Outcome of probing one target with one or more samples."""
+
+    target: str
+    address: str = ""
+    method: str = "icmp"  # icmp or tcp
+    sent: int = 0
+    rtts: List[float] = field(default_factory=list)  # Milliseconds, per reply
+    error_message: str = ""
+
+    @property
+    def reachable(self) -> bool:
+        return bool(self.rtts)
+
+    @property
+    def packet_loss(self) -> float:
+        """Percentage of samples without a reply."""
+        if not self.sent:
+            return 100.0
+        return (self.sent - len(self.rtts)) * 100 / self.sent
+
+    @property
+    def rtt_min(self) -> Optional[float]:
+        return min(self.rtts) if self.rtts else None
+
+    @property
+    def rtt_avg(self) -> Optional[float]:
+        return statistics.fmean(self.rtts) if self.rtts else None
+
+    @property
+    def rtt_max(self) -> Optional[float]:
+        return max(self.rtts) if self.rtts else None
+
+    @property
+    def jitter(self) -> Optional[float]:
+        """Mean absolute difference between consecutive RTTs."""
+        if len(self.rtts) < 2:
+            return None
+        return statistics.fmean(abs(b - a) for a, b in zip(self.rtts, self.rtts[1:]))
+
+
+def _checksum(data: bytes) -> int:
+    """Internet checksum (RFC 1071)."""
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _echo_request(sequence: int) -> bytes:
+    """Build an ICMP echo request; the kernel sets the identifier."""
+    payload = struct.pack("!d", time.time()) + b"homelab-test"
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, 0, sequence)
+    checksum = _checksum(header + payload)
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, checksum, 0, sequence)
+    return header + payload
+
+
+class ReachabilityEngine:
+    """Probe many hosts concurrently from a single event loop."""
+
+    def __init__(
+        self,
+        count: int = 1,
+        interval: float = 0.2,
+        timeout: float = 3.0,
+        tcp_refused_is_up: bool = False,
+    ):
+        """Initialize reachability engine.
+
+        Args:
+            count: Samples sent per target
+            interval: Seconds between samples to the same target
+            timeout: Seconds to wait for each reply
+            tcp_refused_is_up: Count a refused TCP connection as a reply
+        """
+        self.count = max(1, count)
+        self.interval = interval
+        self.timeout = timeout
+        self.tcp_refused_is_up = tcp_refused_is_up
+        self._icmp_available: Optional[bool] = None
+
+    async def probe(
+        self,
+        target: str,
+        tcp_port: Optional[int] = None,
+        icmp: bool = True,
+    ) -> ReachabilityResult:
+        """Probe a target, falling back to TCP when ICMP gets no answer.
+
+        TCP is used when ICMP is disabled for the target, when unprivileged
+        ICMP sockets are not permitted, or when a ``tcp_port`` is configured
+        and every echo request went unanswered.
+
+        Args:
+            target: Hostname or IPv4 address
+            tcp_port: Port for the TCP fallback, common ports if None
+            icmp: Whether to try ICMP first
+
+        Returns:
+            ReachabilityResult with per-sample RTTs
+        """
+        result = ReachabilityResult(target=target)
+        loop = asyncio.get_running_loop()
+
+        try:
+            infos = await asyncio.wait_for(
+                loop.getaddrinfo(target, None, family=socket.AF_INET),
+                timeout=self.timeout,
+            )
+            result.address = infos[0][4][0]
+        except (OSError, asyncio.TimeoutError):
+            result.error_message = "DNS lookup failed"
+            return result
+
+        if icmp and self._icmp_available is not False:
+            await self._probe_icmp(result)
+            if result.reachable or (tcp_port is None and self._icmp_available):
+                return result
+
+        ports = (tcp_port,) if tcp_port else DEFAULT_TCP_PORTS
+        fallback = ReachabilityResult(
+            target=target, address=result.address, method="tcp"
+        )
+        await self._probe_tcp(fallback, ports)
+        return fallback
+
+    async def probe_many(
+        self, targets: Sequence[str], tcp_ports: Optional[Sequence[Optional[int]]] = None
+    ) -> List[ReachabilityResult]:
+        """Probe several targets concurrently.
+
+        Args:
+            targets: Hostnames or IPv4 addresses
+            tcp_ports: Optional TCP fallback port per target
+
+        Returns:
+            Results in the order of ``targets``
+        """
+        ports = tcp_ports or [None] * len(targets)
+        return await asyncio.gather(
+            *(self.probe(target, port) for target, port in zip(targets, ports))
+        )
+
+    async def _probe_icmp(self, result: ReachabilityResult) -> None:
+        """Send echo requests over an unprivileged ICMP socket."""
+        loop = asyncio.get_running_loop()
+        try:
+            sock = socket.socket(
+                socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP
+            )
+        except (PermissionError, OSError):
+            # Not in net.ipv4.ping_group_range; only TCP checks are possible
+            self._icmp_available = False
+            return
+        self._icmp_available = True
+
+        with sock:
+            sock.setblocking(False)
+            try:
+                sock.connect((result.address, 0))
+            except OSError:
+                result.error_message = "Unreachable"
+                return
+
+            for sample in range(self.count):
+                if sample:
+                    await asyncio.sleep(self.interval)
+                sequence = next(_sequence) & 0xFFFF
+                result.sent += 1
+                started = time.perf_counter()
+                try:
+                    await loop.sock_sendall(sock, _echo_request(sequence))
+                    await asyncio.wait_for(
+                        self._await_reply(sock, sequence), timeout=self.timeout
+                    )
+                    result.rtts.append((time.perf_counter() - started) * 1000)
+                except asyncio.TimeoutError:
+                    result.error_message = "Timeout"
+                except OSError:
+                    # e.g. ICMP host unreachable reported on the socket
+                    result.error_message = "Unreachable"
+
+        if result.reachable:
+            result.error_message = ""
+
+    async def _await_reply(self, sock: socket.socket, sequence: int) -> None:
+        """Wait for the echo reply carrying ``sequence``."""
+        loop = asyncio.get_running_loop()
+        while True:
+            packet = await loop.sock_recv(sock, 1024)
+            # Datagram ICMP sockets deliver the ICMP message without IP header
+            if len(packet) >= 8:
+                icmp_type, _, _, _, reply_sequence = struct.unpack("!BBHHH", packet[:8])
+                if icmp_type == ICMP_ECHO_REPLY and reply_sequence == sequence:
+                    return
+
+    async def _probe_tcp(
+        self, result: ReachabilityResult, ports: Sequence[int]
+    ) -> None:
+        """Time TCP handshakes, trying all candidate ports concurrently."""
+        for sample in range(self.count):
+            if sample:
+                await asyncio.sleep(self.interval)
+            result.sent += 1
+            rtt = await self._tcp_sample(result.address, ports)
+            if rtt is not None:
+                result.rtts.append(rtt)
+
+        if not result.reachable:
+            result.error_message = "Timeout"
+
+    async def _tcp_sample(self, address: str, ports: Sequence[int]) -> Optional[float]:
+        """Return the RTT of the first port to answer, or None."""
+
+        async def connect(port: int) -> Optional[float]:
+            started = time.perf_counter()
+            try:
+                _, writer = await asyncio.open_connection(address, port)
+            except ConnectionRefusedError:
+                # The reset may come from a firewall rather than the host
+                if self.tcp_refused_is_up:
+                    return (time.perf_counter() - started) * 1000
+                return None
+            except OSError:
+                return None
+            rtt = (time.perf_counter() - started) * 1000
+            writer.close()
+            return rtt
+
+        tasks = [asyncio.create_task(connect(port)) for port in ports]
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=self.timeout):
+                rtt = await next_done
+                if rtt is not None:
+                    return rtt
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+        return None
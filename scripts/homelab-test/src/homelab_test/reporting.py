@@ -1,6 +1,6 @@
 """Rich console reporting for beautiful test output."""
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -19,6 +19,11 @@ from .infrastructure import (
     InfrastructureTestResult,
     NetworkAnalyzer,
 )
+from .baseline import LatencyRegression
+from .benchmark import BenchmarkResult
+from .history import LatencySummary
+from .timing import StageTimer
+from .watch import WatchSnapshot
 
 
 class RichReporter:
@@ -99,6 +104,12 @@ class RichReporter:
                     response_time = (
                         f"{result.response_time:.1f}ms" if result.response_time else "-"
                     )
+                    if result.jitter is not None:
+                        response_time += f" ±{result.jitter:.1f}"
+                    if result.packet_loss:
+                        response_time += f" [yellow]{result.packet_loss:.0f}% loss[/yellow]"
+                    if result.method == "tcp":
+                        response_time += " [dim](tcp)[/dim]"
                 else:
                     status = f"[red]❌ {result.error_message}[/red]"
                     response_time = "-"
@@ -114,7 +125,8 @@ class RichReporter:
             )
             dns_table.add_column("Name", style="white")
             dns_table.add_column("Status")
-            dns_table.add_column("Resolved IPs")
+            dns_table.add_column("Answers")
+            dns_table.add_column("Latency", justify="right")
             dns_table.add_column("Query", style="dim", no_wrap=True)
 
             for result in infra_result.dns_results:
@@ -125,17 +137,25 @@ class RichReporter:
 
                 if result.success:
                     status = "[green]✅ OK[/green]"
-                    ips = ", ".join(result.resolved_ips) if result.resolved_ips else "-"
                 else:
                     status = f"[red]❌ {result.error_message}[/red]"
-                    ips = "-"
+                answers = ", ".join(result.answers) if result.answers else "-"
+                latency = (
+                    f"{result.response_time:.2f}ms"
+                    if result.response_time is not None
+                    else "-"
+                )
+                if result.transport == "tcp":
+                    latency += " [dim](tcp)[/dim]"
 
-                # Show nameserver if specified
+                # Show record type and nameserver if not the defaults
                 query_display = result.query
+                if result.record_type != "A":
+                    query_display = f"{query_display} {result.record_type}"
                 if result.nameserver:
-                    query_display = f"{result.query} @{result.nameserver}"
+                    query_display = f"{query_display} @{result.nameserver}"
 
-                dns_table.add_row(name, status, ips, query_display)
+                dns_table.add_row(name, status, answers, latency, query_display)
 
             tables.append(dns_table)
 
@@ -197,11 +217,16 @@ class RichReporter:
             self.console.print(infrastructure_panel)
             self.console.print()
 
-    def show_service_results(self, results: List[ServiceTestResult]):
+    def show_service_results(
+        self,
+        results: List[ServiceTestResult],
+        benchmarks: Optional[List[BenchmarkResult]] = None,
+    ):
         """Display service test results in a rich table.
 
         Args:
             results: List of service test results
+            benchmarks: Benchmark results, shown in an extra table if given
         """
         if not results:
             self.console.print("[yellow]No services found to test[/yellow]")
@@ -221,6 +246,8 @@ class RichReporter:
             if result.success:
                 status = "[green]✅ OK[/green]"
                 response = f"{result.status_code} ({result.response_time*1000:.0f}ms)"
+                if result.handshake_time:
+                    response += f" [dim]hs {result.handshake_time*1000:.0f}ms[/dim]"
             else:
                 status = f"[red]❌ {result.error_message}[/red]"
                 response = result.error_detail if result.error_detail else "-"
@@ -262,17 +289,70 @@ class RichReporter:
         )
         self.console.print()
 
+        if benchmarks:
+            self._show_benchmarks(benchmarks)
+
+    def _show_benchmarks(self, benchmarks: List[BenchmarkResult]):
+        """Display latency percentiles and phases per benchmarked service."""
+        requests = max(b.requests for b in benchmarks)
+        table = Table(
+            title=f"Benchmark ({requests} warm requests per service)",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Service", style="white")
+        for column in ("Min", "p50", "p95", "p99", "Max"):
+            table.add_column(column, justify="right")
+        for column in ("DNS", "Connect", "TLS", "TTFB", "Transfer"):
+            table.add_column(column, justify="right", style="dim")
+
+        def ms(seconds) -> str:
+            return f"{seconds * 1000:.1f}" if seconds is not None else "-"
+
+        for benchmark in sorted(benchmarks, key=lambda b: b.service_name):
+            notes = [f"[dim]{benchmark.http_version} {benchmark.method}[/dim]"]
+            if benchmark.failures:
+                notes.append(f"[red]{benchmark.failures} errors[/red]")
+            if benchmark.reconnects:
+                notes.append(f"[yellow]{benchmark.reconnects} reconnects[/yellow]")
+            if benchmark.error_message:
+                notes = [f"[red]{benchmark.error_message}[/red]"]
+
+            table.add_row(
+                f"{benchmark.service_name}\n" + " ".join(notes),
+                ms(benchmark.min),
+                f"[bold]{ms(benchmark.p50)}[/bold]",
+                ms(benchmark.p95),
+                ms(benchmark.p99),
+                ms(benchmark.max),
+                ms(benchmark.dns_time),
+                ms(benchmark.connect_time),
+                ms(benchmark.tls_time),
+                ms(benchmark.ttfb),
+                ms(benchmark.transfer_time),
+            )
+
+        table.caption = (
+            "All times in ms. DNS, connect and TLS are from the first connection; "
+            "TTFB and transfer are medians"
+        )
+        self.console.print(table)
+        self.console.print()
+
     def show_analysis(
         self,
         service_results: List[ServiceTestResult],
         infra_result: InfrastructureTestResult,
+        regressions: Optional[List[LatencyRegression]] = None,
     ):
         """Display comprehensive analysis and health metrics.
 
         Args:
             service_results: Service test results
             infra_result: Infrastructure test results
+            regressions: Services responding well above their latency baseline
         """
+        regressions = regressions or []
         # Generate comprehensive summary including infrastructure
         service_summary = self.service_reporter.generate_summary(service_results)
         overall_summary = self._generate_overall_summary(service_results, infra_result)
@@ -396,6 +476,22 @@ class RichReporter:
                 )
             details_content.append("")
 
+        # Latency regressions against the per-service baselines
+        if regressions:
+            details_content.append("[bold yellow]🐢 Slower Than Usual:[/bold yellow]")
+            for regression in regressions[:5]:  # Show first 5
+                color = "red" if regression.severity == "critical" else "yellow"
+                details_content.append(
+                    f"  • {regression.service_name} - "
+                    f"[{color}]{self._format_latency(regression.recent)}[/{color}] "
+                    f"vs usual {self._format_latency(regression.baseline_p50)} "
+                    f"({regression.ratio:.1f}x, p95 "
+                    f"{self._format_latency(regression.baseline_p95)})"
+                )
+            if len(regressions) > 5:
+                details_content.append(f"  • ... and {len(regressions) - 5} more")
+            details_content.append("")
+
         # Network analysis
         network_analysis = self.network_analyzer.analyze_network_layers(infra_result)
         if network_analysis["network_healthy"]:
@@ -414,6 +510,7 @@ class RichReporter:
             not network_analysis["network_healthy"]
             or categories["failed"]
             or categories["timeout"]
+            or regressions
         ):
             details_content.append("")
             details_content.append("[bold]🔧 Recommendations:[/bold]")
@@ -444,6 +541,11 @@ class RichReporter:
                     "  • Consider increasing timeout values for slow services"
                 )
 
+            if regressions:
+                details_content.append(
+                    "  • Check load and recent changes on services slower than usual"
+                )
+
         details_panel = Panel(
             (
                 "\n".join(details_content)
@@ -463,6 +565,153 @@ class RichReporter:
         )
         self.console.print()
 
+    def show_stage_timings(self, timer: StageTimer):
+        """Show when each stage ran and which ones bound the total run time.
+
+        Args:
+            timer: StageTimer populated during the run
+        """
+        if not timer.stages:
+            return
+
+        critical = {stage.name for stage in timer.critical_path()}
+        table = Table(title="Stage Timings", show_header=True, header_style="bold cyan")
+        table.add_column("Stage", style="white")
+        table.add_column("Start", justify="right")
+        table.add_column("End", justify="right")
+        table.add_column("Duration", justify="right")
+        table.add_column("Critical Path", justify="center")
+
+        for stage in timer.stages.values():
+            end = f"{stage.end:.2f}s" if stage.end is not None else "-"
+            table.add_row(
+                stage.name.capitalize(),
+                f"{stage.start:.2f}s",
+                end,
+                f"{stage.duration:.2f}s",
+                "[yellow]●[/yellow]" if stage.name in critical else "",
+            )
+
+        serial_time = sum(stage.duration for stage in timer.stages.values())
+        table.caption = (
+            f"Wall time {timer.wall_time:.2f}s "
+            f"(stages sum to {serial_time:.2f}s)"
+        )
+        self.console.print(table)
+        self.console.print()
+
+    def show_history(
+        self, summaries: List[LatencySummary], window: str, run_count: int
+    ):
+        """Show availability and latency percentiles per check over a window.
+
+        Args:
+            summaries: Summaries of services, ping targets and DNS tests
+            window: Window as given on the command line, e.g. "24h"
+            run_count: Runs recorded within the window
+        """
+        if not summaries:
+            self.console.print(f"[yellow]No results recorded in the last {window}[/yellow]")
+            return
+
+        titles = {"service": "Services", "ping": "Ping", "dns": "DNS"}
+        for kind, title in titles.items():
+            rows = [s for s in summaries if s.kind == kind]
+            if not rows:
+                continue
+
+            table = Table(
+                title=f"{title} - last {window}",
+                show_header=True,
+                header_style="bold cyan",
+            )
+            table.add_column("Name", style="white")
+            if kind == "service":
+                table.add_column("Via", style="dim")
+            table.add_column("Availability", justify="right")
+            table.add_column("p50", justify="right")
+            table.add_column("p95", justify="right")
+            table.add_column("Max", justify="right")
+            table.add_column("Samples", justify="right", style="dim")
+            table.add_column("Last Failure", style="dim")
+
+            for summary in rows:
+                availability = summary.availability
+                color = (
+                    "green"
+                    if availability >= 99
+                    else "yellow" if availability >= 90 else "red"
+                )
+                last_failure = (
+                    datetime.fromtimestamp(summary.last_failure).strftime(
+                        "%Y-%m-%d %H:%M"
+                    )
+                    if summary.last_failure is not None
+                    else "-"
+                )
+                via = [summary.source] if kind == "service" else []
+                table.add_row(
+                    summary.name,
+                    *via,
+                    f"[{color}]{availability:.1f}%[/{color}]",
+                    self._format_latency(summary.p50),
+                    self._format_latency(summary.p95),
+                    self._format_latency(summary.max),
+                    str(summary.samples),
+                    last_failure,
+                )
+
+            self.console.print(table)
+            self.console.print()
+
+        self.console.print(f"[dim]{run_count} runs in the last {window}[/dim]")
+
+    @staticmethod
+    def _format_latency(seconds) -> str:
+        if seconds is None:
+            return "-"
+        if seconds < 1:
+            return f"{seconds * 1000:.0f}ms"
+        return f"{seconds:.2f}s"
+
+    def show_watch_cycle(self, snapshot: WatchSnapshot):
+        """Print a one-line summary of a watch cycle.
+
+        Args:
+            snapshot: Completed watch cycle
+        """
+        results = snapshot.service_results
+        infra = snapshot.infra_result
+        failed = [r.service_name for r in results if not r.success]
+        failed += [r.name for r in infra.ping_results if not r.success and not r.skipped]
+        failed += [r.name for r in infra.dns_results if not r.success]
+        failed += [
+            r.service_name for r in infra.direct_service_results if not r.success
+        ]
+        failed += [name for name, info in snapshot.hosts.items() if not info.online]
+
+        score = snapshot.health_score
+        color = "green" if score >= 90 else "yellow" if score >= 70 else "red"
+        working = len(results) - sum(1 for r in results if not r.success)
+        line = (
+            f"[dim]{snapshot.started_at.astimezone().strftime('%H:%M:%S')}[/dim] "
+            f"#{snapshot.cycle} [{color}]{score}%[/{color}] "
+            f"{working}/{len(results)} services "
+            f"[dim]{snapshot.duration:.2f}s[/dim]"
+        )
+        if snapshot.rediscovered:
+            line += " [blue]rediscovered[/blue]"
+        if snapshot.discovery_error:
+            line += f" [yellow]discovery failed: {snapshot.discovery_error}[/yellow]"
+        if snapshot.regressions:
+            slower = ", ".join(r.service_name for r in snapshot.regressions)
+            line += f" [yellow]slower than usual: {slower}[/yellow]"
+        if failed:
+            shown = ", ".join(failed[:5])
+            more = f" +{len(failed) - 5}" if len(failed) > 5 else ""
+            line += f" [red]❌ {shown}{more}[/red]"
+        self.console.print(line)
+
     def show_completion(self, success: bool):
         """Show test completion status.
 
@@ -509,6 +758,7 @@ class RichReporter:
         service_results: List[ServiceTestResult],
         infra_result: InfrastructureTestResult,
         output_file: str,
+        regressions: Optional[List[LatencyRegression]] = None,
     ):
         """Export test results to JSON file.
 
@@ -516,6 +766,7 @@ class RichReporter:
             service_results: Service test results
             infra_result: Infrastructure test results
             output_file: Output file path
+            regressions: Services responding well above their latency baseline
         """
         import json
         from datetime import datetime
@@ -532,10 +783,14 @@ class RichReporter:
                     "status_code": r.status_code,
                     "response_size": r.response_size,
                     "response_time": r.response_time,
+                    "handshake_time": r.handshake_time,
+                    "transfer_time": r.transfer_time,
                     "redirect_count": r.redirect_count,
                     "success": r.success,
                     "error_message": r.error_message,
                     "error_detail": r.error_detail,
+                    "error_category": r.error_category,
+                    "probe_method": r.probe_method,
                 }
                 for r in service_results
             ],
@@ -546,6 +801,11 @@ class RichReporter:
                         "target": r.target,
                         "success": r.success,
                         "response_time": r.response_time,
+                        "method": r.method,
+                        "rtt_min": r.rtt_min,
+                        "rtt_max": r.rtt_max,
+                        "jitter": r.jitter,
+                        "packet_loss": r.packet_loss,
                         "error_message": r.error_message,
                         "skipped": r.skipped,
                         "skip_reason": r.skip_reason,
@@ -557,8 +817,13 @@ class RichReporter:
                         "name": r.name,
                         "query": r.query,
                         "nameserver": r.nameserver,
+                        "record_type": r.record_type,
                         "success": r.success,
                         "resolved_ips": r.resolved_ips,
+                        "answers": r.answers,
+                        "expected": r.expected,
+                        "response_time": r.response_time,
+                        "transport": r.transport,
                         "error_message": r.error_message,
                     }
                     for r in infra_result.dns_results
@@ -567,6 +832,7 @@ class RichReporter:
             "network_analysis": self.network_analyzer.analyze_network_layers(
                 infra_result
             ),
+            "regressions": [r.to_dict() for r in regressions or []],
         }
 
         with open(output_file, "w") as f:
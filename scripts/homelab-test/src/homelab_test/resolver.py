@@ -0,0 +1,393 @@
+"""In-process asynchronous DNS resolver.
+
+Queries are encoded and decoded here (RFC 1035) and sent from a single UDP
+socket shared by every query in flight, so a batch of DNS tests costs one socket
+instead of a ``dig`` process each. Replies are matched to queries by transaction
+id and nameserver address. Unanswered UDP queries are retransmitted within the
+timeout, and a truncated UDP reply is retried over TCP.
+"""
+
+import asyncio
+import ipaddress
+import random
+import socket
+import struct
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DNS_PORT = 53
+
+RECORD_TYPES = {
+    "A": 1,
+    "NS": 2,
+    "CNAME": 5,
+    "SOA": 6,
+    "PTR": 12,
+    "MX": 15,
+    "TXT": 16,
+    "AAAA": 28,
+    "SRV": 33,
+}
+RECORD_TYPE_NAMES = {value: name for name, value in RECORD_TYPES.items()}
+
+RCODE_NAMES = {
+    0: "NOERROR",
+    1: "FORMERR",
+    2: "SERVFAIL",
+    3: "NXDOMAIN",
+    4: "NOTIMP",
+    5: "REFUSED",
+}
+
+_FLAG_RD = 0x0100
+_FLAG_TC = 0x0200
+
+
+@dataclass
+class DNSRecord:
+    """A single resource record from the answer section."""
+
+    name: str
+    record_type: str
+    ttl: int
+    value: str
+
+
+@dataclass
+class DNSResponse:
+    """Decoded reply to one query."""
+
+    rcode: str = "NOERROR"
+    records: List[DNSRecord] = field(default_factory=list)
+    latency: float = 0.0  # Milliseconds, query sent to reply decoded
+    transport: str = "udp"  # udp, or tcp after a truncated reply
+
+    def answers(self, record_type: str) -> List[str]:
+        """Values of answer records of the given type, in reply order."""
+        return [r.value for r in self.records if r.record_type == record_type]
+
+
+class DNSError(Exception):
+    """Raised when a query gets no usable reply."""
+
+
+def system_nameserver(resolv_conf: Path = Path("/etc/resolv.conf")) -> str:
+    """Get the first IPv4 nameserver from resolv.conf.
+
+    Args:
+        resolv_conf: Path to the resolver configuration
+
+    Returns:
+        Nameserver address, 127.0.0.1 if none is configured
+    """
+    try:
+        for line in resolv_conf.read_text().splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and parts[0] == "nameserver":
+                try:
+                    if ipaddress.ip_address(parts[1]).version == 4:
+                        return parts[1]
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return "127.0.0.1"
+
+
+def encode_query(txid: int, name: str, record_type: str) -> bytes:
+    """Encode a recursive query for one name.
+
+    Args:
+        txid: 16-bit transaction id
+        name: Domain name to query
+        record_type: Record type name, e.g. "A" or "AAAA"
+
+    Returns:
+        DNS message bytes
+    """
+    header = struct.pack("!HHHHHH", txid, _FLAG_RD, 1, 0, 0, 0)
+    qname = b"".join(
+        bytes([len(label)]) + label
+        for label in (part.encode("idna") for part in name.rstrip(".").split("."))
+        if label
+    )
+    return header + qname + b"\0" + struct.pack("!HH", RECORD_TYPES[record_type], 1)
+
+
+def _read_name(message: bytes, offset: int) -> Tuple[str, int]:
+    """Read a possibly compressed domain name.
+
+    Returns:
+        Tuple of (name, offset just past the name in the original position)
+    """
+    labels = []
+    end = None
+    jumps = 0
+    while True:
+        length = message[offset]
+        if length & 0xC0 == 0xC0:
+            if end is None:
+                end = offset + 2
+            jumps += 1
+            if jumps > 32:
+                raise DNSError("Compression loop in reply")
+            offset = struct.unpack_from("!H", message, offset)[0] & 0x3FFF
+            continue
+        offset += 1
+        if length == 0:
+            break
+        labels.append(message[offset : offset + length].decode("ascii", "replace"))
+        offset += length
+    return ".".join(labels), end if end is not None else offset
+
+
+def _decode_rdata(message: bytes, offset: int, length: int, rtype: int) -> str:
+    """Render record data the way ``dig +short`` prints it."""
+    rdata = message[offset : offset + length]
+    if rtype == RECORD_TYPES["A"]:
+        return socket.inet_ntop(socket.AF_INET, rdata)
+    if rtype == RECORD_TYPES["AAAA"]:
+        return socket.inet_ntop(socket.AF_INET6, rdata)
+    if rtype in (RECORD_TYPES["CNAME"], RECORD_TYPES["NS"], RECORD_TYPES["PTR"]):
+        return _read_name(message, offset)[0]
+    if rtype == RECORD_TYPES["MX"]:
+        preference = struct.unpack_from("!H", message, offset)[0]
+        return f"{preference} {_read_name(message, offset + 2)[0]}"
+    if rtype == RECORD_TYPES["SRV"]:
+        priority, weight, port = struct.unpack_from("!HHH", message, offset)
+        return f"{priority} {weight} {port} {_read_name(message, offset + 6)[0]}"
+    if rtype == RECORD_TYPES["TXT"]:
+        strings = []
+        position = 0
+        while position < len(rdata):
+            size = rdata[position]
+            chunk = rdata[position + 1 : position + 1 + size]
+            strings.append(chunk.decode("utf-8", "replace"))
+            position += 1 + size
+        return " ".join(f'"{s}"' for s in strings)
+    return rdata.hex()
+
+
+def decode_response(message: bytes) -> Tuple[int, bool, DNSResponse]:
+    """Decode a reply's header and answer section.
+
+    Args:
+        message: DNS message bytes
+
+    Returns:
+        Tuple of (transaction id, truncated flag, DNSResponse)
+    """
+    if len(message) < 12:
+        raise DNSError("Short reply")
+    txid, flags, qdcount, ancount, _, _ = struct.unpack_from("!HHHHHH", message)
+    response = DNSResponse(rcode=RCODE_NAMES.get(flags & 0x000F, str(flags & 0x000F)))
+
+    offset = 12
+    for _ in range(qdcount):
+        _, offset = _read_name(message, offset)
+        offset += 4
+
+    for _ in range(ancount):
+        name, offset = _read_name(message, offset)
+        rtype, _, ttl, rdlength = struct.unpack_from("!HHIH", message, offset)
+        offset += 10
+        response.records.append(
+            DNSRecord(
+                name=name,
+                record_type=RECORD_TYPE_NAMES.get(rtype, str(rtype)),
+                ttl=ttl,
+                value=_decode_rdata(message, offset, rdlength, rtype),
+            )
+        )
+        offset += rdlength
+
+    return txid, bool(flags & _FLAG_TC), response
+
+
+class _ResolverProtocol(asyncio.DatagramProtocol):
+    """Dispatch UDP replies to the queries waiting for them."""
+
+    def __init__(self, pending: Dict[Tuple[int, str], asyncio.Future]):
+        self.pending = pending
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        if len(data) < 2:
+            return
+        txid = struct.unpack_from("!H", data)[0]
+        future = self.pending.get((txid, addr[0]))
+        if future is not None and not future.done():
+            future.set_result(data)
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP port unreachable etc.; affected queries run into their timeout
+        pass
+
+
+class DNSResolver:
+    """Send DNS queries concurrently from one UDP socket per address family."""
+
+    def __init__(
+        self,
+        timeout: float = 3.0,
+        nameserver: Optional[str] = None,
+        retries: int = 2,
+        port: int = DNS_PORT,
+    ):
+        """Initialize resolver.
+
+        Args:
+            timeout: Seconds to wait for a reply, across all attempts
+            nameserver: Default nameserver, first resolv.conf entry if None
+            retries: UDP retransmissions within the timeout
+            port: Nameserver port
+        """
+        self.timeout = timeout
+        self.nameserver = nameserver or system_nameserver()
+        self.retries = max(0, retries)
+        self.port = port
+        self._pending: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._transports: Dict[int, asyncio.DatagramTransport] = {}
+        self._addresses: Dict[str, Tuple[int, str]] = {}
+        self._opening: Optional[asyncio.Lock] = None
+
+    async def _get_transport(self, family: int) -> asyncio.DatagramTransport:
+        if self._opening is None:
+            self._opening = asyncio.Lock()
+        async with self._opening:
+            transport = self._transports.get(family)
+            if transport is None or transport.is_closing():
+                loop = asyncio.get_running_loop()
+                wildcard = "::" if family == socket.AF_INET6 else "0.0.0.0"
+                transport, _ = await loop.create_datagram_endpoint(
+                    lambda: _ResolverProtocol(self._pending),
+                    local_addr=(wildcard, 0),
+                )
+                self._transports[family] = transport
+        return transport
+
+    async def _server_address(self, server: str) -> Tuple[int, str]:
+        """Resolve a nameserver to its family and canonical address, once.
+
+        Replies are matched on the address they come from, so a hostname or
+        a non-canonical IPv6 literal has to be turned into that form first.
+        """
+        address = self._addresses.get(server)
+        if address is None:
+            try:
+                ip = ipaddress.ip_address(server)
+                family = socket.AF_INET6 if ip.version == 6 else socket.AF_INET
+                address = (family, str(ip))
+            except ValueError:
+                try:
+                    infos = await asyncio.wait_for(
+                        asyncio.get_running_loop().getaddrinfo(
+                            server, self.port, type=socket.SOCK_DGRAM
+                        ),
+                        timeout=self.timeout,
+                    )
+                except (OSError, asyncio.TimeoutError):
+                    raise DNSError(f"Cannot resolve nameserver {server}")
+                family, _, _, _, sockaddr = infos[0]
+                address = (family, str(ipaddress.ip_address(sockaddr[0])))
+            self._addresses[server] = address
+        return address
+
+    def close(self) -> None:
+        """Close the shared sockets."""
+        for transport in self._transports.values():
+            transport.close()
+        self._transports.clear()
+
+    async def __aenter__(self) -> "DNSResolver":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
+
+    async def query(
+        self,
+        name: str,
+        record_type: str = "A",
+        nameserver: Optional[str] = None,
+    ) -> DNSResponse:
+        """Resolve one name.
+
+        Args:
+            name: Domain name to query
+            record_type: Record type name, e.g. "A", "AAAA" or "CNAME"
+            nameserver: Nameserver address or hostname, the resolver default
+                if None
+
+        Returns:
+            DNSResponse with answer records and latency
+
+        Raises:
+            DNSError: On timeout or an undecodable reply
+            ValueError: For unsupported record types
+        """
+        record_type = record_type.upper()
+        if record_type not in RECORD_TYPES:
+            raise ValueError(f"Unsupported record type: {record_type}")
+        family, server = await self._server_address(nameserver or self.nameserver)
+        transport = await self._get_transport(family)
+
+        # Pick a transaction id not already in flight to this server
+        txid = random.getrandbits(16)
+        while (txid, server) in self._pending:
+            txid = random.getrandbits(16)
+        packet = encode_query(txid, name, record_type)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[(txid, server)] = future
+        attempts = self.retries + 1
+        started = time.perf_counter_ns()
+        try:
+            for attempt in range(attempts):
+                transport.sendto(packet, (server, self.port))
+                try:
+                    # Shield so a retransmission keeps waiting on the same reply
+                    reply = await asyncio.wait_for(
+                        asyncio.shield(future), timeout=self.timeout / attempts
+                    )
+                    break
+                except asyncio.TimeoutError:
+                    if attempt == attempts - 1:
+                        raise DNSError("Timeout")
+        finally:
+            self._pending.pop((txid, server), None)
+
+        _, truncated, response = decode_response(reply)
+        if truncated:
+            response = await self._query_tcp(packet, server)
+        response.latency = (time.perf_counter_ns() - started) / 1_000_000
+        return response
+
+    async def _query_tcp(self, packet: bytes, server: str) -> DNSResponse:
+        """Repeat a query over TCP after a truncated UDP reply."""
+        writer = None
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(server, self.port), timeout=self.timeout
+            )
+            writer.write(struct.pack("!H", len(packet)) + packet)
+            await writer.drain()
+            prefix = await asyncio.wait_for(
+                reader.readexactly(2), timeout=self.timeout
+            )
+            length = struct.unpack("!H", prefix)[0]
+            reply = await asyncio.wait_for(
+                reader.readexactly(length), timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            raise DNSError("Timeout (TCP)")
+        except (OSError, asyncio.IncompleteReadError) as e:
+            raise DNSError(f"TCP query failed: {e}")
+        finally:
+            if writer is not None:
+                writer.close()
+
+        _, _, response = decode_response(reply)
+        response.transport = "tcp"
+        return response
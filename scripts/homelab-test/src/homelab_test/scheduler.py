@@ -0,0 +1,132 @@
+"""Bounded-concurrency scheduling for probes."""
+
+import asyncio
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ProbeScheduler:
+    """Run probes under a global concurrency cap plus per-group caps.
+
+    Groups are arbitrary string keys (for service probes, the routing type such
+    as ``bee`` or ``tower-swag``). A probe first waits for a slot in its group
+    and only then takes a global slot, so a saturated group never holds global
+    slots that other groups could use.
+    """
+
+    def __init__(
+        self, max_concurrent: int = 16, group_limits: Optional[Dict[str, int]] = None
+    ):
+        """Initialize scheduler.
+
+        Args:
+            max_concurrent: Maximum number of probes in flight overall
+            group_limits: Maximum probes in flight per group key
+        """
+        self.max_concurrent = max_concurrent
+        self.group_limits = group_limits or {}
+        self._global: Optional[asyncio.Semaphore] = None
+        self._groups: Dict[str, asyncio.Semaphore] = {}
+
+    def _global_slot(self) -> asyncio.Semaphore:
+        if self._global is None:
+            self._global = asyncio.Semaphore(self.max_concurrent)
+        return self._global
+
+    def _group_slot(self, group: str) -> Optional[asyncio.Semaphore]:
+        if group not in self.group_limits:
+            return None
+        if group not in self._groups:
+            self._groups[group] = asyncio.Semaphore(self.group_limits[group])
+        return self._groups[group]
+
+    async def submit(self, group: str, probe: Callable[[], Awaitable[R]]) -> R:
+        """Run a single probe once its group and global slots are free.
+
+        Args:
+            group: Group key used for the per-group limit
+            probe: Zero-argument coroutine function performing the probe
+
+        Returns:
+            The probe's result
+        """
+        group_slot = self._group_slot(group)
+        if group_slot is None:
+            async with self._global_slot():
+                return await probe()
+        async with group_slot:
+            async with self._global_slot():
+                return await probe()
+
+    async def stream(
+        self,
+        items: Union[Iterable[T], AsyncIterable[T]],
+        probe: Callable[[T], Awaitable[R]],
+        group: Callable[[T], str],
+    ) -> AsyncIterator[R]:
+        """Probe all items and yield results in completion order.
+
+        ``items`` may be an async iterable, in which case each item is scheduled
+        as soon as it arrives, so probing overlaps with producing the items. An
+        exception raised by the producer is re-raised once every probe already
+        scheduled has been yielded.
+
+        Args:
+            items: Items to probe
+            probe: Coroutine function probing one item
+            group: Function mapping an item to its group key
+
+        Yields:
+            Probe results as each one completes
+        """
+        completed: asyncio.Queue = asyncio.Queue()
+        tasks = []
+
+        async def feed() -> None:
+            async for item in _as_async_iterable(items):
+                task = asyncio.create_task(
+                    self.submit(group(item), lambda item=item: probe(item))
+                )
+                task.add_done_callback(completed.put_nowait)
+                tasks.append(task)
+
+        feeder = asyncio.create_task(feed())
+        feeder.add_done_callback(completed.put_nowait)
+
+        yielded = 0
+        try:
+            while not (feeder.done() and yielded == len(tasks)):
+                task = await completed.get()
+                if task is feeder:
+                    continue
+                yielded += 1
+                yield task.result()
+            feeder.result()
+        finally:
+            feeder.cancel()
+            for task in tasks:
+                task.cancel()
+
+
+async def _as_async_iterable(
+    items: Union[Iterable[T], AsyncIterable[T]],
+) -> AsyncIterator[T]:
+    """Iterate sync and async iterables alike."""
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
@@ -1,10 +1,25 @@
 """Service testing with async HTTP requests."""
 
-import re
+import asyncio
+import importlib.util
 import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlsplit
 import httpx
+from .classifier import ErrorClassifier
+from .config import HttpConfig
+from .scheduler import ProbeScheduler
 from .traefik import TraefikService
 
 
@@ -16,26 +31,128 @@ class ServiceTestResult:
     url: str
     routing_type: str
     status_code: Optional[int] = None
-    response_size: int = 0
+    response_size: int = 0  # Body bytes on the wire, before decompression
     response_time: float = 0.0
+    handshake_time: float = 0.0  # TCP connect + TLS, zero on a reused connection
+    transfer_time: float = 0.0  # Request/response exchange excluding handshakes
     redirect_count: int = 0
     success: bool = False
     error_message: str = ""
     error_detail: str = ""
+    error_category: str = ""  # ErrorClassifier category of the response body
+    probe_method: str = "GET"  # Request that produced the result
 
 
-class ServiceTester:
-    """Async service testing with detailed response analysis."""
+# Bodies up to this size are drained past the inspected prefix so their
+# keep-alive connection stays reusable
+_DRAIN_LIMIT = 256 * 1024
+
+
+class _ConnectionTrace:
+    """Accumulate connection setup time from httpcore trace events."""
+
+    _HANDSHAKE_PHASES = ("connection.connect_tcp", "connection.start_tls")
+
+    def __init__(self):
+        self.handshake_time = 0.0
+        self._started: Dict[str, float] = {}
 
-    def __init__(self, timeout: float = 5.0, follow_redirects: bool = True):
+    async def __call__(self, event_name: str, info: Dict) -> None:
+        phase, _, state = event_name.rpartition(".")
+        if phase not in self._HANDSHAKE_PHASES:
+            return
+        if state == "started":
+            self._started[phase] = time.perf_counter()
+        elif state == "complete" and phase in self._started:
+            self.handshake_time += time.perf_counter() - self._started.pop(phase)
+
+
+class ServiceTester:
+    """Async service testing with detailed response analysis.
+
+    A single pooled ``httpx.AsyncClient`` is shared by every probe for the
+    lifetime of the tester, so services behind the same Traefik instance reuse
+    keep-alive connections instead of paying a handshake each. Use the tester
+    as an async context manager or call :meth:`aclose` when done.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        follow_redirects: bool = True,
+        http_config: Optional[HttpConfig] = None,
+        verify_ssl: bool = False,
+        scheduler: Optional[ProbeScheduler] = None,
+        classifier: Optional[ErrorClassifier] = None,
+        probe_strategies: Optional[Dict[str, str]] = None,
+        default_strategy: str = "get",
+    ):
         """Initialize service tester.
 
         Args:
             timeout: Request timeout in seconds
             follow_redirects: Whether to follow HTTP redirects
+            http_config: Connection pool settings, defaults if None
+            verify_ssl: Whether to verify TLS certificates
+            scheduler: Concurrency limits for batch testing, defaults if None
+            classifier: Response body classifier, default patterns if None
+            probe_strategies: Probe strategy per service name
+            default_strategy: Probe strategy for services without an override
         """
         self.timeout = timeout
         self.follow_redirects = follow_redirects
+        self.http_config = http_config or HttpConfig()
+        self.verify_ssl = verify_ssl
+        self.scheduler = scheduler or ProbeScheduler()
+        self.classifier = classifier or ErrorClassifier()
+        self.probe_strategies = probe_strategies or {}
+        self.default_strategy = default_strategy
+        self._head_rejected: Set[str] = set()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "ServiceTester":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Run-scoped pooled HTTP client, created on first use."""
+        if self._client is None:
+            # HTTP/2 needs the optional h2 package; fall back to HTTP/1.1
+            http2 = (
+                self.http_config.http2
+                and importlib.util.find_spec("h2") is not None
+            )
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=self.follow_redirects,
+                verify=self.verify_ssl,  # verify_ssl in config.toml; off acts like curl -k
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=self.http_config.max_connections,
+                    max_keepalive_connections=self.http_config.max_keepalive_connections,
+                    keepalive_expiry=self.http_config.keepalive_expiry,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent requests to a URL's host."""
+        host = urlsplit(url).hostname or ""
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(
+                self.http_config.max_connections_per_host
+            )
+        return self._host_slots[host]
 
     async def test_service(self, service: TraefikService) -> ServiceTestResult:
         """Test a single service for availability and response.
@@ -52,36 +169,57 @@ class ServiceTester:
         test_url = service.frontend_domain
         if service.custom_path:
             test_url = service.frontend_domain.rstrip('/') + service.custom_path
-            
+
+        return await self.test_url(service.name, test_url, service.routing_type)
+
+    async def test_url(
+        self,
+        service_name: str,
+        url: str,
+        routing_type: Optional[str],
+        timeout: Optional[float] = None,
+        strategy: Optional[str] = None,
+    ) -> ServiceTestResult:
+        """Probe a URL over the shared client.
+
+        With the ``head`` strategy a HEAD request is sent first; a plain GET
+        follows only when HEAD does not report success, so rejected HEAD
+        requests and error pages are judged exactly as a GET would judge them.
+        The ``range`` strategy asks for just the inspected body prefix.
+
+        Args:
+            service_name: Name reported in the result
+            url: URL to request
+            routing_type: Routing type reported in the result
+            timeout: Request timeout in seconds, the tester default if None
+            strategy: head, range or get; per-service configuration if None
+
+        Returns:
+            ServiceTestResult with detailed metrics
+        """
         result = ServiceTestResult(
-            service_name=service.name,
-            url=test_url,
-            routing_type=service.routing_type,
+            service_name=service_name,
+            url=url,
+            routing_type=routing_type,
         )
+        request_timeout = timeout if timeout is not None else self.timeout
+        strategy = strategy or self.strategy_for(service_name)
 
         try:
-            start_time = time.time()
-
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=self.follow_redirects,
-                verify=False,  # Skip SSL verification like curl -k
-            ) as client:
-                response = await client.get(test_url)
-
-                result.response_time = time.time() - start_time
-                result.status_code = response.status_code
-                result.response_size = len(response.content)
-                result.redirect_count = len(response.history)
+            if strategy == "head" and service_name not in self._head_rejected:
+                await self._probe(result, "HEAD", request_timeout)
+                if result.status_code in (405, 501):
+                    # Remember services that reject HEAD to skip it next time
+                    self._head_rejected.add(service_name)
+                if result.success:
+                    return result
 
-                # Analyze response for detailed error information
-                result.error_detail = self._analyze_response(response)
+            if strategy == "range":
+                await self._probe(result, "GET", request_timeout, ranged=True)
+                if result.status_code != 416:
+                    return result
 
-                if 200 <= result.status_code < 400:
-                    result.success = True
-                else:
-                    result.success = False
-                    result.error_message = f"HTTP {result.status_code}"
+            await self._probe(result, "GET", request_timeout)
 
         except httpx.TimeoutException:
             result.error_message = "Connection timeout"
@@ -89,94 +227,163 @@ class ServiceTester:
         except httpx.ConnectError:
             result.error_message = "Connection refused"
             result.error_detail = "Could not connect to service"
-        except httpx.HTTPStatusError as e:
-            result.status_code = e.response.status_code
-            result.error_message = f"HTTP {e.response.status_code}"
-            result.error_detail = self._analyze_response(e.response)
         except Exception as e:
             result.error_message = "Unexpected error"
             result.error_detail = str(e)
 
         return result
 
+    def strategy_for(self, service_name: str) -> str:
+        """Get the configured probe strategy for a service."""
+        return self.probe_strategies.get(service_name, self.default_strategy)
+
+    async def _probe(
+        self,
+        result: ServiceTestResult,
+        method: str,
+        timeout: float,
+        ranged: bool = False,
+    ) -> None:
+        """Send one request and record its outcome in ``result``.
+
+        Args:
+            result: Result to update; fields from an earlier attempt are replaced
+            method: HTTP method
+            timeout: Request timeout in seconds
+            ranged: Request only the inspected body prefix
+        """
+        trace = _ConnectionTrace()
+        headers = {}
+        if ranged and self.http_config.inspect_bytes > 0:
+            headers["Range"] = f"bytes=0-{self.http_config.inspect_bytes - 1}"
+
+        async with self._host_slot(result.url):
+            start_time = time.perf_counter()
+            async with self.client.stream(
+                method,
+                result.url,
+                timeout=timeout,
+                headers=headers,
+                extensions={"trace": trace},
+            ) as response:
+                body_prefix, result.response_size = await self._read_body(response)
+
+        result.probe_method = f"{method} range" if headers else method
+        result.response_time = time.perf_counter() - start_time
+        result.handshake_time = trace.handshake_time
+        result.transfer_time = max(0.0, result.response_time - trace.handshake_time)
+        result.status_code = response.status_code
+        result.redirect_count = len(response.history)
+
+        if method == "HEAD":
+            result.response_size = int(response.headers.get("content-length", 0) or 0)
+        elif response.status_code == 206:
+            # Content-Range: bytes 0-16383/123456 carries the full size
+            total = response.headers.get("content-range", "").rpartition("/")[2]
+            if total.isdigit():
+                result.response_size = int(total)
+
+        # Analyze response for detailed error information
+        classification = self.classifier.classify(
+            body_prefix.decode(response.encoding or "utf-8", errors="replace")
+        )
+        result.error_category = classification.category
+        result.error_detail = classification.detail
+
+        if 200 <= result.status_code < 400:
+            result.success = True
+            result.error_message = ""
+        else:
+            result.success = False
+            result.error_message = f"HTTP {result.status_code}"
+
     async def test_services(
         self, services: List[TraefikService]
     ) -> List[ServiceTestResult]:
-        """Test multiple services concurrently.
+        """Test multiple services concurrently over the shared client.
 
         Args:
             services: List of TraefikService objects to test
 
         Returns:
-            List of ServiceTestResult objects
+            List of ServiceTestResult objects, in the order of ``services``
         """
-        import asyncio
-
-        # Test all services concurrently for better performance
-        tasks = [self.test_service(service) for service in services]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle any exceptions in concurrent execution
-        valid_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                # Create error result for failed test
-                error_result = ServiceTestResult(
-                    service_name=services[i].name,
-                    url=services[i].frontend_domain,
-                    routing_type=services[i].routing_type,
-                    error_message="Test execution failed",
-                    error_detail=str(result),
-                )
-                valid_results.append(error_result)
-            else:
-                valid_results.append(result)
-
-        return valid_results
-
-    def _analyze_response(self, response: httpx.Response) -> str:
-        """Extract detailed error information from HTTP response.
-
-        This replicates the bash script's detailed error analysis logic.
+        results = {}
+        async for service, result in self.iter_services(services):
+            results[id(service)] = result
+        return [results[id(service)] for service in services]
+
+    async def iter_services(
+        self, services: Union[Iterable[TraefikService], AsyncIterable[TraefikService]]
+    ) -> AsyncIterator[Tuple[TraefikService, ServiceTestResult]]:
+        """Test services under the scheduler's limits, yielding as each completes.
 
         Args:
-            response: HTTP response object
+            services: Services to test; an async iterable (such as
+                ``TraefikClient.iter_services``) is probed while it is produced
 
-        Returns:
-            Detailed error description
+        Yields:
+            (service, result) pairs in completion order
         """
-        response_text = response.text
-
-        # Check for common error patterns
-        if "plain HTTP request was sent to HTTPS port" in response_text:
-            return "(HTTPS/HTTP protocol mismatch - Traefik config issue)"
-        elif any(
-            pattern in response_text.lower() for pattern in ["bad gateway", "502"]
+        async for pair in self.scheduler.stream(
+            services, self._test_service_safe, lambda s: s.routing_type
         ):
-            return "(Bad Gateway - backend service unavailable)"
-        elif any(pattern in response_text.lower() for pattern in ["404", "not found"]):
-            return "(Not Found - service not configured or offline)"
-        elif any(
-            pattern in response_text.lower() for pattern in ["400", "bad request"]
-        ):
-            return "(Bad Request - invalid configuration)"
-        elif any(
-            pattern in response_text.lower()
-            for pattern in ["503", "service unavailable"]
-        ):
-            return "(Service Unavailable - backend down)"
-        elif "connection refused" in response_text.lower():
-            return "(Connection refused - backend not responding)"
-        elif "timeout" in response_text.lower():
-            return "(Timeout - backend too slow)"
-        elif len(response_text) < 50 and re.match(r"^\d+$", response_text.strip()):
-            return "(Raw status code - minimal response)"
-        elif len(response_text) > 0:
-            # Show first 100 chars of error response for debugging
-            error_snippet = response_text.replace("\n", " ")[:100]
-            return f"(Error: {error_snippet}...)"
-        else:
-            return "(No response body)"
+            yield pair
+
+    async def _test_service_safe(
+        self, service: TraefikService
+    ) -> Tuple[TraefikService, ServiceTestResult]:
+        """Test a service, turning unexpected exceptions into an error result."""
+        try:
+            return service, await self.test_service(service)
+        except Exception as e:
+            # Create error result for failed test
+            return service, ServiceTestResult(
+                service_name=service.name,
+                url=service.frontend_domain,
+                routing_type=service.routing_type,
+                error_message="Test execution failed",
+                error_detail=str(e),
+            )
+
+    async def _read_body(self, response: httpx.Response) -> Tuple[bytes, int]:
+        """Read the start of a streamed body and determine its total size.
+
+        Only the first ``http_config.inspect_bytes`` decoded bytes are kept.
+        The rest is drained chunk by chunk without buffering, so the
+        connection can go back to the pool. A large body with a Content-Length
+        header is not read past the prefix at all; abandoning the connection is
+        cheaper than downloading megabytes.
+
+        The size is always counted as it travels on the wire, before any
+        Content-Encoding is undone, which is what Content-Length states. A
+        compressed body therefore reports the same size whether or not the
+        header was sent.
+
+        Args:
+            response: Streaming response whose body has not been read
+
+        Returns:
+            Tuple of (decoded body prefix, body size on the wire in bytes)
+        """
+        limit = self.http_config.inspect_bytes
+        content_length = response.headers.get("content-length", "")
+        known_size = int(content_length) if content_length.isdigit() else None
+        stop_early = known_size is not None and known_size > _DRAIN_LIMIT
+
+        prefix = bytearray()
+        async for chunk in response.aiter_bytes():
+            if limit <= 0:
+                prefix += chunk
+            elif len(prefix) < limit:
+                prefix += chunk[: limit - len(prefix)]
+            elif stop_early:
+                break
+
+        if known_size is not None:
+            return bytes(prefix), known_size
+        # Raw bytes read from the connection, i.e. before decompression
+        return bytes(prefix), response.num_bytes_downloaded
 
 
 class ServiceTestReporter:
@@ -2,10 +2,14 @@
 
 import asyncio
 import json
+import shutil
+import tempfile
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 import subprocess
 
 from rich.console import Console
@@ -15,6 +19,36 @@ from rich.columns import Columns
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich import box
 
+from .cache import RevisionCache, default_cache_dir, get_flake_revision
+from .collector import COLLECTOR_SCRIPT, parse_collector_output
+from .reachability import ReachabilityEngine
+
+
+# Hosts reported by the info subcommand and watched with watch --hosts
+DEFAULT_HOSTS = ["navi", "bee", "halo", "pi"]
+
+# SSH handshake timings kept per host and gathering cycle
+_HANDSHAKE_HISTORY = 32
+
+# Evaluates basic info for every host in one nix process; @HOSTS@ is replaced
+# with a Nix list of host names. Hosts missing from the flake map to nulls.
+NIX_HOSTS_EXPR = """
+let
+  flake = builtins.getFlake (toString ./.);
+  inherit (import ./modules/core/hosts.nix) hosts;
+  hostInfo = name: let
+    known = flake.nixosConfigurations ? ${name};
+    cfg = flake.nixosConfigurations.${name}.config;
+  in {
+    ip = hosts.${name}.ip or null;
+    tailscaleDomain = hosts.${name}.tailscaleDomain or null;
+    stateVersion = if known then cfg.system.stateVersion else null;
+    arch = if known then cfg.nixpkgs.hostPlatform.system else null;
+  };
+in
+  builtins.listToAttrs (map (name: { inherit name; value = hostInfo name; }) @HOSTS@)
+"""
+
 
 @dataclass
 class HostInfo:
@@ -23,6 +57,7 @@ class HostInfo:
     ip: str
     state_version: str
     architecture: str
+    tailscale_domain: Optional[str] = None
     online: bool = False
     ping_ms: Optional[float] = None
     last_deploy: Optional[datetime] = None
@@ -41,34 +76,59 @@ class HostInfo:
     tailscale_ip: Optional[str] = None
     tailscale_auth_needed: bool = False
     tailscale_auth_url: Optional[str] = None
+    ssh_handshakes: int = 0
+    ssh_handshake_ms: Optional[float] = None  # Mean latency of new SSH connections
 
 
 class SystemInfoGatherer:
     """Gathers system information from NixOS hosts."""
     
-    def __init__(self, timeout: float = 10.0, console: Optional[Console] = None):
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        console: Optional[Console] = None,
+        repo_path: Path = Path("../.."),
+        cache: Optional[RevisionCache] = None,
+        use_collector: bool = True,
+        parallel: bool = True,
+        max_workers: int = 4,
+        host_deadline: float = 60.0,
+        control_persist: int = 120,
+    ):
         self.timeout = timeout
+        self.control_persist = control_persist
+        self.use_collector = use_collector
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.host_deadline = host_deadline
         self.deploy_log_path = Path.home() / ".deploy-times.json"
         self.console = console
+        self.repo_path = repo_path
+        self.cache = cache
+        self._reachability = ReachabilityEngine(timeout=2.0)
+        # Multiplexed SSH: one ControlMaster per host, reused by every command
+        self._control_dir: Optional[str] = None
+        self._ssh_masters = set()
+        self._ssh_handshakes: Dict[str, Deque[float]] = {}
         self._hosts_needing_auth = {}
         self._hosts_auth_failed = set()  # Only hosts where auth was skipped/failed
         self._hosts_auth_prompted = set()
+        # Interactive auth prompts are serialized through one worker
+        self._auth_queue: Optional[asyncio.Queue] = None
+        self._auth_worker: Optional[asyncio.Task] = None
         
     async def gather_all_info(self, hosts: List[str], full_mode: bool = False) -> Dict[str, HostInfo]:
         """Gather information for all hosts in parallel."""
         if self.console:
             self.console.print("[blue]🔍 Discovering hosts...[/blue]")
         
-        # First gather basic info for all hosts
-        basic_tasks = []
-        for host in hosts:
-            task = asyncio.create_task(self._get_nix_info(host))
-            basic_tasks.append((host, task))
+        # First gather basic info for all hosts in a single evaluation
+        nix_info = await self._get_all_nix_info(hosts)
         
         results = {}
-        for host, task in basic_tasks:
+        for host in hosts:
             try:
-                results[host] = await task
+                results[host] = nix_info[host]
                 if self.console:
                     self.console.print(f"  [green]✓[/green] Found {host}: {results[host].ip}")
             except Exception:
@@ -110,28 +170,140 @@ class SystemInfoGatherer:
             self.console.print("\n[blue]📊 Gathering system stats...[/blue]")
             self.console.print(f"  [dim]Checking SSH access to {len(online_hosts)} hosts...[/dim]")
         
-        # Gather detailed info for online hosts
-        for host, info in online_hosts:
-            if self.console:
-                self.console.print(f"  [dim]→ Connecting to {host}...[/dim]")
+        # Gather detailed info for online hosts, one worker per host
+        if self.parallel:
+            slots = asyncio.Semaphore(self.max_workers)
+            
+            async def bounded_worker(host: str, info: HostInfo) -> None:
+                async with slots:
+                    await self._host_worker(host, info, full_mode)
             
+            await asyncio.gather(
+                *(bounded_worker(host, info) for host, info in online_hosts)
+            )
+        else:
+            for host, info in online_hosts:
+                await self._host_worker(host, info, full_mode)
+        
+        return results
+    
+    async def _host_worker(self, host: str, info: HostInfo, full_mode: bool) -> None:
+        """Gather detailed info for one online host and report progress."""
+        if self.console:
+            self.console.print(f"  [dim]→ Connecting to {host}...[/dim]")
+        
+        # Count only this cycle's handshakes; in watch mode the gatherer
+        # outlives many cycles, and ControlPersist may have closed the master
+        self._ssh_handshakes[info.ip] = deque(maxlen=_HANDSHAKE_HISTORY)
+        if info.ip in self._ssh_masters and not await self._master_alive(info.ip):
+            self._ssh_masters.discard(info.ip)
+        
+        try:
+            await self._gather_online_host_info(info, full_mode)
+            if self.console and info.ip not in self._hosts_auth_failed:
+                self.console.print(f"  [green]✓[/green] {host} stats collected")
+        except asyncio.TimeoutError:
+            if self.console:
+                self.console.print(
+                    f"  [yellow]⚠[/yellow] {host} timed out after {self.host_deadline:.0f}s (partial stats)"
+                )
+        except Exception:
+            if self.console:
+                self.console.print(f"  [yellow]⚠[/yellow] {host} partial stats")
+        
+        handshakes = self._ssh_handshakes.get(info.ip, ())
+        info.ssh_handshakes = len(handshakes)
+        if handshakes:
+            info.ssh_handshake_ms = sum(handshakes) / len(handshakes)
+    
+    async def close(self) -> None:
+        """Shut down multiplexed SSH masters opened during gathering."""
+        if self._auth_worker is not None:
+            self._auth_worker.cancel()
+            self._auth_worker = None
+        
+        if self._control_dir is None:
+            return
+        
+        async def stop_master(host: str) -> None:
             try:
-                await self._gather_online_host_info(info, full_mode)
-                if self.console and info.ip not in self._hosts_auth_failed:
-                    self.console.print(f"  [green]✓[/green] {host} stats collected")
+                proc = await asyncio.create_subprocess_shell(
+                    f"ssh {self._mux_options()} -O exit root@{host}",
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                await asyncio.wait_for(proc.wait(), timeout=5.0)
             except Exception:
-                if self.console:
-                    self.console.print(f"  [yellow]⚠[/yellow] {host} partial stats")
+                pass
         
-        return results
+        await asyncio.gather(*(stop_master(host) for host in self._ssh_masters))
+        self._ssh_masters.clear()
+        shutil.rmtree(self._control_dir, ignore_errors=True)
+        self._control_dir = None
+    
+    def _mux_options(self) -> str:
+        """SSH options sharing one persistent connection per host."""
+        if self._control_dir is None:
+            # Short path: control sockets are limited to ~104 characters
+            self._control_dir = tempfile.mkdtemp(prefix="hlt-ssh-")
+        return (
+            "-o ControlMaster=auto "
+            f"-o ControlPath={self._control_dir}/%C "
+            f"-o ControlPersist={self.control_persist}"
+        )
+    
+    def _ssh_prefix(self, host: str, connect_timeout: int = 10) -> str:
+        """Build the multiplexed ssh command prefix for a host."""
+        return (
+            f"ssh {self._mux_options()} -o ConnectTimeout={connect_timeout} "
+            f"-o StrictHostKeyChecking=no -o PasswordAuthentication=no root@{host}"
+        )
+    
+    async def _master_alive(self, host: str) -> bool:
+        """Ask the host's ControlMaster whether it is still running."""
+        try:
+            proc = await asyncio.create_subprocess_shell(
+                f"ssh {self._mux_options()} -O check root@{host}",
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            return await asyncio.wait_for(proc.wait(), timeout=5.0) == 0
+        except Exception:
+            return False
+    
+    def _record_connection(self, host: str, started: float, success: bool) -> None:
+        """Count a new SSH connection unless the host's master was already up."""
+        if host in self._ssh_masters:
+            return
+        self._ssh_handshakes.setdefault(
+            host, deque(maxlen=_HANDSHAKE_HISTORY)
+        ).append((time.perf_counter() - started) * 1000)
+        if success:
+            self._ssh_masters.add(host)
     
     async def _gather_online_host_info(self, info: HostInfo, full_mode: bool) -> None:
-        """Gather detailed information for an online host."""
-        # First check if we can SSH to the host (Tailscale auth check)
+        """Gather detailed information for an online host.
+        
+        Raises:
+            asyncio.TimeoutError: If stats collection exceeds the host deadline
+        """
+        # First check if we can SSH to the host (Tailscale auth check).
+        # Not covered by the deadline, since it may wait on an auth prompt.
         if not await self._check_ssh_access(info):
             if self.console and info.ip not in self._hosts_auth_failed:
                 self.console.print(f"  [yellow]⚠ Skipping {info.name} (SSH access check failed)[/yellow]")
             return
+        
+        await asyncio.wait_for(
+            self._gather_host_stats(info, full_mode), timeout=self.host_deadline
+        )
+    
+    async def _gather_host_stats(self, info: HostInfo, full_mode: bool) -> None:
+        """Gather stats for a host whose SSH access is confirmed."""
+        # One remote invocation for everything; per-metric commands as fallback
+        if self.use_collector and await self._collect_host_stats(info, full_mode):
+            self._read_deploy_log(info)
+            return
             
         # Gather system info via SSH
         await asyncio.gather(
@@ -145,12 +317,102 @@ class SystemInfoGatherer:
         if full_mode:
             # Additional expensive operations for full mode
             if self.console:
-                self.console.print(f"  [dim]  → Counting packages on {info.name}...[/dim]")
-            await self._get_package_count(info)
-            
-            if self.console:
-                self.console.print(f"  [dim]  → Measuring system size on {info.name}...[/dim]")
-            await self._get_system_size(info)
+                self.console.print(f"  [dim]  → Counting packages and measuring system size on {info.name}...[/dim]")
+            await asyncio.gather(
+                self._get_package_count(info),
+                self._get_system_size(info)
+            )
+    
+    async def _collect_host_stats(self, info: HostInfo, full_mode: bool) -> bool:
+        """Gather all stats for a host with a single collector invocation.
+        
+        Returns:
+            True if the collector ran and its output was applied
+        """
+        args = "full" if full_mode else ""
+        # For local host, run directly
+        is_local = info.name == "navi" and info.ip == "192.168.1.250"
+        if is_local:
+            cmd = f"sh -s -- {args}"
+        else:
+            cmd = f"{self._ssh_prefix(info.ip)} 'sh -s -- {args}'"
+        
+        try:
+            started = time.perf_counter()
+            proc = await asyncio.create_subprocess_shell(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            # Counting store paths in full mode can take a while
+            timeout = self.timeout * 3 if full_mode else self.timeout
+            stdout, _ = await asyncio.wait_for(
+                proc.communicate(COLLECTOR_SCRIPT.encode()), timeout=timeout
+            )
+            if not is_local:
+                self._record_connection(info.ip, started, proc.returncode == 0)
+        except Exception:
+            return False
+        
+        if proc.returncode != 0:
+            return False
+        fields = parse_collector_output(stdout.decode())
+        if fields is None:
+            return False
+        
+        for name, value in fields.items():
+            setattr(info, name, value)
+        return True
+    
+    async def _get_all_nix_info(self, hosts: List[str]) -> Dict[str, HostInfo]:
+        """Get basic information for all hosts, cached per flake revision.
+
+        Uses one batched ``nix eval`` for every host instead of several
+        evaluator processes per host, falling back to per-host evaluation if
+        the batched expression fails.
+        """
+        revision = await get_flake_revision(self.repo_path) if self.cache else None
+        data = self.cache.get(revision) if self.cache else None
+        if not data or any(host not in data for host in hosts):
+            data = await self._eval_hosts(hosts)
+            if data is not None and self.cache:
+                self.cache.set(revision, data)
+        
+        if data is None:
+            infos = await asyncio.gather(*(self._get_nix_info(host) for host in hosts))
+            return dict(zip(hosts, infos))
+        
+        return {
+            host: HostInfo(
+                name=host,
+                ip=data[host].get("ip") or "unknown",
+                state_version=data[host].get("stateVersion") or "unknown",
+                architecture=data[host].get("arch") or "unknown",
+                tailscale_domain=data[host].get("tailscaleDomain"),
+            )
+            for host in hosts
+        }
+    
+    async def _eval_hosts(self, hosts: List[str]) -> Optional[Dict[str, Dict]]:
+        """Evaluate basic info for all hosts with a single nix process."""
+        host_list = "[ " + " ".join(json.dumps(host) for host in hosts) + " ]"
+        expr = NIX_HOSTS_EXPR.replace("@HOSTS@", host_list)
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "nix", "eval", "--json", "--impure", "--expr", expr,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.repo_path,
+            )
+            # One cold evaluation of every host takes longer than a single query
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=self.timeout * 6)
+            if proc.returncode != 0:
+                return None
+            return json.loads(stdout.decode())
+        except Exception:
+            return None
     
     async def _get_nix_info(self, host: str) -> HostInfo:
         """Get basic host information from nix configuration."""
@@ -179,7 +441,8 @@ class SystemInfoGatherer:
                 name=host,
                 ip=ip or "unknown",
                 state_version=state_version or "unknown",
-                architecture=arch or "unknown"
+                architecture=arch or "unknown",
+                tailscale_domain=ts_domain or None,
             )
         except Exception:
             return HostInfo(
@@ -198,8 +461,10 @@ class SystemInfoGatherer:
         # Try a simple SSH command with special handling for Tailscale
         try:
             # Use a shorter timeout for the auth check
-            ssh_cmd = f"ssh -o ConnectTimeout=3 -o StrictHostKeyChecking=no -o PasswordAuthentication=no root@{info.ip} 'echo ok' 2>&1"
+            # This connection becomes the host's ControlMaster on success
+            ssh_cmd = f"{self._ssh_prefix(info.ip, connect_timeout=3)} 'echo ok' 2>&1"
             
+            started = time.perf_counter()
             proc = await asyncio.create_subprocess_shell(
                 ssh_cmd,
                 stdout=subprocess.PIPE,
@@ -212,7 +477,9 @@ class SystemInfoGatherer:
                 output_text = output.decode() if output else ""
                 
                 # Check if it succeeded
-                if proc.returncode == 0 and "ok" in output_text:
+                success = proc.returncode == 0 and "ok" in output_text
+                self._record_connection(info.ip, started, success)
+                if success:
                     return True
                     
                 # Check for Tailscale auth message
@@ -276,7 +543,8 @@ class SystemInfoGatherer:
             
         try:
             # Use direct SSH without the _run_ssh_command wrapper to avoid recursion
-            ssh_cmd = f"ssh -o ConnectTimeout=10 -o StrictHostKeyChecking=no -o PasswordAuthentication=no root@{info.ip} 'echo ok'"
+            ssh_cmd = f"{self._ssh_prefix(info.ip)} 'echo ok'"
+            started = time.perf_counter()
             proc = await asyncio.create_subprocess_shell(
                 ssh_cmd,
                 stdout=subprocess.PIPE,
@@ -286,6 +554,7 @@ class SystemInfoGatherer:
             stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10.0)
             result = stdout.decode().strip() if stdout else ""
             success = proc.returncode == 0 and result == "ok"
+            self._record_connection(info.ip, started, success)
             
             if self.console:
                 if success:
@@ -307,11 +576,9 @@ class SystemInfoGatherer:
             return False, None
             
         try:
-            result = await self._run_local_command(
-                f"ping -c 1 -W 2 {ip} | grep 'time=' | sed 's/.*time=//; s/ ms.*//'"
-            )
-            if result:
-                return True, float(result)
+            result = await self._reachability.probe(ip)
+            if result.reachable:
+                return True, result.rtt_avg
             return False, None
         except Exception:
             return False, None
@@ -504,11 +771,7 @@ class SystemInfoGatherer:
         """Get last deployment time from log and system generation time."""
         try:
             # Get from our deployment log
-            if self.deploy_log_path.exists():
-                with open(self.deploy_log_path) as f:
-                    deploy_times = json.load(f)
-                    if info.name in deploy_times:
-                        info.last_deploy = datetime.fromisoformat(deploy_times[info.name])
+            self._read_deploy_log(info)
             
             # Also get system generation time
             gen_time_output = await self._run_ssh_command(
@@ -521,6 +784,17 @@ class SystemInfoGatherer:
         except Exception:
             pass
     
+    def _read_deploy_log(self, info: HostInfo) -> None:
+        """Set last deployment time from the local deployment log."""
+        try:
+            if self.deploy_log_path.exists():
+                with open(self.deploy_log_path) as f:
+                    deploy_times = json.load(f)
+                    if info.name in deploy_times:
+                        info.last_deploy = datetime.fromisoformat(deploy_times[info.name])
+        except Exception:
+            pass
+    
     async def _run_local_command(self, cmd: str) -> Optional[str]:
         """Run a command locally."""
         try:
@@ -548,9 +822,10 @@ class SystemInfoGatherer:
             
         # Use double quotes and escape properly
         escaped_cmd = cmd.replace("'", "'\"'\"'")
-        ssh_cmd = f"ssh -o ConnectTimeout=10 -o StrictHostKeyChecking=no -o PasswordAuthentication=no root@{host} '{escaped_cmd}'"
+        ssh_cmd = f"{self._ssh_prefix(host)} '{escaped_cmd}'"
         
         try:
+            started = time.perf_counter()
             proc = await asyncio.create_subprocess_shell(
                 ssh_cmd,
                 stdout=subprocess.PIPE,
@@ -559,6 +834,7 @@ class SystemInfoGatherer:
             
             try:
                 stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5.0)
+                self._record_connection(host, started, proc.returncode == 0)
                 
                 # Check for Tailscale authentication message
                 stderr_text = stderr.decode() if stderr else ""
@@ -597,15 +873,17 @@ class SystemInfoGatherer:
     async def _run_ssh_command_direct(self, host: str, cmd: str) -> Optional[str]:
         """Run SSH command without auth handling."""
         escaped_cmd = cmd.replace("'", "'\"'\"'")
-        ssh_cmd = f"ssh -o ConnectTimeout=10 -o StrictHostKeyChecking=no -o PasswordAuthentication=no root@{host} '{escaped_cmd}'"
+        ssh_cmd = f"{self._ssh_prefix(host)} '{escaped_cmd}'"
         
         try:
+            started = time.perf_counter()
             proc = await asyncio.create_subprocess_shell(
                 ssh_cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL
             )
             stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10.0)
+            self._record_connection(host, started, proc.returncode == 0)
             if proc.returncode == 0:
                 return stdout.decode().strip()
         except Exception:
@@ -613,7 +891,11 @@ class SystemInfoGatherer:
         return None
     
     async def _handle_tailscale_auth(self, host: str, auth_url: str) -> bool:
-        """Handle Tailscale authentication interactively."""
+        """Handle Tailscale authentication interactively.
+        
+        Hosts are gathered in parallel, so prompts are queued and shown one at
+        a time by a single worker rather than competing for the terminal.
+        """
         if not self.console:
             return False
         
@@ -621,7 +903,28 @@ class SystemInfoGatherer:
         if host in self._hosts_auth_prompted:
             return False
         self._hosts_auth_prompted.add(host)
-            
+        
+        if self._auth_worker is None:
+            self._auth_queue = asyncio.Queue()
+            self._auth_worker = asyncio.create_task(self._auth_prompt_worker())
+        
+        result = asyncio.get_running_loop().create_future()
+        await self._auth_queue.put((host, auth_url, result))
+        return await result
+    
+    async def _auth_prompt_worker(self) -> None:
+        """Show queued Tailscale auth prompts one after another."""
+        while True:
+            host, auth_url, result = await self._auth_queue.get()
+            try:
+                confirmed = await self._prompt_tailscale_auth(host, auth_url)
+            except Exception:
+                confirmed = False
+            if not result.done():
+                result.set_result(confirmed)
+    
+    async def _prompt_tailscale_auth(self, host: str, auth_url: str) -> bool:
+        """Prompt the user to complete Tailscale authentication for a host."""
         self.console.print(f"\n[bold yellow]🔐 Tailscale SSH Authentication Required[/bold yellow]")
         self.console.print(f"Host: [cyan]{host}[/cyan]")
         self.console.print(f"Auth URL: [cyan underline]{auth_url}[/cyan underline]")
@@ -719,6 +1022,7 @@ class SystemInfoReporter:
         if full_mode:
             table.add_column("Packages", justify="right")
             table.add_column("Size", justify="right")
+            table.add_column("SSH", justify="right")
         
         # Add rows
         for name in ["navi", "bee", "halo", "pi"]:  # Fixed order
@@ -807,6 +1111,12 @@ class SystemInfoReporter:
                     row.append(size)
                 else:
                     row.append("-")
+                
+                # SSH connections opened and their mean handshake latency
+                if info.ssh_handshakes:
+                    row.append(f"{info.ssh_handshakes}× {info.ssh_handshake_ms:.0f}ms")
+                else:
+                    row.append("-")
             
             table.add_row(*row)
         
@@ -893,14 +1203,27 @@ class SystemInfoReporter:
                 self.console.print(issue)
 
 
-async def run_system_info(full_mode: bool = False, json_output: bool = False) -> int:
+async def run_system_info(
+    full_mode: bool = False,
+    json_output: bool = False,
+    parallel: bool = True,
+    max_workers: int = 4,
+    host_deadline: float = 60.0,
+) -> int:
     """Run system information gathering."""
     console = Console() if not json_output else None
-    gatherer = SystemInfoGatherer(console=console)
-    
-    hosts = ["navi", "bee", "halo", "pi"]
+    gatherer = SystemInfoGatherer(
+        console=console,
+        cache=RevisionCache(default_cache_dir() / "hosts.json"),
+        parallel=parallel,
+        max_workers=max_workers,
+        host_deadline=host_deadline,
+    )
     
-    results = await gatherer.gather_all_info(hosts, full_mode)
+    try:
+        results = await gatherer.gather_all_info(DEFAULT_HOSTS, full_mode)
+    finally:
+        await gatherer.close()
     
     if json_output:
         # Convert to JSON-serializable format
@@ -910,6 +1233,7 @@ async def run_system_info(full_mode: bool = False, json_output: bool = False) ->
                 "ip": info.ip,
                 "state_version": info.state_version,
                 "architecture": info.architecture,
+                "tailscale_domain": info.tailscale_domain,
                 "online": info.online,
                 "ping_ms": info.ping_ms,
                 "last_deploy": info.last_deploy.isoformat() if info.last_deploy else None,
@@ -925,7 +1249,9 @@ async def run_system_info(full_mode: bool = False, json_output: bool = False) ->
                 "kernel_version": info.kernel_version,
                 "nixos_version": info.nixos_version,
                 "tailscale_status": info.tailscale_status,
-                "tailscale_ip": info.tailscale_ip
+                "tailscale_ip": info.tailscale_ip,
+                "ssh_handshakes": info.ssh_handshakes,
+                "ssh_handshake_ms": info.ssh_handshake_ms
             }
         print(json.dumps(output, indent=2))
     else:
@@ -0,0 +1,104 @@
+"""Wall-clock timing of overlapping test stages."""
+
+import contextlib
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+
+@dataclass
+class StageTiming:
+    """Start and end of one stage, in seconds since the run started."""
+
+    name: str
+    start: float
+    end: Optional[float] = None
+    depends_on: Optional[str] = None  # Stage that must produce input first
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else self.start) - self.start
+
+
+class StageTimer:
+    """Record when each stage of a run starts and ends.
+
+    Stages may overlap. The critical path is the chain of stages ending with
+    the stage that finished last, following ``depends_on`` back to the start;
+    shortening anything off that path does not shorten the run.
+    """
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self.stages: Dict[str, StageTiming] = {}
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def start(self, name: str, depends_on: Optional[str] = None) -> None:
+        """Mark a stage as started; later calls for the same stage are ignored.
+
+        Args:
+            name: Stage name
+            depends_on: Name of the stage this one consumes output from
+        """
+        if name not in self.stages:
+            self.stages[name] = StageTiming(name, self._now(), depends_on=depends_on)
+
+    def stop(self, name: str) -> None:
+        """Mark a started stage as finished.
+
+        Args:
+            name: Stage name
+        """
+        if name in self.stages:
+            self.stages[name].end = self._now()
+
+    @contextlib.contextmanager
+    def stage(self, name: str, depends_on: Optional[str] = None) -> Iterator[None]:
+        """Time the enclosed block as a stage."""
+        self.start(name, depends_on)
+        try:
+            yield
+        finally:
+            self.stop(name)
+
+    @property
+    def wall_time(self) -> float:
+        """Time from the first stage start to the last stage end."""
+        if not self.stages:
+            return 0.0
+        first = min(stage.start for stage in self.stages.values())
+        last = max(stage.start + stage.duration for stage in self.stages.values())
+        return last - first
+
+    def critical_path(self) -> List[StageTiming]:
+        """Get the stages the run's wall time depends on, in order."""
+        if not self.stages:
+            return []
+        stage = max(self.stages.values(), key=lambda s: s.start + s.duration)
+        path = [stage]
+        while stage.depends_on in self.stages and stage.depends_on not in {
+            s.name for s in path
+        }:
+            stage = self.stages[stage.depends_on]
+            path.append(stage)
+        return list(reversed(path))
+
+    def to_dict(self) -> Dict:
+        """Serialize timings for JSON output."""
+        critical = {stage.name for stage in self.critical_path()}
+        return {
+            "wall_time": self.wall_time,
+            "critical_path": [stage.name for stage in self.critical_path()],
+            "stages": [
+                {
+                    "name": stage.name,
+                    "start": stage.start,
+                    "end": stage.end,
+                    "duration": stage.duration,
+                    "critical": stage.name in critical,
+                }
+                for stage in self.stages.values()
+            ],
+        }
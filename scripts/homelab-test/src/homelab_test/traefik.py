@@ -1,10 +1,14 @@
 """Traefik API integration for service discovery."""
 
+import asyncio
 import json
-from typing import Dict, List
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
 import httpx
 from dataclasses import dataclass
 
+from .cache import RevisionCache, get_flake_revision
+
 
 @dataclass
 class TraefikService:
@@ -20,17 +24,32 @@ class TraefikService:
 class TraefikClient:
     """Client for interacting with Traefik API."""
 
-    def __init__(self, api_url: str = "http://100.74.102.74:9090"):
+    def __init__(
+        self,
+        api_url: str = "http://100.74.102.74:9090",
+        repo_path: str = "/home/jeremy/dotfiles",
+        cache: Optional[RevisionCache] = None,
+        refresh: bool = False,
+    ):
         """Initialize Traefik client.
 
         Args:
             api_url: Base URL for Traefik API
+            repo_path: Dotfiles repository root used for nix evaluation
+            cache: Discovery cache, evaluation is never cached if None
+            refresh: Ignore cached discovery results and re-evaluate
         """
         self.api_url = api_url.rstrip("/")
+        self.repo_path = Path(repo_path)
+        self.cache = cache
+        self.refresh = refresh
         self.timeout = 30.0
+        # Services yielded early that the finished evaluation no longer
+        # matches; set by iter_services once evaluation completes
+        self.stale_services: List[TraefikService] = []
 
     async def get_services(
-        self, service_paths: Dict[str, str] = None
+        self, service_paths: Optional[Dict[str, str]] = None
     ) -> List[TraefikService]:
         """Extract all services from Traefik configuration.
 
@@ -40,46 +59,132 @@ class TraefikClient:
         Returns:
             List of TraefikService objects
         """
+        traefik_services = [
+            service async for service in self.iter_services(service_paths)
+        ]
+        traefik_services = [
+            service
+            for service in traefik_services
+            if not any(service is stale for stale in self.stale_services)
+        ]
+        return sorted(traefik_services, key=lambda x: x.name)
+
+    async def iter_services(
+        self, service_paths: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[TraefikService]:
+        """Discover services, yielding each one as soon as it can be probed.
+
+        Nix evaluation and the Traefik API calls run concurrently. The NixOS
+        configuration stays the source of truth: when the API answers before
+        a cold evaluation, only services from the last cached evaluation that
+        the running Traefik still routes are yielded early, with their cached
+        backend URLs. The remaining services follow once evaluation completes.
+
+        An early service that the evaluation removed or gave a new backend is
+        listed in ``stale_services`` afterwards, and a changed one is yielded
+        again with the evaluated backend. Callers drop results of stale
+        services.
+
+        Args:
+            service_paths: Custom probe paths keyed by service name
+
+        Yields:
+            TraefikService objects in discovery order
+        """
+        if service_paths is None:
+            service_paths = {}
+        self.stale_services = []
+
+        nix_task = asyncio.create_task(self._get_nix_services())
+        api_task = asyncio.create_task(self._get_traefik_api())
+
         try:
+            await asyncio.wait(
+                {nix_task, api_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            yielded: Dict[str, TraefikService] = {}
+            known = self.cache.get_latest() if self.cache is not None else None
+            if (
+                not nix_task.done()
+                and api_task.exception() is None
+                and isinstance(known, dict)
+            ):
+                # Probe last known services the live Traefik routes while nix
+                # evaluates
+                routers = api_task.result()
+                for service_name in sorted(known):
+                    if service_name in routers:
+                        service = self._build_service(
+                            service_name, known[service_name], routers, service_paths
+                        )
+                        yielded[service_name] = service
+                        yield service
+
             # Get services from NixOS configuration (similar to bash script)
-            services = await self._get_nix_services()
+            services = await nix_task
 
             # Get router information from Traefik API
-            routers = await self._get_traefik_routers()
-
-            # Combine service and router information
-            traefik_services = []
-            if service_paths is None:
-                service_paths = {}
-
-            for service_name, backend_url in services.items():
-                frontend_domain = self._get_frontend_domain(service_name, routers)
-                routing_type = self._determine_routing_type(backend_url)
-                custom_path = service_paths.get(service_name, "")
-
-                traefik_services.append(
-                    TraefikService(
-                        name=service_name,
-                        backend_url=backend_url,
-                        frontend_domain=frontend_domain,
-                        routing_type=routing_type,
-                        custom_path=custom_path,
-                    )
-                )
+            routers = await api_task
+
+            for service_name, service in yielded.items():
+                if services.get(service_name) != service.backend_url:
+                    self.stale_services.append(service)
 
-            return sorted(traefik_services, key=lambda x: x.name)
+            for service_name in sorted(services):
+                early = yielded.get(service_name)
+                if early is None or early in self.stale_services:
+                    yield self._build_service(
+                        service_name, services[service_name], routers, service_paths
+                    )
 
         except Exception as e:
             raise RuntimeError(f"Failed to discover Traefik services: {e}")
+        finally:
+            nix_task.cancel()
+            api_task.cancel()
+
+    def _build_service(
+        self,
+        service_name: str,
+        backend_url: str,
+        routers: Dict[str, str],
+        service_paths: Dict[str, str],
+    ) -> TraefikService:
+        """Combine service and router information into a TraefikService."""
+        return TraefikService(
+            name=service_name,
+            backend_url=backend_url,
+            frontend_domain=self._get_frontend_domain(service_name, routers),
+            routing_type=self._determine_routing_type(backend_url),
+            custom_path=service_paths.get(service_name, ""),
+        )
 
     async def _get_nix_services(self) -> Dict[str, str]:
-        """Get services from NixOS configuration.
+        """Get services from NixOS configuration, using the cache when valid.
+
+        Evaluation results are cached per flake revision, so repeat runs skip
+        ``nix eval`` entirely unless the lock file or tracked sources changed.
+        """
+        if self.cache is None:
+            return await self._eval_nix_services()
+
+        revision = await get_flake_revision(self.repo_path)
+        if not self.refresh:
+            cached = self.cache.get(revision)
+            if cached is not None:
+                return cached
+
+        services = await self._eval_nix_services()
+        self.cache.set(revision, services)
+        return services
+
+    async def _eval_nix_services(self) -> Dict[str, str]:
+        """Evaluate services from NixOS configuration.
 
         This replicates the bash script's nix eval command:
         nix eval .#nixosConfigurations.bee.config.services.traefik.dynamicConfigOptions.http.services --json
         """
-        import asyncio
-
         try:
             # Run nix eval command to get Traefik services
             cmd = [
@@ -93,7 +198,7 @@ class TraefikClient:
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                cwd="/home/jeremy/dotfiles",  # Must run from repo root
+                cwd=self.repo_path,  # Must run from repo root
             )
 
             stdout, stderr = await asyncio.wait_for(
@@ -152,6 +257,14 @@ class TraefikClient:
         except Exception as e:
             raise RuntimeError(f"Failed to get Traefik routers: {e}")
 
+    async def _get_traefik_api(self) -> Dict[str, str]:
+        """Fetch router rules from the Traefik API.
+
+        Returns:
+            Dictionary mapping service names to their router rules
+        """
+        return await self._get_traefik_routers()
+
     def _get_frontend_domain(self, service_name: str, routers: Dict[str, str]) -> str:
         """Extract frontend domain from router rules.
 
@@ -0,0 +1,184 @@
+"""Long-running watch mode that re-probes on an interval with warm clients."""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from .baseline import BaselineEngine, LatencyRegression
+from .cache import get_flake_revision
+from .infrastructure import InfrastructureTester, InfrastructureTestResult
+from .services import ServiceTester, ServiceTestReporter, ServiceTestResult
+from .system_info import DEFAULT_HOSTS, HostInfo, SystemInfoGatherer
+from .traefik import TraefikClient, TraefikService
+
+
+@dataclass
+class WatchSnapshot:
+    """Results of one watch cycle."""
+
+    cycle: int
+    started_at: datetime
+    duration: float  # Seconds
+    infra_result: InfrastructureTestResult
+    services: List[TraefikService] = field(default_factory=list)
+    service_results: List[ServiceTestResult] = field(default_factory=list)
+    hosts: Dict[str, HostInfo] = field(default_factory=dict)
+    health_score: int = 0
+    rediscovered: bool = False  # Discovery re-ran because the flake changed
+    discovery_error: str = ""
+    regressions: List[LatencyRegression] = field(default_factory=list)
+
+
+class Watcher:
+    """Re-run health checks on an interval, keeping every client warm.
+
+    The pooled HTTP client, the SSH ControlMasters and the discovered service
+    list live for as long as the watcher. Each cycle only fingerprints the
+    flake (two git commands) and re-runs discovery when that changed.
+    """
+
+    def __init__(
+        self,
+        config,
+        traefik_client: TraefikClient,
+        service_tester: ServiceTester,
+        infrastructure_tester: InfrastructureTester,
+        gatherer: Optional[SystemInfoGatherer] = None,
+        interval: float = 30.0,
+        jitter: float = 3.0,
+        baselines: Optional[BaselineEngine] = None,
+    ):
+        """Initialize watcher.
+
+        Args:
+            config: HomelabTestConfig instance
+            traefik_client: Client used for (re-)discovery
+            service_tester: Long-lived service tester
+            infrastructure_tester: Tester for ping, DNS and direct services
+            gatherer: Host stats gatherer, hosts are skipped if None
+            interval: Seconds between cycle starts
+            jitter: Up to this many random seconds added to each wait
+            baselines: Latency baselines updated every cycle, if any
+        """
+        self.config = config
+        self.traefik_client = traefik_client
+        self.service_tester = service_tester
+        self.infrastructure_tester = infrastructure_tester
+        self.gatherer = gatherer
+        self.interval = interval
+        self.jitter = jitter
+        self.baselines = baselines
+        self.latest: Optional[WatchSnapshot] = None
+        self._listeners: List[Callable[[WatchSnapshot], None]] = []
+        self._services: Optional[List[TraefikService]] = None
+        self._revision: Optional[str] = None
+        self._cycle = 0
+        self._stopping: Optional[asyncio.Event] = None
+
+    def add_listener(self, listener: Callable[[WatchSnapshot], None]) -> None:
+        """Call ``listener`` with every completed snapshot."""
+        self._listeners.append(listener)
+
+    def stop(self) -> None:
+        """Finish the current cycle and leave :meth:`run`."""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def run(self, cycles: int = 0) -> None:
+        """Run cycles until stopped.
+
+        Args:
+            cycles: Number of cycles to run, 0 for no limit
+        """
+        self._stopping = asyncio.Event()
+        while not self._stopping.is_set():
+            started = time.perf_counter()
+            await self.run_cycle()
+            if cycles and self._cycle >= cycles:
+                break
+
+            elapsed = time.perf_counter() - started
+            delay = max(0.0, self.interval - elapsed) + random.uniform(0, self.jitter)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run_cycle(self) -> WatchSnapshot:
+        """Probe everything once and publish the snapshot.
+
+        Returns:
+            The new snapshot, also available as :attr:`latest`
+        """
+        self._cycle += 1
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+
+        discovery_error = ""
+        try:
+            rediscovered = await self._refresh_services()
+        except Exception as e:
+            # Keep probing the last known services
+            rediscovered = False
+            discovery_error = str(e)
+        services = self._services or []
+
+        infra_result, service_results, hosts = await asyncio.gather(
+            self.infrastructure_tester.test_all_infrastructure(self.config),
+            self.service_tester.test_services(services),
+            self._gather_hosts(),
+        )
+
+        snapshot = WatchSnapshot(
+            cycle=self._cycle,
+            started_at=started_at,
+            duration=time.perf_counter() - started,
+            infra_result=infra_result,
+            services=services,
+            service_results=service_results,
+            hosts=hosts,
+            health_score=ServiceTestReporter().calculate_health_score(
+                service_results
+            ),
+            rediscovered=rediscovered,
+            discovery_error=discovery_error,
+        )
+        if self.baselines is not None:
+            snapshot.regressions = self.baselines.observe(
+                [("traefik", r) for r in service_results]
+                + [("direct", r) for r in infra_result.direct_service_results]
+            )
+            self.baselines.save()
+        self.latest = snapshot
+        for listener in self._listeners:
+            listener(snapshot)
+        return snapshot
+
+    async def _refresh_services(self) -> bool:
+        """Re-run discovery if the flake changed since the last discovery.
+
+        Returns:
+            True if discovery ran
+        """
+        revision = await get_flake_revision(self.traefik_client.repo_path)
+        if self._services is not None and revision == self._revision:
+            return False
+        self._services = await self.traefik_client.get_services(
+            self.config.traefik_paths
+        )
+        self._revision = revision
+        return True
+
+    async def _gather_hosts(self) -> Dict[str, HostInfo]:
+        if self.gatherer is None:
+            return {}
+        return await self.gatherer.gather_all_info(DEFAULT_HOSTS)
+
+    async def close(self) -> None:
+        """Close pooled HTTP connections and SSH masters."""
+        await self.service_tester.aclose()
+        if self.gatherer is not None:
+            await self.gatherer.close()
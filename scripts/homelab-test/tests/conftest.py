@@ -0,0 +1,6 @@
+"""Make the package importable without installing it, as the dev shell does."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
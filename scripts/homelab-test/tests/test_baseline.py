@@ -0,0 +1,66 @@
+"""Regression flagging of BaselineEngine on simulated latency series."""
+
+import math
+import random
+from dataclasses import dataclass
+
+from homelab_test.baseline import BaselineEngine
+
+
+@dataclass
+class _Result:
+    response_time: float
+    service_name: str = "svc"
+    success: bool = True
+    status_code: int = 200
+
+
+def _noisy(median: float, rng: random.Random) -> float:
+    return median * math.exp(rng.gauss(0, 0.2))
+
+
+def _flags(series):
+    engine = BaselineEngine()
+    return [bool(engine.observe([("traefik", _Result(value))])) for value in series]
+
+
+def _steady(rng, runs=1500, median=0.08):
+    return [_noisy(median, rng) for _ in range(runs)]
+
+
+def test_steady_service_is_never_flagged():
+    rng = random.Random(1)
+    assert not any(_flags(_steady(rng)))
+
+
+def test_step_regression_stays_flagged():
+    rng = random.Random(2)
+    series = _steady(rng) + [_noisy(2.0, rng) for _ in range(3000)]
+    flags = _flags(series)
+    assert all(flags[1505:])
+
+
+def test_slow_drift_stays_flagged():
+    rng = random.Random(3)
+    drift = [_noisy(0.08 + (2.0 - 0.08) * i / 3000, rng) for i in range(3000)]
+    flags = _flags(_steady(rng) + drift)[1500:]
+    # Flagged well before the service reaches 2s, and from the second half
+    # of the drift on, never cleared again
+    assert flags.index(True) < 300
+    assert all(flags[1500:])
+
+
+def test_recovered_service_is_cleared():
+    rng = random.Random(4)
+    series = _steady(rng) + [_noisy(2.0, rng) for _ in range(100)]
+    series += [_noisy(0.08, rng) for _ in range(300)]
+    flags = _flags(series)
+    assert any(flags[1500:1600])
+    assert not any(flags[-290:])
+
+
+def test_failed_probes_are_ignored():
+    engine = BaselineEngine()
+    failed = _Result(response_time=30.0, success=False)
+    assert engine.observe([("traefik", failed)]) == []
+    assert engine.baselines == {}
@@ -0,0 +1,88 @@
+"""ServiceBenchmark against a local keep-alive HTTP server."""
+
+import asyncio
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from homelab_test.benchmark import ServiceBenchmark
+from homelab_test.services import ServiceTester, ServiceTestResult
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status = 500 if self.path == "/error" else 200
+        body = b"x" * 1024
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _benchmark(requests=5, **tester_args):
+    return ServiceBenchmark(ServiceTester(timeout=5.0, **tester_args), requests=requests)
+
+
+def test_warm_requests_reuse_one_connection(server_url):
+    result = asyncio.run(_benchmark().benchmark_url("app", server_url + "/"))
+    assert result.error_message == ""
+    assert result.requests == 5
+    assert result.failures == 0
+    assert result.reconnects == 0
+    assert result.http_version == "HTTP/1.1"
+    assert result.dns_time is not None and result.connect_time > 0
+    assert result.min <= result.p50 <= result.p95 <= result.p99 <= result.max
+    assert len(result.samples) == 5
+    assert result.to_dict()["name"] == "app"
+
+
+def test_error_statuses_count_as_failures(server_url):
+    result = asyncio.run(_benchmark(requests=3).benchmark_url("app", server_url + "/error"))
+    assert result.failures == 3
+
+
+def test_probe_strategy_selects_method(server_url):
+    bench = _benchmark(probe_strategies={"app": "head"})
+    result = asyncio.run(bench.benchmark_url("app", server_url + "/"))
+    assert result.method == "HEAD"
+    assert result.failures == 0
+
+
+def test_connection_refused_is_reported():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    result = asyncio.run(_benchmark().benchmark_url("app", f"http://127.0.0.1:{port}/"))
+    assert result.error_message
+    assert result.requests == 0
+
+
+def test_run_skips_failed_services(server_url):
+    results = [
+        ServiceTestResult(service_name="up", url=server_url + "/", routing_type="Direct", success=True),
+        ServiceTestResult(service_name="down", url=server_url + "/", routing_type="Direct", success=False),
+    ]
+    benchmarks = asyncio.run(_benchmark(requests=1).run(results))
+    assert [b.service_name for b in benchmarks] == ["up"]
@@ -0,0 +1,29 @@
+"""Revision-keyed cache files."""
+
+import pytest
+
+from homelab_test.cache import RevisionCache
+
+
+def test_value_only_valid_for_its_revision(tmp_path):
+    cache = RevisionCache(tmp_path / "sub" / "cache.json")
+    assert cache.get("r1") is None
+    cache.set("r1", {"app": "http://10.0.0.1"})
+    assert cache.get("r1") == {"app": "http://10.0.0.1"}
+    assert cache.get("r2") is None
+    assert cache.get(None) is None
+    assert cache.get_latest() == {"app": "http://10.0.0.1"}
+
+
+def test_unknown_revision_is_not_stored(tmp_path):
+    cache = RevisionCache(tmp_path / "cache.json")
+    cache.set(None, {"app": "x"})
+    assert not cache.path.exists()
+
+
+@pytest.mark.parametrize("content", ["", "{trunc", "[1, 2]", "null", '"text"'])
+def test_corrupt_file_is_a_miss(tmp_path, content):
+    cache = RevisionCache(tmp_path / "cache.json")
+    cache.path.write_text(content)
+    assert cache.get("r1") is None
+    assert cache.get_latest() is None
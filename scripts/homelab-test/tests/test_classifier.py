@@ -0,0 +1,56 @@
+"""Priority and case handling of ErrorClassifier."""
+
+from homelab_test.classifier import ErrorClassifier
+from homelab_test.config import ErrorPatternConfig
+
+
+def _pattern(category, *literals, case_sensitive=False):
+    return ErrorPatternConfig(
+        category=category,
+        description=category,
+        patterns=list(literals),
+        case_sensitive=case_sensitive,
+    )
+
+
+def test_overlapping_lower_priority_match_does_not_hide_higher():
+    # "xab" starts first and overlaps "abc"; "abc" still has priority
+    classifier = ErrorClassifier([_pattern("high", "abc"), _pattern("low", "xab")])
+    assert classifier.classify("xabc").category == "high"
+
+
+def test_prefix_literal_of_lower_priority_category():
+    classifier = ErrorClassifier(
+        [_pattern("gateway", "bad gateway"), _pattern("bad", "bad")]
+    )
+    assert classifier.classify("BAD GATEWAY").category == "gateway"
+    assert classifier.classify("bad request").category == "bad"
+
+
+def test_case_sensitive_patterns_match_original_text_only():
+    classifier = ErrorClassifier(
+        [_pattern("exact", "HTTPS port", case_sensitive=True), _pattern("any", "port")]
+    )
+    assert classifier.classify("sent to HTTPS port").category == "exact"
+    assert classifier.classify("sent to https port").category == "any"
+
+
+def test_default_priorities():
+    classifier = ErrorClassifier()
+    body = "The plain HTTP request was sent to HTTPS port (404 Not Found)"
+    assert classifier.classify(body).category == ErrorClassifier().patterns[0].category
+    assert classifier.classify("502 Bad Gateway, timeout").description.startswith("Bad Gateway")
+
+
+def test_fallbacks():
+    classifier = ErrorClassifier()
+    assert classifier.classify(" 418 ").category == "raw_status"
+    assert classifier.classify("").category == "empty"
+    unrecognized = classifier.classify("something\nelse")
+    assert unrecognized.category == "unrecognized"
+    assert unrecognized.detail.startswith("(Error: something")
+
+
+def test_only_the_prefix_is_scanned():
+    classifier = ErrorClassifier(max_chars=10)
+    assert classifier.classify("x" * 20 + "bad gateway").category == "unrecognized"
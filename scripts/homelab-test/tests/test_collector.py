@@ -0,0 +1,86 @@
+"""Host stats collector script and its output parser."""
+
+import json
+import shutil
+import subprocess
+from datetime import datetime, timezone
+
+import pytest
+
+from homelab_test.collector import (
+    COLLECTOR_SCRIPT,
+    format_uptime,
+    parse_collector_output,
+)
+
+
+@pytest.mark.parametrize(
+    "seconds, expected",
+    [(59, "0 min"), (600, "10 min"), (3660, "1:01"), (86400, "1 day"), (3 * 86400 + 5, "3 days")],
+)
+def test_format_uptime(seconds, expected):
+    assert format_uptime(seconds) == expected
+
+
+def test_parse_full_document():
+    document = {
+        "uptime_seconds": 7200.5,
+        "load": [0.5, 0.25, 0.1],
+        "mem_total_kb": 1000,
+        "mem_available_kb": 255,
+        "disk_used_percent": 42,
+        "kernel": "6.6.1",
+        "nixos_version": "24.05",
+        "generation_time": 0,
+        "dns_ok": True,
+        "internet_ok": False,
+        "tailscale_state": "Running",
+        "tailscale_ip": "100.64.0.1",
+        "package_count": 1234,
+        "system_size_kb": 2048,
+    }
+    fields = parse_collector_output(json.dumps(document))
+    assert fields == {
+        "uptime": "2:00",
+        "load_average": (0.5, 0.25, 0.1),
+        "memory_used_percent": 74.0,
+        "disk_used_percent": 42.0,
+        "kernel_version": "6.6.1",
+        "nixos_version": "24.05",
+        "system_generation_time": datetime(1970, 1, 1, tzinfo=timezone.utc),
+        "dns_working": True,
+        "internet_working": False,
+        "tailscale_status": "Running",
+        "tailscale_ip": "100.64.0.1",
+        "package_count": 1234,
+        "system_size_mb": 2.0,
+    }
+
+
+def test_parse_skips_missing_values():
+    fields = parse_collector_output(
+        '{"uptime_seconds":null,"load":[null,null,null],"mem_total_kb":0,'
+        '"mem_available_kb":null,"kernel":null,"dns_ok":false}'
+    )
+    assert fields == {"dns_working": False, "internet_working": False}
+
+
+@pytest.mark.parametrize("output", ["", "not json", "[1, 2]", "null"])
+def test_parse_rejects_non_documents(output):
+    assert parse_collector_output(output) is None
+
+
+@pytest.mark.skipif(shutil.which("sh") is None, reason="needs a POSIX shell")
+def test_script_emits_parseable_json():
+    proc = subprocess.run(
+        ["sh", "-s", "--"],
+        input=COLLECTOR_SCRIPT,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert proc.returncode == 0
+    fields = parse_collector_output(proc.stdout)
+    assert fields is not None
+    assert "uptime" in fields
+    assert "package_count" not in fields  # only collected in full mode
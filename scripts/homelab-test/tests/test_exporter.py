@@ -0,0 +1,63 @@
+"""Rendering of watch cycles by MetricsExporter."""
+
+from datetime import datetime
+
+from homelab_test.exporter import MetricsExporter
+from homelab_test.infrastructure import InfrastructureTestResult
+from homelab_test.services import ServiceTestResult
+from homelab_test.watch import WatchSnapshot
+
+
+def _snapshot(*results):
+    return WatchSnapshot(
+        cycle=1,
+        started_at=datetime(2026, 1, 1),
+        duration=1.0,
+        service_results=list(results),
+        infra_result=InfrastructureTestResult(),
+        hosts={},
+        health_score=100,
+    )
+
+
+def _result(name, status_code=200, response_time=0.05):
+    return ServiceTestResult(
+        service_name=name,
+        url=f"https://{name}.example",
+        routing_type="Direct",
+        status_code=status_code,
+        response_time=response_time,
+        success=status_code == 200,
+    )
+
+
+def _payload(exporter):
+    return exporter._payload.decode()
+
+
+def test_latency_histogram_is_cumulative():
+    exporter = MetricsExporter()
+    exporter.update(_snapshot(_result("grist", response_time=0.02)))
+    exporter.update(_snapshot(_result("grist", response_time=0.3)))
+    payload = _payload(exporter)
+    assert 'homelab_probe_duration_seconds_bucket{kind="traefik",service="grist",routing_type="Direct",le="0.025"} 1' in payload
+    assert 'homelab_probe_duration_seconds_bucket{kind="traefik",service="grist",routing_type="Direct",le="+Inf"} 2' in payload
+    assert 'homelab_probe_duration_seconds_count{kind="traefik",service="grist",routing_type="Direct"} 2' in payload
+
+
+def test_removed_services_are_no_longer_exported():
+    exporter = MetricsExporter()
+    exporter.update(_snapshot(_result("grist"), _result("old")))
+    exporter.update(_snapshot(_result("grist")))
+    payload = _payload(exporter)
+    assert 'service="old"' not in payload
+    assert 'service="grist"' in payload
+
+
+def test_unanswered_probe_keeps_its_histogram():
+    exporter = MetricsExporter()
+    exporter.update(_snapshot(_result("grist")))
+    exporter.update(_snapshot(_result("grist", status_code=None)))
+    payload = _payload(exporter)
+    assert 'homelab_probe_duration_seconds_count{kind="traefik",service="grist",routing_type="Direct"} 1' in payload
+    assert 'homelab_probe_up{kind="traefik",service="grist",routing_type="Direct"} 0' in payload
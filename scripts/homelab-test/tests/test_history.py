@@ -0,0 +1,60 @@
+"""Time windows and summaries of HistoryStore."""
+
+import pytest
+
+from homelab_test.history import HistoryStore, parse_window, percentile
+from homelab_test.infrastructure import InfrastructureTestResult
+from homelab_test.services import ServiceTestResult
+
+
+@pytest.mark.parametrize(
+    "window, seconds", [("90s", 90), ("30m", 1800), ("24h", 86400), ("1.5d", 129600), ("2w", 1209600)]
+)
+def test_parse_window(window, seconds):
+    assert parse_window(window) == seconds
+
+
+@pytest.mark.parametrize("window", ["", "24", "h", "-1h", "0d", "nanh", "infh", "-infd", "5y"])
+def test_parse_window_rejects_invalid(window):
+    with pytest.raises(ValueError):
+        parse_window(window)
+
+
+def test_percentile_nearest_rank():
+    values = [0.1, 0.2, 0.3, 0.4]
+    assert percentile(values, 0.5) == 0.2
+    assert percentile(values, 0.95) == 0.4
+    assert percentile([], 0.5) is None
+
+
+def _result(name, success=True, response_time=0.1):
+    return ServiceTestResult(
+        service_name=name,
+        url="",
+        routing_type="Direct",
+        status_code=200 if success else 502,
+        response_time=response_time,
+        success=success,
+    )
+
+
+def test_traefik_and_direct_services_with_one_name_stay_apart(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite")
+    infra = InfrastructureTestResult(direct_service_results=[_result("grist", success=False)])
+    store.record_run("full", [_result("grist")], infra, timestamp=1000)
+    store.record_run("full", [_result("grist")], infra, timestamp=2000)
+
+    summaries = store.summarize(0, "service")
+    assert [(s.name, s.source) for s in summaries] == [("grist", "direct"), ("grist", "traefik")]
+    assert [s.availability for s in summaries] == [0.0, 100.0]
+    assert all(s.samples == 2 for s in summaries)
+    assert store.run_count(1500) == 1
+    store.close()
+
+
+def test_retention_prunes_old_rows(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite", retention_days=1)
+    store.record_run("full", [_result("old")], timestamp=0)
+    store.record_run("full", [_result("new")], timestamp=3 * 86400)
+    assert [s.name for s in store.summarize(0, "service")] == ["new"]
+    store.close()
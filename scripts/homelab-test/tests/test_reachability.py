@@ -0,0 +1,77 @@
+"""TCP fallback and refused-connection handling of ReachabilityEngine."""
+
+import asyncio
+import socket
+
+import pytest
+
+from homelab_test.reachability import ReachabilityEngine, ReachabilityResult
+
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def listening_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        yield sock.getsockname()[1]
+
+
+def _engine(**kwargs):
+    return ReachabilityEngine(count=2, interval=0, timeout=1.0, **kwargs)
+
+
+class _SilentIcmpEngine(ReachabilityEngine):
+    """Engine whose echo requests all go unanswered."""
+
+    async def _probe_icmp(self, result: ReachabilityResult) -> None:
+        self._icmp_available = True
+        result.sent = self.count
+        result.error_message = "Timeout"
+
+
+def test_tcp_probe_of_listening_port(listening_port):
+    result = asyncio.run(_engine().probe("127.0.0.1", tcp_port=listening_port, icmp=False))
+    assert result.method == "tcp"
+    assert result.reachable
+    assert result.sent == 2 and result.packet_loss == 0
+    assert result.error_message == ""
+
+
+def test_refused_connection_is_down_by_default():
+    result = asyncio.run(_engine().probe("127.0.0.1", tcp_port=_closed_port(), icmp=False))
+    assert result.method == "tcp"
+    assert not result.reachable
+    assert result.packet_loss == 100
+    assert result.error_message == "Timeout"
+
+
+def test_refused_connection_is_up_when_enabled():
+    engine = _engine(tcp_refused_is_up=True)
+    result = asyncio.run(engine.probe("127.0.0.1", tcp_port=_closed_port(), icmp=False))
+    assert result.reachable
+
+
+def test_unanswered_icmp_falls_back_to_configured_port(listening_port):
+    engine = _SilentIcmpEngine(count=2, interval=0, timeout=1.0)
+    result = asyncio.run(engine.probe("127.0.0.1", tcp_port=listening_port))
+    assert result.method == "tcp"
+    assert result.reachable
+
+
+def test_unanswered_icmp_without_port_reports_icmp_failure():
+    engine = _SilentIcmpEngine(count=2, interval=0, timeout=1.0)
+    result = asyncio.run(engine.probe("127.0.0.1"))
+    assert result.method == "icmp"
+    assert not result.reachable
+
+
+def test_unresolvable_target():
+    result = asyncio.run(_engine().probe("does-not-exist.invalid", icmp=False))
+    assert result.error_message == "DNS lookup failed"
+    assert not result.reachable
@@ -0,0 +1,189 @@
+"""RFC 1035 encoding and decoding, and reply matching of DNSResolver."""
+
+import asyncio
+import socket
+import struct
+
+import pytest
+
+from homelab_test.resolver import (
+    DNSError,
+    DNSResolver,
+    _read_name,
+    decode_response,
+    encode_query,
+)
+
+
+def _name(name: str) -> bytes:
+    return b"".join(bytes([len(p)]) + p.encode() for p in name.split(".")) + b"\0"
+
+
+def _reply(query: bytes, answers, flags: int = 0x8180) -> bytes:
+    """Build a reply echoing ``query``'s question, answers as (rtype, rdata)."""
+    txid = struct.unpack_from("!H", query)[0]
+    header = struct.pack("!HHHHHH", txid, flags, 1, len(answers), 0, 0)
+    # Every answer names the question by a pointer to offset 12
+    body = b"".join(
+        b"\xc0\x0c" + struct.pack("!HHIH", rtype, 1, 300, len(rdata)) + rdata
+        for rtype, rdata in answers
+    )
+    return header + query[12:] + body
+
+
+def test_encode_query_layout():
+    packet = encode_query(0x1234, "www.example.com.", "AAAA")
+    txid, flags, qdcount, ancount, nscount, arcount = struct.unpack_from("!HHHHHH", packet)
+    assert (txid, flags, qdcount, ancount, nscount, arcount) == (0x1234, 0x0100, 1, 0, 0, 0)
+    assert packet[12:] == _name("www.example.com") + struct.pack("!HH", 28, 1)
+
+
+def test_decode_a_and_cname_with_compression():
+    query = encode_query(7, "www.example.com", "A")
+    # CNAME target "cdn" + pointer to "example.com" inside the question
+    cname = b"\x03cdn\xc0\x10"
+    reply = _reply(query, [(5, cname), (1, socket.inet_aton("192.0.2.1"))])
+    txid, truncated, response = decode_response(reply)
+    assert txid == 7 and not truncated
+    assert response.rcode == "NOERROR"
+    assert [r.name for r in response.records] == ["www.example.com"] * 2
+    assert response.answers("CNAME") == ["cdn.example.com"]
+    assert response.answers("A") == ["192.0.2.1"]
+    assert response.records[0].ttl == 300
+
+
+def test_decode_mx_srv_txt_aaaa():
+    query = encode_query(1, "example.com", "MX")
+    answers = [
+        (15, struct.pack("!H", 10) + b"\x04mail\xc0\x0c"),
+        (33, struct.pack("!HHH", 1, 5, 5060) + b"\x03sip\xc0\x0c"),
+        (16, b"\x05hello\x05world"),
+        (28, socket.inet_pton(socket.AF_INET6, "2001:db8::1")),
+    ]
+    _, _, response = decode_response(_reply(query, answers))
+    assert response.answers("MX") == ["10 mail.example.com"]
+    assert response.answers("SRV") == ["1 5 5060 sip.example.com"]
+    assert response.answers("TXT") == ['"hello" "world"']
+    assert response.answers("AAAA") == ["2001:db8::1"]
+
+
+def test_decode_rcode_and_truncation():
+    query = encode_query(9, "missing.example", "A")
+    _, truncated, response = decode_response(_reply(query, [], flags=0x8383))
+    assert response.rcode == "NXDOMAIN"
+    _, truncated, _ = decode_response(_reply(query, [], flags=0x8380))
+    assert truncated
+
+
+def test_read_name_returns_offset_after_pointer():
+    message = b"\0" * 12 + _name("example.com") + b"\x03www\xc0\x0c"
+    name, offset = _read_name(message, 25)
+    assert name == "www.example.com"
+    assert offset == len(message)
+
+
+def test_compression_loop_is_rejected():
+    message = b"\0" * 12 + b"\xc0\x0c"
+    with pytest.raises(DNSError):
+        _read_name(message, 12)
+
+
+def test_short_reply_is_rejected():
+    with pytest.raises(DNSError):
+        decode_response(b"\0" * 5)
+
+
+class _FakeServer(asyncio.DatagramProtocol):
+    """Answer A queries with 192.0.2.1, optionally dropping the first ones."""
+
+    def __init__(self, drop: int = 0):
+        self.drop = drop
+        self.received = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.received += 1
+        if self.received <= self.drop:
+            return
+        self.transport.sendto(_reply(data, [(1, socket.inet_aton("192.0.2.1"))]), addr)
+
+
+async def _serve(host: str, drop: int = 0):
+    loop = asyncio.get_running_loop()
+    transport, server = await loop.create_datagram_endpoint(
+        lambda: _FakeServer(drop), local_addr=(host, 0)
+    )
+    return transport, server, transport.get_extra_info("sockname")[1]
+
+
+def _lookup_family(host: str) -> str:
+    return socket.getaddrinfo(host, 53, type=socket.SOCK_DGRAM)[0][4][0]
+
+
+def test_nameserver_given_as_hostname():
+    async def run():
+        transport, _, port = await _serve(_lookup_family("localhost"))
+        try:
+            async with DNSResolver(timeout=2, nameserver="localhost", port=port) as resolver:
+                response = await resolver.query("example.com")
+        finally:
+            transport.close()
+        return response
+
+    assert asyncio.run(run()).answers("A") == ["192.0.2.1"]
+
+
+def test_non_canonical_ipv6_nameserver():
+    if not socket.has_ipv6:
+        pytest.skip("No IPv6")
+
+    async def run():
+        try:
+            transport, _, port = await _serve("::1")
+        except OSError:
+            pytest.skip("No IPv6 loopback")
+        try:
+            async with DNSResolver(timeout=2, port=port) as resolver:
+                response = await resolver.query(
+                    "example.com", nameserver="0:0:0:0:0:0:0:1"
+                )
+        finally:
+            transport.close()
+        return response
+
+    assert asyncio.run(run()).answers("A") == ["192.0.2.1"]
+
+
+def test_lost_udp_query_is_retransmitted():
+    async def run():
+        transport, server, port = await _serve("127.0.0.1", drop=1)
+        try:
+            async with DNSResolver(
+                timeout=1.5, nameserver="127.0.0.1", retries=2, port=port
+            ) as resolver:
+                response = await resolver.query("example.com")
+        finally:
+            transport.close()
+        return response, server.received
+
+    response, received = asyncio.run(run())
+    assert response.answers("A") == ["192.0.2.1"]
+    assert received == 2
+
+
+def test_unanswered_query_times_out():
+    async def run():
+        transport, server, port = await _serve("127.0.0.1", drop=100)
+        try:
+            async with DNSResolver(
+                timeout=0.3, nameserver="127.0.0.1", retries=2, port=port
+            ) as resolver:
+                with pytest.raises(DNSError, match="Timeout"):
+                    await resolver.query("example.com")
+        finally:
+            transport.close()
+        return server.received
+
+    assert asyncio.run(run()) == 3
@@ -0,0 +1,96 @@
+"""Concurrency limits and result streaming of ProbeScheduler."""
+
+import asyncio
+
+import pytest
+
+from homelab_test.scheduler import ProbeScheduler
+
+
+def _tracking_probe(in_flight, peaks, delay=0.01):
+    async def probe(item):
+        group, _ = item
+        in_flight[group] = in_flight.get(group, 0) + 1
+        in_flight["all"] = in_flight.get("all", 0) + 1
+        peaks[group] = max(peaks.get(group, 0), in_flight[group])
+        peaks["all"] = max(peaks.get("all", 0), in_flight["all"])
+        await asyncio.sleep(delay)
+        in_flight[group] -= 1
+        in_flight["all"] -= 1
+        return item
+
+    return probe
+
+
+def test_global_and_group_limits_hold():
+    in_flight, peaks = {}, {}
+    items = [("bee", i) for i in range(10)] + [("tower", i) for i in range(10)]
+    scheduler = ProbeScheduler(max_concurrent=4, group_limits={"bee": 1})
+
+    async def run():
+        return [
+            r
+            async for r in scheduler.stream(
+                items, _tracking_probe(in_flight, peaks), group=lambda i: i[0]
+            )
+        ]
+
+    results = asyncio.run(run())
+    assert sorted(results) == sorted(items)
+    assert peaks["bee"] == 1
+    assert peaks["all"] == 4
+
+
+def test_saturated_group_does_not_hold_global_slots():
+    # With bee capped at 1, the other three global slots stay free for tower
+    in_flight, peaks = {}, {}
+    items = [("bee", i) for i in range(6)] + [("tower", i) for i in range(6)]
+    scheduler = ProbeScheduler(max_concurrent=4, group_limits={"bee": 1})
+
+    async def run():
+        return [
+            r
+            async for r in scheduler.stream(
+                items, _tracking_probe(in_flight, peaks), group=lambda i: i[0]
+            )
+        ]
+
+    asyncio.run(run())
+    assert peaks["tower"] == 3
+
+
+def test_stream_yields_in_completion_order():
+    async def probe(delay):
+        await asyncio.sleep(delay)
+        return delay
+
+    async def run():
+        scheduler = ProbeScheduler(max_concurrent=3)
+        return [r async for r in scheduler.stream([0.03, 0.01, 0.02], probe, group=str)]
+
+    assert asyncio.run(run()) == [0.01, 0.02, 0.03]
+
+
+def test_async_producer_overlaps_probing_and_reraises():
+    probed = []
+
+    async def produce():
+        yield "a"
+        await asyncio.sleep(0.02)
+        # "a" was probed while the producer was still running
+        assert probed == ["a"]
+        yield "b"
+        raise RuntimeError("discovery failed")
+
+    async def probe(item):
+        probed.append(item)
+        return item
+
+    async def run():
+        results = []
+        with pytest.raises(RuntimeError, match="discovery failed"):
+            async for r in ProbeScheduler().stream(produce(), probe, group=str):
+                results.append(r)
+        return results
+
+    assert asyncio.run(run()) == ["a", "b"]
@@ -0,0 +1,65 @@
+"""Stage timings and the critical path of StageTimer."""
+
+from homelab_test.timing import StageTimer
+
+
+def _timer(stages):
+    """Build a timer from (name, start, end, depends_on) tuples."""
+    timer = StageTimer()
+    for name, start, end, depends_on in stages:
+        timer.start(name, depends_on)
+        timer.stages[name].start = start
+        timer.stages[name].end = end
+    return timer
+
+
+def test_critical_path_follows_dependencies_of_last_stage():
+    timer = _timer(
+        [
+            ("discovery", 0.0, 2.0, None),
+            ("infrastructure", 0.0, 1.5, None),
+            ("services", 0.5, 3.0, "discovery"),
+        ]
+    )
+    assert [s.name for s in timer.critical_path()] == ["discovery", "services"]
+    assert timer.wall_time == 3.0
+
+    data = timer.to_dict()
+    assert data["critical_path"] == ["discovery", "services"]
+    critical = {s["name"]: s["critical"] for s in data["stages"]}
+    assert critical == {"discovery": True, "infrastructure": False, "services": True}
+
+
+def test_overlapping_independent_stage_can_be_critical():
+    timer = _timer(
+        [
+            ("discovery", 0.0, 1.0, None),
+            ("services", 0.2, 2.0, "discovery"),
+            ("infrastructure", 0.0, 4.0, None),
+        ]
+    )
+    assert [s.name for s in timer.critical_path()] == ["infrastructure"]
+
+
+def test_unfinished_and_repeated_stages():
+    timer = StageTimer()
+    timer.start("a")
+    first_start = timer.stages["a"].start
+    timer.start("a")
+    assert timer.stages["a"].start == first_start
+    assert timer.stages["a"].duration == 0.0
+    timer.stop("missing")  # Stopping an unknown stage is ignored
+    with timer.stage("b", depends_on="a"):
+        pass
+    assert timer.stages["b"].end is not None
+
+
+def test_dependency_cycle_terminates():
+    timer = _timer([("a", 0.0, 1.0, "b"), ("b", 0.0, 2.0, "a")])
+    assert [s.name for s in timer.critical_path()] == ["a", "b"]
+
+
+def test_empty_timer():
+    timer = StageTimer()
+    assert timer.wall_time == 0.0
+    assert timer.critical_path() == []
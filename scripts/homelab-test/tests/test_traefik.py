@@ -0,0 +1,94 @@
+"""Early yields and stale services of TraefikClient.iter_services."""
+
+import asyncio
+
+from homelab_test.cache import RevisionCache
+from homelab_test.traefik import TraefikClient
+
+ROUTERS = {
+    "app": "Host(`app.example.com`)",
+    "moved": "Host(`moved.example.com`)",
+    "removed": "Host(`removed.example.com`)",
+    "new": "Host(`new.example.com`)",
+}
+
+
+class _StubClient(TraefikClient):
+    """TraefikClient with canned nix and API answers and set delays."""
+
+    def __init__(self, cache, nix_services, nix_delay, api_delay):
+        super().__init__(api_url="http://traefik.invalid", cache=cache)
+        self.nix_services = nix_services
+        self.nix_delay = nix_delay
+        self.api_delay = api_delay
+
+    async def _get_nix_services(self):
+        await asyncio.sleep(self.nix_delay)
+        return self.nix_services
+
+    async def _get_traefik_api(self):
+        await asyncio.sleep(self.api_delay)
+        return ROUTERS
+
+
+def _cache(tmp_path):
+    cache = RevisionCache(tmp_path / "services.json")
+    cache.set(
+        "old-revision",
+        {
+            "app": "http://10.0.0.1:80",
+            "moved": "http://10.0.0.2:80",
+            "removed": "http://10.0.0.3:80",
+            "unrouted": "http://10.0.0.4:80",
+        },
+    )
+    return cache
+
+
+NIX_SERVICES = {
+    "app": "http://10.0.0.1:80",
+    "moved": "http://10.0.0.9:80",
+    "new": "http://10.0.0.5:80",
+}
+
+
+async def _collect(client):
+    return [(s.name, s.backend_url) async for s in client.iter_services()]
+
+
+def test_cached_services_yielded_early_and_stale_ones_replaced(tmp_path):
+    client = _StubClient(_cache(tmp_path), NIX_SERVICES, nix_delay=0.05, api_delay=0)
+    yielded = asyncio.run(_collect(client))
+
+    assert yielded == [
+        # Early: last known services the live Traefik routes
+        ("app", "http://10.0.0.1:80"),
+        ("moved", "http://10.0.0.2:80"),
+        ("removed", "http://10.0.0.3:80"),
+        # After evaluation: changed and new services only
+        ("moved", "http://10.0.0.9:80"),
+        ("new", "http://10.0.0.5:80"),
+    ]
+    assert [(s.name, s.backend_url) for s in client.stale_services] == [
+        ("moved", "http://10.0.0.2:80"),
+        ("removed", "http://10.0.0.3:80"),
+    ]
+    assert client.stale_services[0].frontend_domain == "https://moved.example.com"
+
+
+def test_get_services_drops_stale_services(tmp_path):
+    client = _StubClient(_cache(tmp_path), NIX_SERVICES, nix_delay=0.05, api_delay=0)
+    services = asyncio.run(client.get_services({"app": "/health"}))
+    assert [(s.name, s.backend_url) for s in services] == sorted(NIX_SERVICES.items())
+    assert services[0].custom_path == "/health"
+
+
+def test_no_early_yield_when_evaluation_wins(tmp_path):
+    client = _StubClient(_cache(tmp_path), NIX_SERVICES, nix_delay=0, api_delay=0.05)
+    assert asyncio.run(_collect(client)) == sorted(NIX_SERVICES.items())
+    assert client.stale_services == []
+
+
+def test_no_early_yield_without_cache():
+    client = _StubClient(None, NIX_SERVICES, nix_delay=0.05, api_delay=0)
+    assert asyncio.run(_collect(client)) == sorted(NIX_SERVICES.items())